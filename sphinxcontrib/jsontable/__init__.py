@@ -7,17 +7,101 @@ from external files or inline content as HTML tables in Sphinx documentation.
 
 from __future__ import annotations
 
+import logging
+import sys
 from typing import TYPE_CHECKING, Any
 
+from sphinx.util import logging as sphinx_logging
+
 from .directives import DEFAULT_MAX_ROWS, JsonTableDirective
+from .directives.build_trace import (
+    collect_trace_events,
+    merge_trace_events,
+    start_trace,
+    stash_trace_events,
+    write_trace_file,
+)
+from .directives.parallel_conversion import shutdown_conversion_pool
+from .directives.preload import preload_shared_sheets, release_preloaded_sheets
+from .directives.processor_pool import release_processors
+from .directives.read_order import (
+    balance_parallel_read,
+    merge_read_times,
+    purge_read_time,
+    record_read_time,
+    start_read_timer,
+)
+from .directives.table_builder import (
+    cell_paragraph,
+    literal_cell_paragraph,
+    search_exclusion_supported,
+    search_exclusion_warning,
+)
 
 if TYPE_CHECKING:
     from sphinx.application import Sphinx
+    from sphinx.config import Config
 
 __version__ = "0.4.0"
 __author__ = "sasakama-code"
 __email__ = "sasakamacode@gmail.com"
 
+logger = sphinx_logging.getLogger(__name__)
+
+
+def _report_cache_stats(app: Sphinx, exception: Exception | None) -> None:
+    """Log the counters of the data caches used (``build-finished``)."""
+    module = sys.modules.get("sphinxcontrib.jsontable.core.data_cache")
+    if module is None:
+        return
+    for name, stats in sorted(module.cache_statistics().items()):
+        if stats.lookups:
+            logger.info(
+                f"jsontable cache '{name}': {stats.hits} hits, "
+                f"{stats.misses} misses ({stats.hit_rate:.0%} hit rate), "
+                f"{stats.evictions} evictions, {stats.expirations} expired, "
+                f"{stats.entries} entries, ~{stats.bytes // 1024} KiB"
+            )
+
+
+def _close_workbooks(app: Sphinx, exception: Exception | None) -> None:
+    """Release workbooks kept open for Excel reads (``build-finished``).
+
+    File fingerprints are memoized for one build only and forgotten as well.
+    """
+    # Only touch the Excel stack if a directive actually loaded it
+    module = sys.modules.get("sphinxcontrib.jsontable.core.workbook_handle")
+    if module is not None:
+        module.clear_workbook_cache()
+    module = sys.modules.get("sphinxcontrib.jsontable.core.workbook_package")
+    if module is not None:
+        module.clear_package_cache()
+    module = sys.modules.get("sphinxcontrib.jsontable.core.file_fingerprint")
+    if module is not None:
+        module.clear_fingerprints()
+
+
+def _check_searchable(app: Sphinx, config: Config) -> None:
+    """Warn when Sphinx ignores ``jsontable_searchable`` (``config-inited``)."""
+    if getattr(config, "jsontable_searchable", "all") == "all":
+        return
+    if not search_exclusion_supported():
+        logger.warning(search_exclusion_warning("jsontable_searchable"))
+
+
+def _match_log_level(app: Sphinx) -> None:
+    """Let the extension's loggers drop records Sphinx would not show.
+
+    Sphinx filters by verbosity in its handlers only, so without a level every
+    debug message on the per-directive path still builds a log record.
+    """
+    verbosity = getattr(app, "verbosity", None)
+    if not isinstance(verbosity, int):
+        return
+    logging.getLogger(f"{sphinx_logging.NAMESPACE}.{__name__}").setLevel(
+        sphinx_logging.VERBOSITY_MAP[verbosity]
+    )
+
 
 def setup(app: Sphinx) -> dict[str, Any]:
     """
@@ -29,8 +113,13 @@ def setup(app: Sphinx) -> dict[str, Any]:
     Returns:
         Extension metadata
     """
+    _match_log_level(app)
+
     # Register the jsontable directive
     app.add_directive("jsontable", JsonTableDirective)
+    # Cell paragraphs render as paragraphs; registered for generic visitors
+    app.add_node(cell_paragraph)
+    app.add_node(literal_cell_paragraph)
 
     # Add configuration values for performance limits
     app.add_config_value(
@@ -40,6 +129,65 @@ def setup(app: Sphinx) -> dict[str, Any]:
         [int],  # Type validation
     )
 
+    # Keep JSON numbers as written in the source instead of re-formatting them
+    app.add_config_value("jsontable_numbers_as_text", False, "env", [bool])
+
+    # Let SmartQuotes educate cell text (quotes, dashes, ellipses) as it does
+    # prose; off by default, data is rendered as written
+    app.add_config_value("jsontable_smartquotes", False, "env", [bool])
+
+    # Table text the HTML search index sees: "all", "sample" (header and the
+    # first jsontable_search_sample_rows rows), "headers" or "none"
+    app.add_config_value("jsontable_searchable", "all", "env", [str])
+    app.add_config_value("jsontable_search_sample_rows", 10, "env", [int])
+    app.connect("config-inited", _check_searchable)
+
+    # Table text gettext extracts and translations replace: "none" or
+    # "headers" (the header cells)
+    app.add_config_value("jsontable_translatable", "none", "env", [str])
+
+    # Excel sheet parser: "auto" picks per read by file size and options;
+    # "pandas", "openpyxl", "streaming" or "calamine" pin one engine
+    app.add_config_value("jsontable_excel_engine", "auto", "env", [str])
+
+    # Snapshot parsed xlsx sheets next to the doctrees, so later reads of a
+    # sheet (any range, any build) skip the XML
+    app.add_config_value("jsontable_excel_snapshots", True, "env", [bool])
+
+    # Parse sheets shared by this many documents before -j workers fork, so
+    # they inherit the rows instead of each parsing the workbook (0 disables)
+    app.add_config_value("jsontable_preload_min_docs", 2, "", [int])
+    app.connect("env-before-read-docs", preload_shared_sheets)
+
+    # Reorder the documents of a -j read so that Sphinx's chunks carry
+    # similar costs (read times of the previous build, else data file sizes)
+    app.add_config_value("jsontable_balance_parallel_read", True, "", [bool])
+    app.connect("source-read", start_read_timer)
+    app.connect("doctree-read", record_read_time)
+    app.connect("env-purge-doc", purge_read_time)
+    app.connect("env-merge-info", merge_read_times)
+    app.connect("env-before-read-docs", balance_parallel_read)
+
+    # Convert object arrays of at least this many rows in worker processes
+    # (0 disables); the pool is shared by all directives for the whole build
+    app.add_config_value("jsontable_parallel_threshold", 0, "env", [int])
+    app.add_config_value("jsontable_parallel_workers", None, "env", [int])
+    app.connect("build-finished", shutdown_conversion_pool)
+    app.connect("build-finished", _report_cache_stats)
+    # Processors (and their caches) are shared by the directives of one build
+    app.connect("build-finished", release_processors)
+    app.connect("build-finished", _close_workbooks)
+    app.connect("build-finished", release_preloaded_sheets)
+
+    # Write a trace-event JSON timeline of the jsontable stages to this file,
+    # relative to the output directory ("" disables tracing)
+    app.add_config_value("jsontable_trace_file", "", "", [str])
+    app.connect("builder-inited", start_trace)
+    app.connect("doctree-read", stash_trace_events)
+    app.connect("env-merge-info", merge_trace_events)
+    app.connect("env-updated", collect_trace_events)
+    app.connect("build-finished", write_trace_file)
+
     return {
         "version": __version__,
         "parallel_read_safe": True,
@@ -11,7 +11,13 @@ from .data_converter import (
     HeaderDetectionResult,
     IDataConverter,
 )
-from .excel_reader import ExcelReader, IExcelReader, ReadResult, WorkbookInfo
+from .excel_reader import (
+    ExcelReader,
+    IExcelReader,
+    ReadResult,
+    StreamingExcelReader,
+    WorkbookInfo,
+)
 from .range_parser import IRangeParser, RangeInfo, RangeParser
 
 __all__ = [
@@ -24,6 +30,7 @@ __all__ = [
     "HeaderDetectionResult",
     "IExcelReader",
     "ExcelReader",
+    "StreamingExcelReader",
     "ReadResult",
     "WorkbookInfo",
 ]
@@ -0,0 +1,276 @@
+"""Data Cache - Size-aware, thread-safe LRU cache for loaded table data.
+
+Loaded tables differ in size by orders of magnitude, so the cache is bounded
+by an estimated byte budget rather than only by an entry count: one huge
+sheet takes the room of many small ones. Sizes are estimated from a sample
+of rows (rows x columns x average cell size), never by walking every cell.
+
+Keys are spread over independently locked stripes, so threads reading
+different entries do not contend on one lock. Each stripe is a true LRU
+(``OrderedDict`` in access order) with its share of the budgets; eviction
+drops the least recently used entries of the stripe receiving a new one.
+Entries may also expire after a time-to-live.
+
+Every cache counts hits, misses, evictions, expirations and bytes held;
+``cache_statistics`` sums them per cache name over the live caches, for the
+extension to report at the end of a build.
+"""
+
+import logging
+import sys
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from dataclasses import dataclass, fields
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
+
+from ..trace_events import span
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_MAX_BYTES = 256 * 1024 * 1024  # 256MB
+DEFAULT_STRIPES = 4
+
+# Rows sampled to estimate the size of a table
+_SIZE_SAMPLE_ROWS = 32
+_POINTER_BYTES = 8
+
+_MISSING = object()
+
+
+def _row_size(row: Any) -> int:
+    if not isinstance(row, (list, tuple, dict)):
+        return sys.getsizeof(row)
+    cells = row.values() if isinstance(row, dict) else row
+    return sys.getsizeof(row) + sum(
+        sys.getsizeof(cell) + _POINTER_BYTES for cell in cells
+    )
+
+
+def estimate_size(value: Any) -> int:
+    """Estimate the memory held by ``value`` in bytes.
+
+    Tables (lists of row lists, tuples or dicts) are estimated as
+    rows x columns x average cell size, the average taken over a sample of
+    evenly spaced rows. Anything else counts its shallow size.
+    """
+    if not isinstance(value, list) or not value:
+        return sys.getsizeof(value)
+
+    step = max(1, len(value) // _SIZE_SAMPLE_ROWS)
+    sample = value[::step][:_SIZE_SAMPLE_ROWS]
+    sampled_bytes = sum(_row_size(row) for row in sample)
+    return sys.getsizeof(value) + sampled_bytes * len(value) // len(sample)
+
+
+@dataclass
+class CacheStats:
+    """Counters of one cache (or the sum of several)."""
+
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    entries: int = 0
+    bytes: int = 0
+
+    @property
+    def lookups(self) -> int:
+        """Number of lookups counted."""
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of lookups served from the cache (0.0 without lookups)."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+    def __add__(self, other: "CacheStats") -> "CacheStats":
+        return CacheStats(
+            *(getattr(self, f.name) + getattr(other, f.name) for f in fields(self))
+        )
+
+
+class _Stripe:
+    """One independently locked LRU segment of a cache."""
+
+    def __init__(self, max_bytes: int, max_entries: Optional[int]):
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        # key -> (value, size in bytes, time stored)
+        self.entries: OrderedDict[Hashable, Tuple[Any, int, float]] = OrderedDict()
+        self.lock = threading.Lock()
+        self.stats = CacheStats()
+
+    def remove(self, key: Hashable) -> Tuple[Any, int, float]:
+        value, size, stored_at = self.entries.pop(key)
+        self.stats.entries -= 1
+        self.stats.bytes -= size
+        return value, size, stored_at
+
+    def make_room(self, size: int) -> None:
+        """Evict least recently used entries until ``size`` more bytes fit."""
+        while self.entries and (
+            self.stats.bytes + size > self.max_bytes
+            or (self.max_entries is not None and len(self.entries) >= self.max_entries)
+        ):
+            self.remove(next(iter(self.entries)))
+            self.stats.evictions += 1
+
+
+_live_caches: "weakref.WeakSet[LRUCache]" = weakref.WeakSet()
+
+
+class LRUCache:
+    """Thread-safe LRU cache bounded by estimated bytes and entry count.
+
+    Supports the mapping operations the callers use (``in``, ``[]``,
+    ``len``, ``pop``, ``clear``); reads through ``get`` or ``[]`` count as
+    hits or misses and refresh the entry's recency.
+
+    Args:
+        max_bytes: Budget of estimated bytes held
+        max_entries: Maximum number of entries (None = bounded by bytes only)
+        ttl: Seconds an entry stays valid after being stored (None = forever)
+        stripes: Number of independently locked segments; budgets are split
+            evenly between them
+        sizeof: Estimates the bytes held by a value
+        name: Name the statistics are reported under
+        clock: Time source for ``ttl``
+    """
+
+    def __init__(
+        self,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        max_entries: Optional[int] = None,
+        ttl: Optional[float] = None,
+        stripes: int = DEFAULT_STRIPES,
+        sizeof: Callable[[Any], int] = estimate_size,
+        name: str = "cache",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        if stripes < 1:
+            raise ValueError(f"stripes must be at least 1, got {stripes}")
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.sizeof = sizeof
+        self.name = name
+        self._clock = clock
+        stripe_entries = None if max_entries is None else -(-max_entries // stripes)
+        self._stripes = [
+            _Stripe(max_bytes // stripes, stripe_entries) for _ in range(stripes)
+        ]
+        _live_caches.add(self)
+
+    def _stripe(self, key: Hashable) -> _Stripe:
+        return self._stripes[hash(key) % len(self._stripes)]
+
+    def _expired(self, stored_at: float) -> bool:
+        return self.ttl is not None and self._clock() - stored_at > self.ttl
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Return the value cached under ``key``, or ``default``."""
+        stripe = self._stripe(key)
+        with span("cache lookup", "cache", cache=self.name) as trace, stripe.lock:
+            entry = stripe.entries.get(key)
+            if entry is not None and self._expired(entry[2]):
+                stripe.remove(key)
+                stripe.stats.expirations += 1
+                entry = None
+            if entry is None:
+                stripe.stats.misses += 1
+                trace.set(hit=False)
+                return default
+            stripe.entries.move_to_end(key)
+            stripe.stats.hits += 1
+            trace.set(hit=True)
+            return entry[0]
+
+    def put(self, key: Hashable, value: Any) -> bool:
+        """Cache ``value`` under ``key``, evicting the least recently used.
+
+        Returns:
+            Whether the value was stored; values larger than a stripe's byte
+            budget are not cached
+        """
+        try:
+            size = max(0, int(self.sizeof(value)))
+        except Exception:
+            size = sys.getsizeof(value)
+
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key in stripe.entries:
+                stripe.remove(key)
+            if size > stripe.max_bytes:
+                logger.debug(f"{self.name}: {size} byte entry exceeds the budget")
+                return False
+            stripe.make_room(size)
+            stripe.entries[key] = (value, size, self._clock())
+            stripe.stats.entries += 1
+            stripe.stats.bytes += size
+            return True
+
+    def pop(self, key: Hashable, default: Any = _MISSING) -> Any:
+        """Remove ``key`` and return its value (or ``default``)."""
+        stripe = self._stripe(key)
+        with stripe.lock:
+            if key in stripe.entries:
+                return stripe.remove(key)[0]
+        if default is _MISSING:
+            raise KeyError(key)
+        return default
+
+    def clear(self) -> None:
+        """Drop every entry; the counters are kept."""
+        for stripe in self._stripes:
+            with stripe.lock:
+                stripe.entries.clear()
+                stripe.stats.entries = 0
+                stripe.stats.bytes = 0
+
+    def keys(self) -> List[Hashable]:
+        """Keys currently cached, least recently used first per stripe."""
+        keys: List[Hashable] = []
+        for stripe in self._stripes:
+            with stripe.lock:
+                keys.extend(stripe.entries)
+        return keys
+
+    def stats(self) -> CacheStats:
+        """Counters summed over all stripes."""
+        total = CacheStats()
+        for stripe in self._stripes:
+            with stripe.lock:
+                total = total + stripe.stats
+        return total
+
+    def __getitem__(self, key: Hashable) -> Any:
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self.put(key, value)
+
+    def __delitem__(self, key: Hashable) -> None:
+        self.pop(key)
+
+    def __contains__(self, key: Hashable) -> bool:
+        stripe = self._stripe(key)
+        with stripe.lock:
+            entry = stripe.entries.get(key)
+            return entry is not None and not self._expired(entry[2])
+
+    def __len__(self) -> int:
+        return sum(len(stripe.entries) for stripe in self._stripes)
+
+
+def cache_statistics() -> Dict[str, CacheStats]:
+    """Counters of the live caches, summed per cache name."""
+    totals: Dict[str, CacheStats] = {}
+    for cache in list(_live_caches):
+        totals[cache.name] = totals.get(cache.name, CacheStats()) + cache.stats()
+    return totals
@@ -8,14 +8,27 @@ CLAUDE.md Code Excellence Compliance:
 - SOLID Principles: Interface implementation with dependency injection
 """
 
-from typing import Any, List
+from typing import Any, List, Optional
 
+import numpy as np
 import pandas as pd
 
 from ..errors.excel_errors import DataConversionError
 from .data_conversion_types import ConversionResult, IDataConverter
 from .header_detection import HeaderDetector, HeaderNormalizer
 
+# How object cells are converted: kept as is, float (whole ones become int),
+# or stringified
+_KEPT, _FLOAT, _OTHER = 0, 1, 2
+_CELL_KINDS = {str: _KEPT, int: _KEPT, bool: _KEPT, float: _FLOAT, np.float64: _FLOAT}
+
+
+def _cell_kind(value: Any) -> int:
+    return _CELL_KINDS.get(type(value), _OTHER)
+
+
+_cell_kinds = np.frompyfunc(_cell_kind, 1, 1)
+
 
 class DataConverterCore(IDataConverter):
     """Core data conversion functionality.
@@ -63,10 +76,10 @@ class DataConverterCore(IDataConverter):
                 if header_row > 0:
                     # Extract specific header row
                     headers = [str(val) for val in df.iloc[header_row]]
-                    data_df = df.drop(df.index[header_row]).reset_index(drop=True)
+                    skip_row = header_row
                 else:
                     headers = [str(col) for col in df.columns]
-                    data_df = df
+                    skip_row = None
             else:
                 # Auto-detect headers
                 detection_result = self.header_detector.detect_header(df)
@@ -74,13 +87,13 @@ class DataConverterCore(IDataConverter):
 
                 if has_header:
                     headers = detection_result.headers
-                    data_df = df.iloc[1:].reset_index(drop=True)  # Skip first row
+                    skip_row = 0  # Skip first row
                 else:
                     headers = [f"Column_{i + 1}" for i in range(len(df.columns))]
-                    data_df = df
+                    skip_row = None
 
             # Convert DataFrame to 2D array with proper type handling
-            data_array = self._convert_dataframe_values(data_df)
+            data_array = self._convert_dataframe_values(df, skip_row)
 
             # Normalize headers if needed
             if has_header:
@@ -136,40 +149,93 @@ class DataConverterCore(IDataConverter):
         """
         return self.header_normalizer.normalize_headers(headers, japanese_support)
 
-    def _convert_dataframe_values(self, df: pd.DataFrame) -> List[List[Any]]:
+    def _convert_dataframe_values(
+        self, df: pd.DataFrame, skip_row: Optional[int] = None
+    ) -> List[List[Any]]:
         """Convert DataFrame values with proper type handling.
 
+        Values are converted column by column with NumPy. Columns are taken
+        from ``df.to_numpy()``, so every cell is seen with the DataFrame's
+        common dtype, exactly as when iterating over its rows.
+
         Args:
             df: DataFrame to convert
+            skip_row: Position of a row to leave out (e.g. the header row),
+                dropped from the result instead of copying the DataFrame
 
         Returns:
             2D array of converted values
         """
-        data_array = []
-
-        for _, row in df.iterrows():
-            row_data = []
-            for value in row:
-                # Handle NaN/None values
-                if pd.isna(value):
-                    row_data.append(self.empty_string_replacement)
-                    continue
-
-                # Handle numeric values with type preservation
-                if self.preserve_numeric_types and self._is_numeric_value(value):
-                    # Convert to int if it's a whole number, otherwise keep as float
-                    if isinstance(value, float) and value.is_integer():
-                        row_data.append(int(value))
-                    else:
-                        row_data.append(value)
-                else:
-                    # Convert to string for consistency
-                    row_data.append(str(value))
-
-            data_array.append(row_data)
+        values = df.to_numpy()
+        if values.shape[1] == 0:
+            data_array = [[] for _ in range(values.shape[0])]
+        else:
+            columns = [
+                self._convert_column(values[:, i]) for i in range(values.shape[1])
+            ]
+            data_array = [list(row) for row in zip(*columns)]
 
+        if skip_row is not None and skip_row < len(data_array):
+            del data_array[skip_row]
         return data_array
 
+    def _convert_column(self, column: np.ndarray) -> List[Any]:
+        """Convert one column of cell values.
+
+        - NaN/None become ``empty_string_replacement``
+        - with ``preserve_numeric_types``, ``int``/``bool`` and strings are
+          kept, whole floats become ``int`` and other floats are kept
+        - everything else (or every value, without type preservation) is
+          converted to ``str``
+
+        Args:
+            column: 1-D array of cell values
+
+        Returns:
+            Converted values
+        """
+        if column.dtype.kind not in "fiubO":
+            # datetime64/timedelta64: convert as the pandas scalars rows hold
+            column = pd.Series(column).astype(object).to_numpy()
+
+        null = pd.isna(column)
+        if not self.preserve_numeric_types:
+            result = column.astype(str).astype(object)
+            result[null] = self.empty_string_replacement
+            return result.tolist()
+        if column.dtype.kind in "iub":
+            # Typed integer/bool columns cannot hold NaN; tolist() gives int/bool
+            return column.tolist()
+
+        if column.dtype.kind == "f":
+            result = column.astype(object)
+            floats = column
+            is_float = ~null
+        else:
+            result = column.copy()
+            kinds = _cell_kinds(column).astype(np.int8)
+            is_float = (kinds == _FLOAT) & ~null
+            other = (kinds == _OTHER) & ~null
+            if other.any():
+                result[other] = [str(value) for value in column[other]]
+            floats = column[is_float].astype(np.float64)
+
+        # Whole floats become int; int64 covers all but huge magnitudes
+        whole = np.isfinite(floats) & (floats == np.floor(floats))
+        if column.dtype.kind == "f":
+            whole &= is_float
+            positions = np.flatnonzero(whole)
+        else:
+            positions = np.flatnonzero(is_float)[whole]
+        whole_values = floats[whole]
+        small = np.abs(whole_values) < 2**63
+        result[positions[small]] = whole_values[small].astype(np.int64).astype(object)
+        if not small.all():
+            result[positions[~small]] = [int(value) for value in whole_values[~small]]
+
+        result[null] = self.empty_string_replacement
+        return result.tolist()
+
     def _is_numeric_value(self, value: Any) -> bool:
         """Check if value is numeric.
 
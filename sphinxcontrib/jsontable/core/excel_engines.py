@@ -0,0 +1,360 @@
+"""Excel Engines - Pluggable sheet parsers behind ``ExcelReader``.
+
+``ExcelReader`` validates the file and resolves the sheet; the actual cell
+parsing is delegated to an engine:
+
+- ``pandas``: ``pandas.read_excel`` on the shared workbook handle. Supports
+  every read option and is the reference behaviour.
+- ``openpyxl``: iterates the read-only worksheet directly, without going
+  through ``pandas.read_excel``. Only ``skiprows``/``nrows`` are supported.
+- ``streaming``: ``iterparse`` over the worksheet XML
+  (see ``excel_reader_streaming``). Stops after the last requested row, so
+  row windows of huge sheets are cheap. xlsx/xlsm only.
+- ``calamine``: ``python-calamine`` through pandas, when installed. Much
+  faster than openpyxl on large sheets.
+
+All engines return the same ``header=None`` DataFrame for the same sheet.
+Trailing empty rows and columns are trimmed from the cell data while the rows
+are read - never from the sheet's declared dimension, which exporters often
+set to the whole grid - so formatted-but-empty cells do not reach the
+DataFrame.
+``select_engine`` picks one per read from the file size and the requested
+options, or honours a pinned engine (``jsontable_excel_engine``) whenever it
+can serve the read.
+"""
+
+import logging
+from abc import ABC, abstractmethod
+from importlib.util import find_spec
+from pathlib import Path
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+from pandas.io.parsers import TextParser
+
+from .workbook_manifest import read_workbook_manifest
+
+if TYPE_CHECKING:
+    from .excel_reader_core import ExcelReader
+
+logger = logging.getLogger(__name__)
+
+ENGINE_AUTO = "auto"
+
+# Files at least this large are read with the fastest available engine
+LARGE_FILE_BYTES = 5 * 1024 * 1024
+
+# Reader options the row-based engines implement themselves
+ROW_OPTIONS = frozenset({"header", "skiprows", "nrows"})
+
+OOXML_SUFFIXES = frozenset({".xlsx", ".xlsm", ".xltx", ".xltm"})
+
+_EMPTY = ""
+
+
+def supports_row_options(options: Dict[str, Any]) -> bool:
+    """Whether ``options`` is a plain ``header=None`` read of a row window."""
+    if not ROW_OPTIONS.issuperset(options):
+        return False
+    if options.get("header") is not None:
+        return False
+    for name in ("skiprows", "nrows"):
+        value = options.get(name)
+        if value is not None and (
+            isinstance(value, bool) or not isinstance(value, int) or value < 0
+        ):
+            return False
+    return True
+
+
+def trim_blank_rows(rows: Iterable[List[Any]]) -> Iterator[List[Any]]:
+    """Trim trailing blank cells of each row and drop trailing blank rows.
+
+    Blank rows are held back until a row with data follows, so a sheet with
+    thousands of formatted-but-empty rows below the data never materialises
+    them. Rows are trimmed in place.
+    """
+    pending = 0
+    for row in rows:
+        while row and row[-1] == _EMPTY:
+            row.pop()
+        if not row:
+            pending += 1
+            continue
+        for _ in range(pending):
+            yield []
+        pending = 0
+        yield row
+
+
+def rows_to_dataframe(
+    rows: Iterable[List[Any]], skiprows: int = 0, nrows: Optional[int] = None
+) -> pd.DataFrame:
+    """Assemble sheet rows into a DataFrame exactly like ``pandas.read_excel``.
+
+    Blank cells are ``""``. As in pandas, trailing blank cells and rows are
+    trimmed, rows are padded to the widest row read (skipped rows included)
+    and types are inferred by pandas' own ``TextParser``.
+
+    Args:
+        rows: Sheet rows starting at row 1 (modified in place)
+        skiprows: Number of leading rows to drop
+        nrows: Number of rows to keep after the skipped ones (None = all)
+
+    Returns:
+        DataFrame with ``header=None`` layout
+    """
+    rows = list(trim_blank_rows(rows))
+    max_width = max((len(row) for row in rows), default=0)
+    rows = rows[skiprows:]
+    if nrows is not None:
+        rows = rows[:nrows]
+    if not rows:
+        return pd.DataFrame()
+
+    data = [row + [_EMPTY] * (max_width - len(row)) for row in rows]
+    # Same parser pandas.read_excel uses, so dtype inference is identical
+    return TextParser(data, header=None, skip_blank_lines=False).read()
+
+
+class ExcelEngine(ABC):
+    """Parser turning one worksheet into a ``header=None`` DataFrame."""
+
+    name: str = ""
+
+    def available(self) -> bool:
+        """Whether the engine's dependencies are installed."""
+        return True
+
+    def supports(self, file_path: Path, options: Dict[str, Any]) -> bool:
+        """Whether the engine can serve this read."""
+        return True
+
+    @abstractmethod
+    def read(
+        self,
+        reader: "ExcelReader",
+        file_path: Union[str, Path],
+        sheet_name: str,
+        options: Dict[str, Any],
+    ) -> pd.DataFrame:
+        """Read ``sheet_name`` with the given (pandas-style) options.
+
+        Args:
+            reader: Reader owning the shared workbook handle and manifest
+            file_path: Path to Excel file
+            sheet_name: Resolved sheet name
+            options: Read options, ``header`` included
+
+        Returns:
+            Sheet data
+        """
+
+
+class PandasEngine(ExcelEngine):
+    """``pandas.read_excel`` on the shared workbook handle."""
+
+    name = "pandas"
+
+    def read(self, reader, file_path, sheet_name, options):
+        return pd.read_excel(
+            reader._pandas_source(file_path), sheet_name=sheet_name, **options
+        )
+
+
+class CalamineEngine(ExcelEngine):
+    """``pandas.read_excel`` backed by the Rust ``python-calamine`` parser."""
+
+    name = "calamine"
+
+    def available(self) -> bool:
+        return find_spec("python_calamine") is not None
+
+    def read(self, reader, file_path, sheet_name, options):
+        return pd.read_excel(
+            file_path, sheet_name=sheet_name, engine="calamine", **options
+        )
+
+
+class _RowWindowEngine(ExcelEngine):
+    """Engine reading ``header=None`` row windows of OOXML workbooks."""
+
+    def supports(self, file_path, options):
+        suffix = Path(file_path).suffix.lower()
+        return suffix in OOXML_SUFFIXES and supports_row_options(options)
+
+
+class OpenpyxlEngine(_RowWindowEngine):
+    """Row iteration over the shared read-only openpyxl worksheet."""
+
+    name = "openpyxl"
+
+    def read(self, reader, file_path, sheet_name, options):
+        skiprows = options.get("skiprows") or 0
+        nrows = options.get("nrows")
+        # pandas semantics: one row past the window decides the width
+        max_row = None if nrows is None else skiprows + nrows + 1
+
+        sheet = reader._open_handle(file_path).workbook[sheet_name]
+        if getattr(sheet, "reset_dimensions", None):
+            # Stored dimensions are often wrong; scan the actual cells
+            sheet.reset_dimensions()
+        return rows_to_dataframe(
+            self._iter_values(sheet.iter_rows(max_row=max_row)), skiprows, nrows
+        )
+
+    @classmethod
+    def _iter_values(cls, rows: Iterable[Tuple[Any, ...]]) -> Iterator[List[Any]]:
+        """Convert rows, skipping the formatted-but-empty cells at their end."""
+        for row in rows:
+            end = len(row)
+            while end and row[end - 1].value is None:
+                end -= 1
+            yield [cls._convert_cell(cell) for cell in row[:end]]
+
+    @staticmethod
+    def _convert_cell(cell: Any) -> Any:
+        """Convert a cell the way pandas' openpyxl reader does."""
+        value = cell.value
+        if value is None:
+            return _EMPTY
+        if cell.data_type == "e":
+            return np.nan
+        if cell.data_type == "n" and not isinstance(value, bool):
+            return int(value) if int(value) == value else float(value)
+        return value
+
+
+class StreamingEngine(_RowWindowEngine):
+    """``iterparse`` over the worksheet XML, stopping after the window."""
+
+    name = "streaming"
+
+    def read(self, reader, file_path, sheet_name, options):
+        # Imported lazily: the streaming module builds on excel_reader_core
+        from .excel_reader_streaming import read_sheet_window
+
+        manifest = reader._read_manifest(file_path)
+        if manifest is None:
+            return PandasEngine().read(reader, file_path, sheet_name, options)
+        return read_sheet_window(
+            file_path,
+            manifest,
+            sheet_name,
+            skiprows=options.get("skiprows") or 0,
+            nrows=options.get("nrows"),
+        )
+
+
+_ENGINES: Dict[str, ExcelEngine] = {}
+
+
+def register_engine(engine: ExcelEngine) -> None:
+    """Register (or replace) an engine under ``engine.name``."""
+    _ENGINES[engine.name] = engine
+
+
+def get_engine(name: str) -> ExcelEngine:
+    """Return the registered engine called ``name``.
+
+    Raises:
+        ValueError: If no engine of that name is registered
+    """
+    try:
+        return _ENGINES[name]
+    except KeyError:
+        raise ValueError(
+            f"Unknown Excel engine '{name}'. "
+            f"Available engines: {', '.join([ENGINE_AUTO, *sorted(_ENGINES)])}"
+        ) from None
+
+
+def available_engines() -> List[str]:
+    """Names of the registered engines whose dependencies are installed."""
+    return [name for name, engine in _ENGINES.items() if engine.available()]
+
+
+def _file_size(file_path: Union[str, Path]) -> int:
+    try:
+        return Path(file_path).stat().st_size
+    except OSError:
+        return 0
+
+
+def _has_phantom_used_range(file_path: Path, sheet_name: str) -> bool:
+    from .excel_reader_streaming import has_phantom_used_range
+
+    try:
+        manifest = read_workbook_manifest(file_path)
+        return has_phantom_used_range(file_path, manifest, sheet_name)
+    except Exception:
+        # Unreadable packages are left to the other engines
+        return False
+
+
+def select_engine(
+    file_path: Union[str, Path],
+    options: Dict[str, Any],
+    preferred: str = ENGINE_AUTO,
+    sheet_name: Optional[str] = None,
+) -> ExcelEngine:
+    """Choose the engine for one read.
+
+    A pinned engine is used whenever it is installed and supports the
+    options; otherwise (and for ``"auto"``) the choice is:
+
+    1. ``streaming`` for row windows (``nrows``), which stop early, and for
+       sheets whose declared used range is far larger than their cell data
+       (formatted-but-empty cells are skipped without being decoded)
+    2. ``calamine`` for large files, if installed, else ``streaming``
+    3. ``pandas`` for everything else
+
+    Args:
+        file_path: Path to Excel file
+        options: Read options, ``header`` included
+        preferred: Pinned engine name or ``"auto"``
+        sheet_name: Sheet to be read, if already resolved
+
+    Returns:
+        Engine to read with
+    """
+    path = Path(file_path)
+    if preferred != ENGINE_AUTO:
+        engine = _ENGINES.get(preferred)
+        if engine is not None and engine.available() and engine.supports(path, options):
+            return engine
+        logger.debug(
+            f"Excel engine '{preferred}' cannot read {path.name} with "
+            f"{sorted(options)}; choosing automatically"
+        )
+
+    streaming = _ENGINES.get("streaming")
+    can_stream = streaming is not None and streaming.supports(path, options)
+    if can_stream and (
+        options.get("nrows") is not None
+        or (sheet_name is not None and _has_phantom_used_range(path, sheet_name))
+    ):
+        return streaming
+
+    large = _file_size(path) >= LARGE_FILE_BYTES
+    calamine = _ENGINES.get("calamine")
+    if large and calamine is not None and calamine.available():
+        return calamine
+    if large and can_stream:
+        return streaming
+    return _ENGINES["pandas"]
+
+
+for _engine in (PandasEngine(), OpenpyxlEngine(), StreamingEngine(), CalamineEngine()):
+    register_engine(_engine)
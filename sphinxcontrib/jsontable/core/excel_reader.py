@@ -13,9 +13,11 @@ CLAUDE.md Code Excellence Compliance:
 # Import openpyxl components for external access
 from openpyxl import load_workbook
 
+from .excel_engines import ExcelEngine, available_engines, register_engine
 from .excel_reader_core import ExcelReader
 from .excel_reader_interface import IExcelReader
 from .excel_reader_mock import MockExcelReader
+from .excel_reader_streaming import StreamingExcelReader
 from .excel_workbook_info import ReadResult, WorkbookInfo
 
 # Re-export for backward compatibility
@@ -23,8 +25,12 @@ __all__ = [
     "IExcelReader",
     "ExcelReader",
     "MockExcelReader",
+    "StreamingExcelReader",
     "WorkbookInfo",
     "ReadResult",
+    "ExcelEngine",
+    "available_engines",
+    "register_engine",
     "load_workbook",  # Critical: 追加でインポートエラー解消
 ]
 
@@ -9,9 +9,10 @@ CLAUDE.md Code Excellence Compliance:
 - SOLID Principles: Interface implementation with dependency injection
 """
 
+import logging
 import os
 from pathlib import Path
-from typing import List, Optional, Union
+from typing import Any, Iterator, List, Optional, Tuple, Union
 
 import pandas as pd
 from openpyxl import load_workbook
@@ -23,8 +24,24 @@ from ..errors.excel_errors import (
     SecurityValidationError,
     WorksheetNotFoundError,
 )
+from ..trace_events import span
+from .excel_engines import (
+    ENGINE_AUTO,
+    available_engines,
+    get_engine,
+    rows_to_dataframe,
+    select_engine,
+    supports_row_options,
+)
 from .excel_reader_interface import IExcelReader
 from .excel_workbook_info import ReadResult, WorkbookInfo
+from .preloaded_data import preloaded_sheets
+from .range_detector import dataframe_cells
+from .sheet_snapshot import SheetSnapshotStore
+from .workbook_handle import WorkbookHandle, open_workbook
+from .workbook_manifest import ManifestError, WorkbookManifest, read_workbook_manifest
+
+logger = logging.getLogger(__name__)
 
 
 class ExcelReader(IExcelReader):
@@ -40,6 +57,8 @@ class ExcelReader(IExcelReader):
         max_file_size: int = 100 * 1024 * 1024,  # 100MB
         allowed_extensions: Optional[List[str]] = None,
         enable_security_validation: bool = True,
+        engine: str = ENGINE_AUTO,
+        snapshot_dir: Optional[Union[str, Path]] = None,
     ):
         """Initialize Excel reader with configuration.
 
@@ -47,6 +66,9 @@ class ExcelReader(IExcelReader):
             max_file_size: Maximum allowed file size in bytes
             allowed_extensions: List of allowed file extensions
             enable_security_validation: Whether to perform security validation
+            engine: Sheet parsing engine ("auto", "pandas", "openpyxl",
+                "streaming" or "calamine")
+            snapshot_dir: Directory for sheet snapshots (None disables them)
         """
         self.max_file_size = max_file_size
         self.allowed_extensions = allowed_extensions or [
@@ -56,6 +78,13 @@ class ExcelReader(IExcelReader):
             ".xltm",
         ]
         self.enable_security_validation = enable_security_validation
+        if engine != ENGINE_AUTO and engine not in available_engines():
+            logger.warning(
+                f"Excel engine '{engine}' is not available; choosing automatically"
+            )
+            engine = ENGINE_AUTO
+        self.engine = engine
+        self.snapshots = SheetSnapshotStore(snapshot_dir) if snapshot_dir else None
 
     def validate_file(self, file_path: Union[str, Path]) -> WorkbookInfo:
         """Validate Excel file and return workbook information.
@@ -74,13 +103,18 @@ class ExcelReader(IExcelReader):
             self._validate_file_extension(file_path)
             self._validate_file_size(file_path)
 
-            # Load workbook for detailed inspection
-            workbook = load_workbook(file_path, data_only=True)
-            sheet_names = workbook.sheetnames
-
-            # Security inspection
-            has_macros = self._check_macros(file_path)
-            has_external_links = self._check_external_links(workbook)
+            # Inspect the package manifest; no cell data is loaded
+            manifest = self._read_manifest(file_path)
+            if manifest is not None:
+                sheet_names = list(manifest.sheet_names)
+                has_macros = self._check_macros(file_path) or manifest.has_vba_project
+                has_external_links = manifest.has_external_links
+            else:
+                # Not a zip package: fall back to the shared workbook handle
+                handle = self._open_handle(file_path)
+                sheet_names = handle.sheet_names
+                has_macros = self._check_macros(file_path)
+                has_external_links = self._check_external_links(handle.workbook)
 
             return WorkbookInfo(
                 file_path=file_path,
@@ -108,8 +142,10 @@ class ExcelReader(IExcelReader):
             List of sheet names
         """
         try:
-            workbook = load_workbook(file_path, data_only=True)
-            return workbook.sheetnames
+            manifest = self._read_manifest(file_path)
+            if manifest is not None:
+                return list(manifest.sheet_names)
+            return self._open_handle(file_path).sheet_names
         except Exception as e:
             raise ExcelProcessingError(f"Failed to read sheet names: {e}") from e
 
@@ -140,19 +176,39 @@ class ExcelReader(IExcelReader):
                 workbook_info.sheet_names, sheet_name, sheet_index
             )
 
-            # Read data using pandas with header=None to preserve all rows
+            # Read data with header=None to preserve all rows
             # This ensures Excel row numbering remains consistent for range operations
             default_kwargs = {"header": None}
             default_kwargs.update(kwargs)  # Allow override if explicitly specified
-            dataframe = pd.read_excel(
-                file_path, sheet_name=target_sheet, **default_kwargs
-            )
+            with span("cache lookup", "cache", cache="preloaded") as trace:
+                dataframe = self._read_preloaded(
+                    file_path, target_sheet, default_kwargs
+                )
+                trace.set(hit=dataframe is not None)
+            engine_name = "preloaded"
+            streamable = True
+            if dataframe is None:
+                with span("cache lookup", "cache", cache="snapshot") as trace:
+                    try:
+                        dataframe = self._read_snapshot(
+                            file_path, target_sheet, default_kwargs
+                        )
+                    except Exception as e:
+                        self._log_streaming_fallback(file_path, target_sheet, e)
+                        streamable = False
+                    trace.set(hit=dataframe is not None)
+                engine_name = "snapshot"
+            if dataframe is None:
+                dataframe, engine_name = self._read_with_engine(
+                    file_path, target_sheet, default_kwargs, streamable
+                )
 
             # Create metadata
             metadata = {
                 "sheet_name": target_sheet,
                 "original_shape": dataframe.shape,
                 "read_options": kwargs,
+                "engine": engine_name,
             }
 
             return ReadResult(
@@ -184,8 +240,225 @@ class ExcelReader(IExcelReader):
         else:
             return self.read_workbook(file_path, sheet_index=sheet_identifier, **kwargs)
 
+    def occupied_cells(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: Optional[str] = None,
+        sheet_index: Optional[int] = None,
+    ) -> Iterator[Tuple[int, int]]:
+        """Yield 1-based (row, column) of the non-empty cells of a sheet.
+
+        xlsx/xlsm sheets are streamed without converting any value; other
+        formats fall back to reading the sheet.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Specific sheet name to read
+            sheet_index: Specific sheet index to read (0-based)
+
+        Returns:
+            Cell coordinates in row-major order
+        """
+        manifest = self._read_manifest(file_path)
+        if manifest is None:
+            result = self.read_workbook(
+                file_path, sheet_name=sheet_name, sheet_index=sheet_index
+            )
+            return dataframe_cells(result.dataframe)
+
+        # Imported lazily: the streaming module builds on this one
+        from .excel_reader_streaming import iter_occupied_cells
+
+        target_sheet = self._resolve_target_sheet(
+            self.validate_file(file_path).sheet_names, sheet_name, sheet_index
+        )
+        return iter_occupied_cells(file_path, manifest, target_sheet)
+
+    def merged_ranges(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: Optional[str] = None,
+        sheet_index: Optional[int] = None,
+    ) -> List[str]:
+        """Return the merged areas of a sheet as ``A1:D1``-style references.
+
+        Only xlsx/xlsm packages record merged areas in a form read here;
+        other formats report none.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Specific sheet name to read
+            sheet_index: Specific sheet index to read (0-based)
+
+        Returns:
+            Merged area references in sheet order
+        """
+        manifest = self._read_manifest(file_path)
+        if manifest is None:
+            return []
+
+        from .excel_reader_streaming import read_merged_ranges
+
+        target_sheet = self._resolve_target_sheet(
+            self.validate_file(file_path).sheet_names, sheet_name, sheet_index
+        )
+        return read_merged_ranges(file_path, manifest, target_sheet)
+
     # Private helper methods
 
+    def _read_manifest(self, file_path: Union[str, Path]) -> Optional[WorkbookManifest]:
+        """Read the cached package manifest, or None if the file has none."""
+        try:
+            return read_workbook_manifest(file_path)
+        except (ManifestError, OSError):
+            return None
+
+    def sheet_rows(
+        self, file_path: Union[str, Path], sheet_name: str, stop: Optional[int] = None
+    ) -> Optional[List[List[Any]]]:
+        """Read the rows of an xlsx sheet, from its snapshot when there is one.
+
+        Without a snapshot, a full read (``stop`` None) parses the sheet and
+        snapshots it (if snapshots are enabled); a read of the leading rows
+        streams only those and writes no snapshot.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Sheet to read
+            stop: Rows needed from the top; more may be returned (None = all)
+
+        Returns:
+            The rows, or None if the file is not an xlsx package or has no
+            such sheet
+        """
+        manifest = self._read_manifest(file_path)
+        if manifest is None or manifest.sheet_part(sheet_name) is None:
+            return None
+
+        from .excel_reader_streaming import read_sheet_rows
+
+        rows = None
+        if self.snapshots is not None:
+            rows = self.snapshots.load(file_path, sheet_name, stop)
+        if rows is None:
+            rows = read_sheet_rows(file_path, manifest, sheet_name, nrows=stop)
+            if self.snapshots is not None and stop is None:
+                self.snapshots.save(file_path, sheet_name, rows)
+        return rows
+
+    def _serves_row_windows(self, options: dict) -> bool:
+        """Whether a read can be cut from a sheet's rows by row window."""
+        return self.engine in (ENGINE_AUTO, "streaming") and supports_row_options(
+            options
+        )
+
+    @staticmethod
+    def _row_window(options: dict) -> Tuple[int, Optional[int], Optional[int]]:
+        """Return ``(skiprows, nrows, stop)`` of a row-window read."""
+        skiprows = options.get("skiprows") or 0
+        nrows = options.get("nrows")
+        # Like pandas, one row past the window is needed for trimming
+        stop = None if nrows is None else skiprows + nrows + 1
+        return skiprows, nrows, stop
+
+    def _read_preloaded(
+        self, file_path: Union[str, Path], sheet_name: str, options: dict
+    ) -> Optional[pd.DataFrame]:
+        """Serve a row-window read from rows preloaded before a parallel read.
+
+        Returns:
+            The DataFrame, or None if the sheet was not preloaded or the read
+            needs another engine
+        """
+        if not self._serves_row_windows(options):
+            return None
+        rows = preloaded_sheets().rows(file_path, sheet_name)
+        if rows is None:
+            return None
+        skiprows, nrows, stop = self._row_window(options)
+        # The preloaded rows are shared; the DataFrame is built from a copy
+        window = [list(row) for row in rows[:stop]]
+        return rows_to_dataframe(window, skiprows, nrows)
+
+    def _read_snapshot(
+        self, file_path: Union[str, Path], sheet_name: str, options: dict
+    ) -> Optional[pd.DataFrame]:
+        """Serve a row-window read from the sheet's snapshot.
+
+        The first full read of a sheet streams all of its rows and writes the
+        snapshot; every later read, whatever its window, slices it. A
+        windowed read without a snapshot is left to the streaming engine,
+        which stops after the window instead of parsing the whole sheet.
+
+        Returns:
+            The DataFrame, or None if snapshots cannot serve the read
+            (disabled, other options, another pinned engine, not xlsx, no
+            snapshot of a windowed read)
+        """
+        if self.snapshots is None or not self._serves_row_windows(options):
+            return None
+        skiprows, nrows, stop = self._row_window(options)
+        if stop is None:
+            rows = self.sheet_rows(file_path, sheet_name)
+        else:
+            rows = self.snapshots.load(file_path, sheet_name, stop)
+        if rows is None:
+            return None
+        return rows_to_dataframe(rows, skiprows, nrows)
+
+    def _read_with_engine(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: str,
+        options: dict,
+        streamable: bool = True,
+    ) -> Tuple[pd.DataFrame, str]:
+        """Read with the selected engine, falling back to pandas for streaming.
+
+        The streaming parser reads the worksheet XML itself; a sheet it
+        cannot parse (or that already failed to stream, ``streamable``
+        False) is read through ``pandas.read_excel`` instead.
+
+        Returns:
+            The DataFrame and the name of the engine that read it
+        """
+        engine = select_engine(file_path, options, self.engine, sheet_name=sheet_name)
+        if engine.name == "streaming":
+            if streamable:
+                try:
+                    dataframe = engine.read(self, file_path, sheet_name, options)
+                except Exception as e:
+                    self._log_streaming_fallback(file_path, sheet_name, e)
+                else:
+                    return dataframe, engine.name
+            engine = get_engine("pandas")
+        return engine.read(self, file_path, sheet_name, options), engine.name
+
+    @staticmethod
+    def _log_streaming_fallback(
+        file_path: Union[str, Path], sheet_name: str, error: Exception
+    ) -> None:
+        """Log why a sheet is read through pandas instead of streamed."""
+        logger.debug(
+            f"Streaming read of {Path(file_path).name} [{sheet_name}] failed "
+            f"({type(error).__name__}: {error}); reading with pandas"
+        )
+
+    def _open_handle(self, file_path: Union[str, Path]) -> WorkbookHandle:
+        """Open the shared workbook handle for the file's current contents."""
+        return open_workbook(file_path, loader=load_workbook)
+
+    def _pandas_source(self, file_path: Union[str, Path]):
+        """Return the shared workbook for pandas, falling back to the path.
+
+        ``validate_file`` has normally opened the handle already, so the sheet
+        is parsed from that workbook instead of re-opening the file.
+        """
+        try:
+            return self._open_handle(file_path).pandas_source()
+        except Exception:
+            return file_path
+
     def _validate_file_existence(self, file_path: Path) -> None:
         """Validate file existence and accessibility."""
         if not file_path.exists():
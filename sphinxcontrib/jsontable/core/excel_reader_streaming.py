@@ -0,0 +1,364 @@
+"""Excel Reader Streaming - iterparse-based sheet reader for row windows.
+
+``ExcelReader`` hands every read to ``pandas.read_excel``, which walks the
+sheet through openpyxl and resolves every cell. For ranged reads and previews
+that is wasted work: only the first rows are needed. The ``streaming`` engine
+(and ``StreamingExcelReader``, an ``ExcelReader`` pinned to it) reads the
+worksheet XML with ``iterparse`` and
+
+- stops as soon as the last requested row has been passed,
+- resolves only the shared strings that the read rows actually reference,
+  parsing the table no further than the highest index needed,
+- never loads fonts, fills or borders (only number formats, to recognise
+  date cells).
+
+Reading the first rows of a huge export therefore does not depend on the
+sheet's total size. The zip and the workbook-global parts (shared strings,
+styles) are parsed once per workbook and shared by the reads of all its
+sheets (see ``workbook_package``). The resulting ``ReadResult`` matches the
+pandas path (``header=None`` semantics, blank cells as NaN, trailing empty
+rows and columns trimmed), so the reader is a drop-in replacement for
+``ExcelReader``. Options the streaming path does not understand are left to
+the other engines.
+"""
+
+import re
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils.cell import column_index_from_string, range_boundaries
+from openpyxl.utils.datetime import from_excel
+
+from ..errors.excel_errors import ExcelProcessingError
+from .excel_engines import rows_to_dataframe
+from .excel_reader_core import ExcelReader
+from .workbook_manifest import WorkbookManifest
+from .workbook_package import WorkbookPackage, local_name, open_package, text_of
+
+_EMPTY = ""
+
+# Smallest XML a cell with a value can take: <c r="A1"><v>1</v></c>
+_MIN_CELL_BYTES = 16
+# Stands in for the value of a non-empty cell in a skipped row
+_SKIPPED = object()
+
+# Decompressed bytes scanned at a time when looking for merged areas
+_SCAN_CHUNK_BYTES = 1024 * 1024
+_MERGE_CELL = re.compile(rb'<(?:\w+:)?mergeCell\b[^>]*?\bref="([^"]+)"')
+
+
+class _SharedString:
+    """Placeholder for a shared string index, resolved after the rows are read."""
+
+    __slots__ = ("index",)
+
+    def __init__(self, index: int):
+        self.index = index
+
+
+def _column_index(reference: str) -> int:
+    """Return the 1-based column of a cell reference such as ``"AB12"``."""
+    return column_index_from_string(reference.rstrip("0123456789"))
+
+
+def _number(text: str) -> Union[int, float]:
+    """Parse a numeric cell the way pandas reports it (integral floats as int)."""
+    if "." not in text and "e" not in text and "E" not in text:
+        return int(text)
+    value = float(text)
+    return int(value) if value.is_integer() else value
+
+
+def _cell_value(
+    cell: ET.Element,
+    ns: str,
+    date_styles: Dict[int, bool],
+    epoch: Any,
+) -> Any:
+    """Decode one ``<c>`` element (shared strings stay as placeholders)."""
+    cell_type = cell.get("t", "n")
+    if cell_type == "inlineStr":
+        inline = cell.find(f"{ns}is")
+        return text_of(inline) if inline is not None else _EMPTY
+
+    # Formulas saved without a cached result carry an empty <v />; like
+    # openpyxl (and so pandas) they read as blank cells
+    raw = cell.findtext(f"{ns}v")
+    if not raw:
+        return _EMPTY
+    if cell_type == "s":
+        return _SharedString(int(raw))
+    if cell_type == "str":
+        return raw
+    if cell_type == "b":
+        return raw.strip() in ("1", "true")
+    if cell_type == "e":
+        return np.nan
+    if cell_type == "d":
+        return pd.Timestamp(raw).to_pydatetime()
+
+    value = _number(raw)
+    style = cell.get("s")
+    if style is not None and date_styles:
+        is_duration = date_styles.get(int(style))
+        if is_duration is not None:
+            return from_excel(value, epoch, timedelta=is_duration)
+    return value
+
+
+def _iter_sheet_rows(
+    package: WorkbookPackage,
+    sheet_part: str,
+    date_styles: Dict[int, bool],
+    epoch: Any,
+    first_row: int,
+    last_row: Optional[int],
+) -> Iterator[Tuple[int, Dict[int, Any]]]:
+    """Yield (1-based row number, {1-based column: value}) up to ``last_row``.
+
+    Only cells holding a value are reported. Cells of rows before
+    ``first_row`` are not decoded: non-empty cells are reported as
+    ``_SKIPPED`` so that only the row width is known.
+    """
+    with package.open_part(sheet_part) as source:
+        parser = ET.iterparse(source, events=("start", "end"))
+
+        # Tags are compared fully qualified; the namespace differs between
+        # transitional and strict OOXML, so take it from the root element
+        _, root = next(parser)
+        ns = root.tag[: root.tag.find("}") + 1]
+        sheet_data_tag, row_tag, cell_tag = f"{ns}sheetData", f"{ns}row", f"{ns}c"
+        value_tag, inline_tag = f"{ns}v", f"{ns}is"
+
+        sheet_data = None
+        row_number = 0
+        for event, element in parser:
+            if event == "start":
+                if element.tag == sheet_data_tag:
+                    sheet_data = element
+                continue
+            if element.tag != row_tag:
+                continue
+
+            row_number = int(element.get("r", row_number + 1))
+            if last_row is not None and row_number > last_row:
+                break
+
+            decode = row_number >= first_row
+            cells: Dict[int, Any] = {}
+            column = 0
+            for cell in element.iter(cell_tag):
+                reference = cell.get("r")
+                column = _column_index(reference) if reference else column + 1
+                # Formatted-but-empty cells are left out, so phantom used
+                # ranges never widen the row
+                if decode:
+                    value = _cell_value(cell, ns, date_styles, epoch)
+                    if value is not _EMPTY:
+                        cells[column] = value
+                elif any(
+                    child.tag == inline_tag or (child.tag == value_tag and child.text)
+                    for child in cell
+                ):
+                    cells[column] = _SKIPPED
+            yield row_number, cells
+
+            # Drop processed rows so memory stays flat on long sheets
+            if sheet_data is not None:
+                sheet_data.clear()
+            else:
+                element.clear()
+
+
+def iter_occupied_cells(
+    file_path: Union[str, Path], manifest: WorkbookManifest, sheet_name: str
+) -> Iterator[Tuple[int, int]]:
+    """Yield 1-based (row, column) of every non-empty cell, row by row.
+
+    Values are not converted and shared strings are not resolved (only
+    empty strings are recognised), so this is the cheap input for range
+    detection on large sheets.
+    """
+    sheet_part = manifest.sheet_part(sheet_name)
+    if sheet_part is None:
+        raise ExcelProcessingError(f"Sheet '{sheet_name}' is not a worksheet")
+
+    package = open_package(file_path)
+    empty_strings = package.empty_shared_strings()
+    for row_number, cells in _iter_sheet_rows(
+        package, sheet_part, {}, package.epoch, 1, None
+    ):
+        for column, value in cells.items():
+            if isinstance(value, _SharedString):
+                if value.index in empty_strings:
+                    continue
+            elif isinstance(value, str) and not value:
+                continue
+            yield row_number, column
+
+
+def _declared_dimension(
+    package: WorkbookPackage, sheet_part: str
+) -> Optional[Tuple[int, int]]:
+    """Return (rows, columns) of the sheet's declared used range, if any."""
+    with package.open_part(sheet_part) as source:
+        for _, element in ET.iterparse(source, events=("start",)):
+            name = local_name(element.tag)
+            if name == "dimension":
+                bounds = range_boundaries(element.get("ref", "A1"))
+                min_col, min_row, max_col, max_row = (b or 1 for b in bounds)
+                return max_row - min_row + 1, max_col - min_col + 1
+            if name == "sheetData":
+                return None
+    return None
+
+
+def has_phantom_used_range(
+    file_path: Union[str, Path], manifest: WorkbookManifest, sheet_name: str
+) -> bool:
+    """Whether the sheet declares a used range far larger than its cell data.
+
+    Exporters often declare ``A1:XFD1048576`` or format thousands of empty
+    rows. The sheet XML is too small to hold that many cells with values, so
+    comparing the declared area with the part size spots such sheets
+    without reading them.
+    """
+    sheet_part = manifest.sheet_part(sheet_name)
+    if sheet_part is None:
+        return False
+    package = open_package(file_path)
+    dimension = _declared_dimension(package, sheet_part)
+    if dimension is None:
+        return False
+    rows, columns = dimension
+    return rows * columns * _MIN_CELL_BYTES > package.part_size(sheet_part)
+
+
+def read_merged_ranges(
+    file_path: Union[str, Path], manifest: WorkbookManifest, sheet_name: str
+) -> List[str]:
+    """Return the references (``"A1:D1"``) of the sheet's merged areas.
+
+    ``<mergeCells>`` follows the cell data in the worksheet XML, so the part
+    is scanned as raw bytes rather than parsed: no element of the (possibly
+    huge) cell data is built just to reach it.
+    """
+    sheet_part = manifest.sheet_part(sheet_name)
+    if sheet_part is None:
+        raise ExcelProcessingError(f"Sheet '{sheet_name}' is not a worksheet")
+
+    refs: List[str] = []
+    with open_package(file_path).open_part(sheet_part) as source:
+        pending = b""
+        while True:
+            chunk = source.read(_SCAN_CHUNK_BYTES)
+            buffer = pending + chunk
+            # Tags never contain "<": everything before the last one is made
+            # of complete tags
+            cut = len(buffer) if not chunk else buffer.rfind(b"<")
+            if cut < 0:
+                cut = 0
+            refs.extend(
+                match.group(1).decode("ascii")
+                for match in _MERGE_CELL.finditer(buffer, 0, cut)
+            )
+            if not chunk:
+                return refs
+            pending = buffer[cut:]
+
+
+def read_sheet_rows(
+    file_path: Union[str, Path],
+    manifest: WorkbookManifest,
+    sheet_name: str,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+) -> List[List[Any]]:
+    """Stream the raw cell rows of one worksheet.
+
+    Args:
+        file_path: Path to the xlsx package
+        manifest: Manifest of the package (locates sheet, strings and styles)
+        sheet_name: Worksheet to read
+        skiprows: Number of leading sheet rows whose values are not decoded
+        nrows: Number of rows to decode after the skipped ones (None = all)
+
+    Returns:
+        Rows starting at sheet row 1, blank cells as ``""``, in the layout
+        ``rows_to_dataframe`` expects. Values of the skipped rows are
+        placeholders that only carry the row width.
+    """
+    sheet_part = manifest.sheet_part(sheet_name)
+    if sheet_part is None:
+        raise ExcelProcessingError(f"Sheet '{sheet_name}' is not a worksheet")
+
+    # Like pandas, read one row past the window so trimming behaves the same
+    last_row = None if nrows is None else skiprows + nrows + 1
+    package = open_package(file_path)
+
+    rows: List[List[Any]] = []
+    needed: Set[int] = set()
+    for row_number, cells in _iter_sheet_rows(
+        package,
+        sheet_part,
+        package.date_styles(),
+        package.epoch,
+        skiprows + 1,
+        last_row,
+    ):
+        if not cells:
+            # Blank row: only materialised if data follows it
+            continue
+        # Rows missing from the XML (or holding only formatting) are empty
+        rows.extend([] for _ in range(row_number - 1 - len(rows)))
+        row = [cells.get(column, _EMPTY) for column in range(1, max(cells) + 1)]
+        if nrows is None or row_number <= skiprows + nrows:
+            needed.update(v.index for v in row if isinstance(v, _SharedString))
+        rows.append(row)
+
+    strings = package.resolve_shared_strings(needed)
+
+    for row in rows[skiprows:]:
+        for position, value in enumerate(row):
+            if isinstance(value, _SharedString):
+                row[position] = strings.get(value.index, _EMPTY)
+    return rows
+
+
+def read_sheet_window(
+    file_path: Union[str, Path],
+    manifest: WorkbookManifest,
+    sheet_name: str,
+    skiprows: int = 0,
+    nrows: Optional[int] = None,
+) -> pd.DataFrame:
+    """Stream a window of rows from one worksheet into a DataFrame.
+
+    Args:
+        file_path: Path to the xlsx package
+        manifest: Manifest of the package (locates sheet, strings and styles)
+        sheet_name: Worksheet to read
+        skiprows: Number of leading sheet rows to skip
+        nrows: Number of rows to return after the skipped ones (None = all)
+
+    Returns:
+        DataFrame with ``header=None`` layout, equivalent to
+        ``pandas.read_excel(..., header=None, skiprows=skiprows, nrows=nrows)``
+    """
+    rows = read_sheet_rows(file_path, manifest, sheet_name, skiprows, nrows)
+    return rows_to_dataframe(rows, skiprows, nrows)
+
+
+class StreamingExcelReader(ExcelReader):
+    """Excel reader that streams worksheet XML instead of loading the sheet.
+
+    An ``ExcelReader`` pinned to the ``streaming`` engine: ``header=None``
+    reads with optional integer ``skiprows``/``nrows`` are streamed, any
+    other option, and non-xlsx files, fall back to automatic engine choice.
+    """
+
+    def __init__(self, *args, engine: str = "streaming", **kwargs):
+        super().__init__(*args, engine=engine, **kwargs)
@@ -0,0 +1,111 @@
+"""File Fingerprint - Content-based validity checks for cached file data.
+
+Caches of data read from a file must notice when the file changes. Comparing
+modification times alone is unreliable both ways: ``git checkout`` in CI
+resets mtimes of unchanged files (needless misses), while a time-to-live
+throws away entries that are still valid during long builds.
+
+A fingerprint is a digest of the file's content. Hashing a file on every
+lookup would defeat the caches, so the digest is memoized against the file's
+``(size, mtime_ns, inode)``: while those are unchanged the memoized digest is
+returned without reading the file, and only a changed stat triggers a
+streaming re-hash (xxhash when installed, otherwise blake2b). A file whose
+content is unchanged keeps its fingerprint whatever its mtime, so every cache
+keyed by it keeps its entries.
+
+The memo is cleared at the end of each build, so a long-running process
+re-hashes each file at most once per build.
+"""
+
+import hashlib
+import os
+import threading
+from pathlib import Path
+from typing import Dict, Tuple, Union
+
+try:
+    import xxhash
+except ImportError:  # pragma: no cover - optional speed-up
+    xxhash = None
+
+# Bytes hashed per read
+_CHUNK_BYTES = 1024 * 1024
+
+Fingerprint = str
+StatKey = Tuple[int, int, int]
+
+
+def stat_key(file_path: Union[str, Path]) -> StatKey:
+    """Return the ``(size, mtime_ns, inode)`` of a file.
+
+    Cheap, but changes whenever the file is rewritten; only suited to keying
+    resources tied to the file itself, such as open handles.
+    """
+    stat = Path(file_path).stat()
+    return (stat.st_size, stat.st_mtime_ns, stat.st_ino)
+
+
+def content_digest(file_path: Union[str, Path]) -> Fingerprint:
+    """Hash the content of a file, reading it in chunks.
+
+    The digest is prefixed with the algorithm, so digests of different
+    installations (with and without xxhash) never compare equal.
+    """
+    if xxhash is not None:
+        prefix, hasher = "xxh3", xxhash.xxh3_128()
+    else:
+        prefix, hasher = "b2b", hashlib.blake2b(digest_size=16)
+    with open(file_path, "rb") as source:
+        for chunk in iter(lambda: source.read(_CHUNK_BYTES), b""):
+            hasher.update(chunk)
+    return f"{prefix}:{hasher.hexdigest()}"
+
+
+class FingerprintService:
+    """Memoized content fingerprints of files."""
+
+    def __init__(self):
+        self._memo: Dict[Path, Tuple[StatKey, Fingerprint]] = {}
+        self._lock = threading.Lock()
+        self.hashed_files = 0
+
+    def fingerprint(self, file_path: Union[str, Path]) -> Fingerprint:
+        """Return the content fingerprint of a file.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        path = Path(os.path.abspath(file_path))
+        current = stat_key(path)
+        with self._lock:
+            memo = self._memo.get(path)
+            if memo is not None and memo[0] == current:
+                return memo[1]
+
+        digest = content_digest(path)
+        with self._lock:
+            self._memo[path] = (current, digest)
+            self.hashed_files += 1
+        return digest
+
+    def clear(self) -> None:
+        """Forget every memoized fingerprint."""
+        with self._lock:
+            self._memo.clear()
+
+
+_service = FingerprintService()
+
+
+def file_fingerprint(file_path: Union[str, Path]) -> Fingerprint:
+    """Return the content fingerprint of a file from the process-wide service.
+
+    Raises:
+        OSError: If the file cannot be read
+    """
+    return _service.fingerprint(file_path)
+
+
+def clear_fingerprints() -> None:
+    """Forget the memoized fingerprints (at the end of a build)."""
+    _service.clear()
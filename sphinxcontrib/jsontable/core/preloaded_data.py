@@ -0,0 +1,86 @@
+"""Preloaded Data - Sheets parsed before a parallel read.
+
+With ``sphinx-build -j N`` Sphinx forks worker processes for chunks of
+documents, and each worker parsed every workbook its documents reference: a
+sheet used on 30 pages spread across 8 workers was parsed 8 times. Sheets
+referenced by several documents are instead parsed once in the parent
+process before the fork (see ``directives.preload``). Their rows are kept
+here, the workers inherit them copy-on-write, and ``ExcelReader`` serves
+row-window reads from them before looking at snapshots or the file.
+
+Entries are validated against the file's content fingerprint on lookup. The
+rows are shared by every reader and must not be modified; readers copy the
+window they use.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple, Union
+
+from .file_fingerprint import Fingerprint, file_fingerprint
+
+Rows = List[List[Any]]
+
+
+class PreloadedSheets:
+    """Rows of preloaded sheets keyed by file and sheet name."""
+
+    def __init__(self):
+        self._sheets: Dict[Tuple[Path, str], Tuple[Fingerprint, Rows]] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(file_path: Union[str, Path], sheet_name: str) -> Tuple[Path, str]:
+        return (Path(os.path.abspath(file_path)), sheet_name)
+
+    def put(self, file_path: Union[str, Path], sheet_name: str, rows: Rows) -> None:
+        """Keep the rows of a sheet for the file's current contents.
+
+        Raises:
+            OSError: If the file cannot be read
+        """
+        fingerprint = file_fingerprint(file_path)
+        with self._lock:
+            self._sheets[self._key(file_path, sheet_name)] = (fingerprint, rows)
+
+    def rows(self, file_path: Union[str, Path], sheet_name: str) -> Optional[Rows]:
+        """Return the preloaded rows of a sheet, or None.
+
+        Rows preloaded from contents the file no longer has are dropped.
+        """
+        key = self._key(file_path, sheet_name)
+        with self._lock:
+            entry = self._sheets.get(key)
+        if entry is None:
+            return None
+        try:
+            current = file_fingerprint(file_path)
+        except OSError:
+            current = None
+        if current != entry[0]:
+            with self._lock:
+                self._sheets.pop(key, None)
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        """Drop every preloaded sheet."""
+        with self._lock:
+            self._sheets.clear()
+
+    def __len__(self) -> int:
+        return len(self._sheets)
+
+
+_preloaded = PreloadedSheets()
+
+
+def preloaded_sheets() -> PreloadedSheets:
+    """Return the process-wide store of preloaded sheets."""
+    return _preloaded
+
+
+def clear_preloaded_sheets() -> None:
+    """Drop the preloaded sheets (at the end of a build)."""
+    _preloaded.clear()
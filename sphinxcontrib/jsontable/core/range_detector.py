@@ -0,0 +1,263 @@
+"""Range Detector - Find the data islands (tables) of a sheet.
+
+Report sheets rarely hold a single table starting at A1: there are titles,
+notes and several blocks of data separated by empty rows and columns.
+``detect_islands`` finds these blocks from the coordinates of the non-empty
+cells alone, so ``:detect-range:`` works on the sparse row stream of a sheet
+without building a dense DataFrame.
+
+Detection is run-length connected-component labelling in a single pass over
+row-major coordinates: each row is split into runs of adjacent occupied
+cells, a run joins every run of the previous row it touches (including
+diagonally, like Excel's "current region"), and components are tracked with
+a union-find. Only the previous row's runs are kept, so memory is
+proportional to the width of a row, not to the size of the sheet. Islands
+whose bounding boxes overlap (e.g. a note inside a table's frame) are merged,
+so the result is a set of disjoint rectangles.
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from operator import itemgetter
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+
+import numpy as np
+import pandas as pd
+from openpyxl.utils.cell import get_column_letter
+
+from ..errors.excel_errors import RangeValidationError
+
+DETECT_AUTO = "auto"
+DETECT_LARGEST = "largest"
+
+DetectMode = Union[str, int]
+
+
+@dataclass(frozen=True)
+class DataIsland:
+    """Bounding rectangle of one block of connected non-empty cells.
+
+    Rows and columns are 1-based, like Excel.
+    """
+
+    min_row: int
+    min_col: int
+    max_row: int
+    max_col: int
+    cell_count: int
+
+    @property
+    def row_count(self) -> int:
+        """Number of rows spanned by the island."""
+        return self.max_row - self.min_row + 1
+
+    @property
+    def col_count(self) -> int:
+        """Number of columns spanned by the island."""
+        return self.max_col - self.min_col + 1
+
+    @property
+    def range_spec(self) -> str:
+        """Excel range of the island (e.g. ``"B3:F20"``)."""
+        return (
+            f"{get_column_letter(self.min_col)}{self.min_row}:"
+            f"{get_column_letter(self.max_col)}{self.max_row}"
+        )
+
+    def overlaps(self, other: "DataIsland") -> bool:
+        """Whether the bounding rectangles of both islands intersect."""
+        return not (
+            self.max_row < other.min_row
+            or other.max_row < self.min_row
+            or self.max_col < other.min_col
+            or other.max_col < self.min_col
+        )
+
+    def merged_with(self, other: "DataIsland") -> "DataIsland":
+        """Smallest island covering both islands."""
+        return DataIsland(
+            min(self.min_row, other.min_row),
+            min(self.min_col, other.min_col),
+            max(self.max_row, other.max_row),
+            max(self.max_col, other.max_col),
+            self.cell_count + other.cell_count,
+        )
+
+
+class _Components:
+    """Union-find over run labels, tracking each component's bounds."""
+
+    def __init__(self) -> None:
+        self.parent: List[int] = []
+        self.bounds: List[List[int]] = []  # [min_row, min_col, max_row, max_col, n]
+
+    def add(self, row: int, start: int, end: int) -> int:
+        label = len(self.parent)
+        self.parent.append(label)
+        self.bounds.append([row, start, row, end, end - start + 1])
+        return label
+
+    def find(self, label: int) -> int:
+        parent = self.parent
+        while parent[label] != label:
+            parent[label] = parent[parent[label]]
+            label = parent[label]
+        return label
+
+    def union(self, a: int, b: int) -> int:
+        a, b = self.find(a), self.find(b)
+        if a == b:
+            return a
+        if b < a:
+            a, b = b, a
+        self.parent[b] = a
+        box, other = self.bounds[a], self.bounds[b]
+        box[0] = min(box[0], other[0])
+        box[1] = min(box[1], other[1])
+        box[2] = max(box[2], other[2])
+        box[3] = max(box[3], other[3])
+        box[4] += other[4]
+        return a
+
+    def islands(self) -> List[DataIsland]:
+        return [
+            DataIsland(*self.bounds[label])
+            for label in range(len(self.parent))
+            if self.parent[label] == label
+        ]
+
+
+def _row_runs(columns: List[int]) -> Iterator[Tuple[int, int]]:
+    """Split sorted column numbers into runs of adjacent columns."""
+    start = previous = columns[0]
+    for column in columns[1:]:
+        if column != previous + 1:
+            yield start, previous
+            start = column
+        previous = column
+    yield start, previous
+
+
+def _merge_overlapping(islands: List[DataIsland]) -> List[DataIsland]:
+    merged = True
+    while merged:
+        merged = False
+        result: List[DataIsland] = []
+        for island in islands:
+            for index, existing in enumerate(result):
+                if existing.overlaps(island):
+                    result[index] = existing.merged_with(island)
+                    merged = True
+                    break
+            else:
+                result.append(island)
+        islands = result
+    return islands
+
+
+def detect_islands(cells: Iterable[Tuple[int, int]]) -> List[DataIsland]:
+    """Find the blocks of connected non-empty cells of a sheet.
+
+    Args:
+        cells: (row, column) of every non-empty cell, 1-based, in row-major
+            order (the order sheets are stored and streamed in)
+
+    Returns:
+        Disjoint islands in reading order (top to bottom, left to right)
+    """
+    components = _Components()
+    previous_runs: List[Tuple[int, int, int]] = []  # (start, end, label)
+    previous_row = None
+
+    for row, row_cells in groupby(cells, key=itemgetter(0)):
+        adjacent = previous_runs if previous_row == row - 1 else []
+        runs = []
+        cursor = 0
+        for start, end in _row_runs(sorted(column for _, column in row_cells)):
+            label = components.add(row, start, end)
+            # Runs of the previous row are sorted; skip those left of this run
+            while cursor < len(adjacent) and adjacent[cursor][1] < start - 1:
+                cursor += 1
+            probe = cursor
+            while probe < len(adjacent) and adjacent[probe][0] <= end + 1:
+                label = components.union(label, adjacent[probe][2])
+                probe += 1
+            runs.append((start, end, label))
+        previous_runs, previous_row = runs, row
+
+    islands = _merge_overlapping(components.islands())
+    return sorted(islands, key=lambda island: (island.min_row, island.min_col))
+
+
+def dataframe_cells(dataframe: pd.DataFrame) -> Iterator[Tuple[int, int]]:
+    """Yield 1-based (row, column) of the non-empty cells of a sheet DataFrame.
+
+    Fallback for readers without a sparse cell stream (e.g. ``.xls``).
+    """
+    occupied = dataframe.notna().to_numpy() & (dataframe != "").to_numpy()
+    for row, column in zip(*np.nonzero(occupied)):
+        yield int(row) + 1, int(column) + 1
+
+
+def parse_detect_mode(value: Optional[str]) -> DetectMode:
+    """Validate a ``:detect-range:`` value.
+
+    Args:
+        value: ``"auto"`` (also empty), ``"largest"`` or a 1-based island
+            number
+
+    Returns:
+        ``"auto"``, ``"largest"`` or the island number
+
+    Raises:
+        ValueError: If the value is none of these
+    """
+    mode = (value or DETECT_AUTO).strip().lower()
+    if mode in (DETECT_AUTO, DETECT_LARGEST):
+        return mode
+    if mode.isdigit() and int(mode) > 0:
+        return int(mode)
+    raise ValueError(
+        f"Invalid detect mode: {value}. "
+        "Must be 'auto', 'largest' or an island number (1, 2, ...)"
+    )
+
+
+def select_island(islands: List[DataIsland], mode: DetectMode) -> Optional[DataIsland]:
+    """Pick the island to render.
+
+    - ``"auto"``: the largest island that looks like a table, i.e. spans at
+      least two rows and two columns; titles and notes are ignored. Falls
+      back to ``"largest"``.
+    - ``"largest"``: the island with the most non-empty cells.
+    - ``N``: the N-th island in reading order.
+
+    Args:
+        islands: Islands from ``detect_islands``
+        mode: Value returned by ``parse_detect_mode``
+
+    Returns:
+        The selected island, or None for an empty sheet
+
+    Raises:
+        RangeValidationError: If island ``N`` does not exist
+    """
+    if isinstance(mode, int):
+        if mode > len(islands):
+            raise RangeValidationError(
+                str(mode),
+                message=(
+                    f"Cannot select data region {mode}: "
+                    f"the sheet has {len(islands)} data region(s)"
+                ),
+            )
+        return islands[mode - 1]
+
+    if not islands:
+        return None
+    candidates = islands
+    if mode == DETECT_AUTO:
+        tables = [i for i in islands if i.row_count >= 2 and i.col_count >= 2]
+        candidates = tables or islands
+    # Ties go to the island that comes first
+    return max(candidates, key=lambda island: island.cell_count)
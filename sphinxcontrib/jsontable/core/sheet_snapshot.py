@@ -0,0 +1,323 @@
+"""Sheet Snapshots - Columnar copies of parsed sheets for fast reloads.
+
+Parsing worksheet XML dominates the cost of every Excel directive, and it is
+paid again on every build and for every directive reading the same sheet
+with other options. A snapshot stores the raw cell grid of a sheet - as the
+streaming reader decodes it, before any range, header or type inference is
+applied - in a columnar NumPy archive next to the Sphinx doctrees:
+
+- ``kinds``: one type code per cell (row-major, rows padded to one width)
+- one value array per type, holding the values of the cells of that type in
+  row-major order: ``string_codes`` into the ``strings`` table,
+  ``integers``, ``floats``, ``booleans``, ``datetimes``, ``durations`` and
+  ``times`` (microseconds since midnight)
+
+Later reads of the sheet decode the cells they need from the archive and
+assemble them with ``rows_to_dataframe``, the same code path the streaming
+engine uses, so any ``skiprows``/``nrows`` window gives the DataFrame
+``pandas.read_excel`` would. The archive is written uncompressed and its
+arrays are memory-mapped, so a read of the first rows only touches the
+leading part of each array.
+
+Snapshots are keyed by the resolved workbook path, its content fingerprint
+and the sheet name, so a fresh checkout of an unchanged workbook still finds
+its snapshots; saving a sheet removes its snapshots of older versions of the
+workbook. Cells of types the format cannot hold
+(timezone-aware datetimes, integers beyond 64 bits) make the sheet
+unsnapshottable - it is then always read from the workbook.
+"""
+
+import datetime
+import hashlib
+import logging
+import os
+import struct
+import tempfile
+import zipfile
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Union
+
+import numpy as np
+
+from .file_fingerprint import file_fingerprint
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+_EMPTY = ""
+
+# Cell type codes of the ``kinds`` array
+_KIND_EMPTY = 0
+_KIND_STRING = 1
+_KIND_INTEGER = 2
+_KIND_FLOAT = 3
+_KIND_BOOLEAN = 4
+_KIND_DATETIME = 5
+_KIND_DURATION = 6
+_KIND_TIME = 7
+
+_KINDS = {
+    str: _KIND_STRING,
+    int: _KIND_INTEGER,
+    float: _KIND_FLOAT,
+    bool: _KIND_BOOLEAN,
+    datetime.datetime: _KIND_DATETIME,
+    datetime.timedelta: _KIND_DURATION,
+    datetime.time: _KIND_TIME,
+}
+
+
+class UnsupportedCellError(ValueError):
+    """A cell value the snapshot format cannot represent."""
+
+
+def _time_to_microseconds(value: datetime.time) -> int:
+    if value.tzinfo is not None:
+        raise UnsupportedCellError(f"Timezone-aware time {value!r}")
+    return (
+        (value.hour * 60 + value.minute) * 60 + value.second
+    ) * 1_000_000 + value.microsecond
+
+
+def _microseconds_to_time(value: int) -> datetime.time:
+    seconds, microsecond = divmod(int(value), 1_000_000)
+    minutes, second = divmod(seconds, 60)
+    hour, minute = divmod(minutes, 60)
+    return datetime.time(hour, minute, second, microsecond)
+
+
+def encode_rows(rows: List[List[Any]]) -> Dict[str, np.ndarray]:
+    """Encode sheet rows (blank cells as ``""``) into snapshot arrays.
+
+    Raises:
+        UnsupportedCellError: If a cell value cannot be stored
+    """
+    width = max((len(row) for row in rows), default=0)
+    kinds = np.zeros((len(rows), width), dtype=np.int8)
+    values: Dict[int, List[Any]] = {kind: [] for kind in _KINDS.values()}
+    strings: Dict[str, int] = {}
+
+    for row_index, row in enumerate(rows):
+        for column, value in enumerate(row):
+            kind = _KINDS.get(type(value))
+            if kind == _KIND_STRING and value == _EMPTY:
+                continue
+            if kind is None:
+                raise UnsupportedCellError(f"Unsupported cell value {value!r}")
+            if kind == _KIND_STRING:
+                value = strings.setdefault(value, len(strings))
+            elif kind == _KIND_DATETIME and value.tzinfo is not None:
+                raise UnsupportedCellError(f"Timezone-aware datetime {value!r}")
+            elif kind == _KIND_TIME:
+                value = _time_to_microseconds(value)
+            kinds[row_index, column] = kind
+            values[kind].append(value)
+
+    try:
+        integers = np.array(values[_KIND_INTEGER], dtype=np.int64)
+    except OverflowError as e:
+        raise UnsupportedCellError(f"Integer cell out of range: {e}") from e
+
+    return {
+        "format": np.array([FORMAT_VERSION], dtype=np.int64),
+        "kinds": kinds,
+        "strings": np.array(list(strings), dtype=np.str_),
+        "string_codes": np.array(values[_KIND_STRING], dtype=np.int64),
+        "integers": integers,
+        "floats": np.array(values[_KIND_FLOAT], dtype=np.float64),
+        "booleans": np.array(values[_KIND_BOOLEAN], dtype=np.bool_),
+        "datetimes": np.array(values[_KIND_DATETIME], dtype="datetime64[us]"),
+        "durations": np.array(values[_KIND_DURATION], dtype="timedelta64[us]"),
+        "times": np.array(values[_KIND_TIME], dtype=np.int64),
+    }
+
+
+def _decode_strings(arrays, count: int) -> np.ndarray:
+    return arrays["strings"][arrays["string_codes"][:count]].astype(object)
+
+
+def _decode_times(arrays, count: int) -> np.ndarray:
+    times = np.empty(count, dtype=object)
+    times[:] = [_microseconds_to_time(value) for value in arrays["times"][:count]]
+    return times
+
+
+def _decoder(name: str) -> Callable[[Any, int], np.ndarray]:
+    return lambda arrays, count: arrays[name][:count].astype(object)
+
+
+_DECODERS: Dict[int, Callable[[Any, int], np.ndarray]] = {
+    _KIND_STRING: _decode_strings,
+    _KIND_INTEGER: _decoder("integers"),
+    _KIND_FLOAT: _decoder("floats"),
+    _KIND_BOOLEAN: _decoder("booleans"),
+    _KIND_DATETIME: _decoder("datetimes"),
+    _KIND_DURATION: _decoder("durations"),
+    _KIND_TIME: _decode_times,
+}
+
+
+def decode_rows(arrays, stop: Optional[int] = None) -> List[List[Any]]:
+    """Decode snapshot arrays back into sheet rows.
+
+    Args:
+        arrays: Mapping of the arrays written by ``encode_rows``
+        stop: Number of leading rows to decode (None = all)
+
+    Returns:
+        Rows padded to the sheet width with ``""``
+    """
+    kinds = arrays["kinds"][:stop]
+    grid = np.full(kinds.shape, _EMPTY, dtype=object)
+    flat_grid = grid.reshape(-1)
+    flat_kinds = kinds.reshape(-1)
+    for kind, decode in _DECODERS.items():
+        positions = np.flatnonzero(flat_kinds == kind)
+        if positions.size:
+            # Values are stored in row-major order, so the first rows' cells
+            # are a prefix of each value array
+            flat_grid[positions] = decode(arrays, positions.size)
+    return grid.tolist()
+
+
+# Local file header of a zip member: signature, fixed fields, then the
+# name and extra field lengths
+_ZIP_LOCAL_HEADER = struct.Struct("<4s22xHH")
+
+
+def _map_array(source, path: Path, offset: int) -> np.ndarray:
+    """Memory-map the ``.npy`` array stored at ``offset`` of the file."""
+    source.seek(offset)
+    version = np.lib.format.read_magic(source)
+    if version == (1, 0):
+        shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(source)
+    else:
+        shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(source)
+    if dtype.hasobject:
+        raise ValueError("Snapshot arrays cannot hold objects")
+    if not np.prod(shape, dtype=np.int64):
+        return np.empty(shape, dtype=dtype)
+    return np.memmap(
+        path,
+        dtype=dtype,
+        mode="r",
+        offset=source.tell(),
+        shape=shape,
+        order="F" if fortran_order else "C",
+    )
+
+
+def map_arrays(path: Path) -> Dict[str, np.ndarray]:
+    """Memory-map every array of an uncompressed ``.npz`` archive.
+
+    Unlike ``np.load``, which reads a member completely on first access,
+    only the pages of the slices actually used are read.
+
+    Raises:
+        ValueError: If the archive has compressed or non-array members
+    """
+    arrays = {}
+    with zipfile.ZipFile(path) as archive, open(path, "rb") as source:
+        for member in archive.infolist():
+            if member.compress_type != zipfile.ZIP_STORED:
+                raise ValueError(f"Compressed snapshot member {member.filename}")
+            if not member.filename.endswith(".npy"):
+                raise ValueError(f"Unexpected snapshot member {member.filename}")
+            source.seek(member.header_offset)
+            header = source.read(_ZIP_LOCAL_HEADER.size)
+            signature, name_length, extra_length = _ZIP_LOCAL_HEADER.unpack(header)
+            if signature != b"PK\x03\x04":
+                raise ValueError(f"Corrupt snapshot member {member.filename}")
+            offset = (
+                member.header_offset
+                + _ZIP_LOCAL_HEADER.size
+                + name_length
+                + extra_length
+            )
+            arrays[member.filename[:-4]] = _map_array(source, path, offset)
+    return arrays
+
+
+class SheetSnapshotStore:
+    """Directory of sheet snapshots.
+
+    Args:
+        directory: Where snapshots are written (created on first save)
+    """
+
+    def __init__(self, directory: Union[str, Path]):
+        self.directory = Path(directory)
+
+    def _prefix(self, path: Path, sheet_name: str) -> str:
+        key = f"{path}\0{sheet_name}".encode("utf-8", "surrogatepass")
+        return hashlib.sha1(key).hexdigest()[:24]
+
+    def _snapshot_path(self, file_path: Union[str, Path], sheet_name: str) -> Path:
+        path = Path(file_path).resolve()
+        fingerprint = file_fingerprint(path).replace(":", "-")
+        return self.directory / f"{self._prefix(path, sheet_name)}-{fingerprint}.npz"
+
+    def load(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: str,
+        stop: Optional[int] = None,
+    ) -> Optional[List[List[Any]]]:
+        """Return the snapshot rows of a sheet, or None if there is none.
+
+        Args:
+            file_path: Workbook the sheet belongs to
+            sheet_name: Sheet to load
+            stop: Number of leading rows needed (None = all)
+        """
+        try:
+            arrays = map_arrays(self._snapshot_path(file_path, sheet_name))
+            if int(arrays["format"][0]) != FORMAT_VERSION:
+                return None
+            return decode_rows(arrays, stop)
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable sheet snapshot: {e}")
+            return None
+
+    def save(
+        self, file_path: Union[str, Path], sheet_name: str, rows: List[List[Any]]
+    ) -> bool:
+        """Write the snapshot of a sheet.
+
+        Returns:
+            Whether a snapshot was written; sheets holding values the format
+            cannot represent, and unwritable directories, are skipped
+        """
+        try:
+            arrays = encode_rows(rows)
+        except UnsupportedCellError as e:
+            logger.debug(f"Sheet '{sheet_name}' not snapshotted: {e}")
+            return False
+
+        try:
+            snapshot = self._snapshot_path(file_path, sheet_name)
+            self.directory.mkdir(parents=True, exist_ok=True)
+            # Written under a temporary name so parallel readers never see
+            # a partial archive
+            handle, temporary = tempfile.mkstemp(
+                dir=self.directory, prefix=".", suffix=".tmp"
+            )
+            try:
+                with os.fdopen(handle, "wb") as target:
+                    np.savez(target, **arrays)
+                os.replace(temporary, snapshot)
+            except BaseException:
+                os.unlink(temporary)
+                raise
+        except OSError as e:
+            logger.debug(f"Sheet snapshot not written: {e}")
+            return False
+
+        prefix = snapshot.name.split("-", 1)[0]
+        for stale in self.directory.glob(f"{prefix}-*.npz"):
+            if stale != snapshot:
+                stale.unlink(missing_ok=True)
+        return True
@@ -0,0 +1,159 @@
+"""Workbook Handle - Shared, single-open access to Excel workbooks.
+
+Every read of an Excel file used to parse it several times: a full
+``load_workbook`` for validation, another one for the sheet names, and a
+final ``pandas.read_excel`` that unzipped the file yet again. A
+``WorkbookHandle`` opens the workbook once (read-only, so cell data is only
+streamed when a sheet is actually read) and serves the metadata and the sheet
+data from that single parse.
+
+Handles are cached per resolved path and the file's size, mtime and inode,
+so all stages of a directive - and all directives reading the same unchanged
+file - share one open workbook. An open handle belongs to the file it was
+opened from, so rewriting the file (even with the same content) opens a fresh
+handle; the data caches use content fingerprints instead.
+"""
+
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Union
+
+import pandas as pd
+from openpyxl import Workbook, load_workbook
+
+from .file_fingerprint import StatKey, stat_key
+
+# Number of open workbooks kept around between reads
+MAX_OPEN_WORKBOOKS = 8
+
+
+class WorkbookHandle:
+    """One open workbook shared by every stage reading the same file.
+
+    Args:
+        file_path: Path the workbook was opened from
+        fingerprint: File fingerprint at open time
+        workbook: Read-only openpyxl workbook
+    """
+
+    def __init__(self, file_path: Path, fingerprint: StatKey, workbook: Any):
+        self.file_path = file_path
+        self.fingerprint = fingerprint
+        self.workbook = workbook
+        self._excel_file: Optional[pd.ExcelFile] = None
+
+    @property
+    def sheet_names(self) -> List[str]:
+        """Sheet names in workbook order."""
+        return list(self.workbook.sheetnames)
+
+    @property
+    def defined_names(self) -> Any:
+        """Workbook-level defined names."""
+        return self.workbook.defined_names
+
+    def pandas_source(self) -> Union[pd.ExcelFile, Path]:
+        """Return the object to hand to ``pandas.read_excel``.
+
+        The already-open workbook is wrapped in an ``ExcelFile`` so pandas
+        reads sheets from it instead of re-opening the file. Anything that is
+        not a real openpyxl workbook falls back to the file path.
+        """
+        if not isinstance(self.workbook, Workbook):
+            return self.file_path
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self.workbook, engine="openpyxl")
+        return self._excel_file
+
+    def close(self) -> None:
+        """Release the underlying archive."""
+        close = getattr(self.workbook, "close", None)
+        if callable(close):
+            try:
+                close()
+            except Exception:
+                pass
+        self._excel_file = None
+
+
+class WorkbookCache:
+    """Bounded LRU of open workbook handles keyed by (path, fingerprint)."""
+
+    def __init__(
+        self,
+        max_open: int = MAX_OPEN_WORKBOOKS,
+        loader: Optional[Callable[..., Any]] = None,
+    ):
+        self.max_open = max_open
+        self._loader = loader or load_workbook
+        self._handles: OrderedDict[Path, WorkbookHandle] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(
+        self,
+        file_path: Union[str, Path],
+        loader: Optional[Callable[..., Any]] = None,
+    ) -> WorkbookHandle:
+        """Return the handle for ``file_path``, opening it if needed.
+
+        Args:
+            file_path: Path to Excel file
+            loader: Workbook loader overriding the cache default
+
+        Returns:
+            Handle for the current contents of the file
+        """
+        path = Path(file_path).resolve()
+        fingerprint = stat_key(path)
+
+        with self._lock:
+            handle = self._handles.get(path)
+            if handle is not None:
+                if handle.fingerprint == fingerprint:
+                    self._handles.move_to_end(path)
+                    return handle
+                # File changed since it was opened
+                del self._handles[path]
+                handle.close()
+
+        workbook = (loader or self._loader)(
+            path, read_only=True, data_only=True, keep_links=False
+        )
+        handle = WorkbookHandle(path, fingerprint, workbook)
+
+        with self._lock:
+            previous = self._handles.pop(path, None)
+            if previous is not None:
+                previous.close()
+            self._handles[path] = handle
+            while len(self._handles) > self.max_open:
+                _, evicted = self._handles.popitem(last=False)
+                evicted.close()
+        return handle
+
+    def clear(self) -> None:
+        """Close and forget every open workbook."""
+        with self._lock:
+            handles = list(self._handles.values())
+            self._handles.clear()
+        for handle in handles:
+            handle.close()
+
+    def __len__(self) -> int:
+        return len(self._handles)
+
+
+_workbook_cache = WorkbookCache()
+
+
+def open_workbook(
+    file_path: Union[str, Path], loader: Optional[Callable[..., Any]] = None
+) -> WorkbookHandle:
+    """Return the shared handle for ``file_path`` from the process-wide cache."""
+    return _workbook_cache.open(file_path, loader)
+
+
+def clear_workbook_cache() -> None:
+    """Close every shared workbook handle."""
+    _workbook_cache.clear()
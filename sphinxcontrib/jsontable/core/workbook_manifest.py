@@ -0,0 +1,230 @@
+"""Workbook Manifest - Excel metadata straight from the xlsx package.
+
+Sheet names and order, defined names, external-link parts and the presence
+of a VBA project are all recorded in a handful of small parts of the xlsx
+zip: the zip directory itself, ``[Content_Types].xml`` and
+``xl/workbook.xml``. Reading only those parts answers "which sheets are
+there?" and "is this file risky?" without touching any cell data, which keeps
+validation and sheet listing fast even for very large workbooks.
+
+Manifests are cached per resolved path and content fingerprint.
+"""
+
+import posixpath
+import xml.etree.ElementTree as ET
+import zipfile
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple, Union
+
+from .file_fingerprint import Fingerprint, file_fingerprint
+
+CONTENT_TYPES_PART = "[Content_Types].xml"
+DEFAULT_WORKBOOK_PART = "xl/workbook.xml"
+
+_RELATIONSHIPS_NS = (
+    "{http://schemas.openxmlformats.org/officeDocument/2006/relationships}"
+)
+
+# Content types of the main workbook part (regular, template, macro-enabled)
+_WORKBOOK_CONTENT_TYPES = (
+    "spreadsheetml.sheet.main+xml",
+    "spreadsheetml.template.main+xml",
+    "ms-excel.sheet.macroEnabled.main+xml",
+    "ms-excel.template.macroEnabled.main+xml",
+)
+_EXTERNAL_LINK_CONTENT_TYPE = "spreadsheetml.externalLink+xml"
+_VBA_CONTENT_TYPE = "ms-office.vbaProject"
+
+
+class ManifestError(ValueError):
+    """Raised when a file is not a readable xlsx package."""
+
+
+@dataclass(frozen=True)
+class WorkbookManifest:
+    """Workbook metadata read from the package manifest.
+
+    Attributes:
+        sheet_names: Sheet names in workbook order
+        defined_names: Workbook-level defined names as (name, reference)
+        external_link_parts: Package parts holding external workbook links
+        has_vba_project: Whether the package contains a VBA project
+        sheet_parts: Worksheet part of each sheet, parallel to ``sheet_names``
+            (None for sheets that are not worksheets, e.g. chartsheets)
+        shared_strings_part: Package part of the shared string table
+        styles_part: Package part of the stylesheet
+        date1904: Whether dates use the 1904 epoch
+    """
+
+    sheet_names: Tuple[str, ...]
+    defined_names: Tuple[Tuple[str, str], ...]
+    external_link_parts: Tuple[str, ...]
+    has_vba_project: bool
+    sheet_parts: Tuple[Optional[str], ...] = ()
+    shared_strings_part: Optional[str] = None
+    styles_part: Optional[str] = None
+    date1904: bool = False
+
+    def sheet_part(self, sheet_name: str) -> Optional[str]:
+        """Return the worksheet part holding ``sheet_name``'s cells."""
+        try:
+            return self.sheet_parts[self.sheet_names.index(sheet_name)]
+        except (ValueError, IndexError):
+            return None
+
+    @property
+    def has_external_links(self) -> bool:
+        """Whether the workbook links to other workbooks.
+
+        Either the package carries external-link parts or a defined name
+        refers to an external workbook (``[1]Sheet1!A1`` style references).
+        """
+        return bool(self.external_link_parts) or any(
+            reference.lstrip("=").startswith("[") for _, reference in self.defined_names
+        )
+
+
+def _local_name(tag: str) -> str:
+    """Strip the XML namespace (transitional and strict OOXML differ)."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def _parse_content_types(archive: zipfile.ZipFile) -> Tuple[str, List[str], bool]:
+    """Return the workbook part, external-link parts and VBA flag."""
+    workbook_part = DEFAULT_WORKBOOK_PART
+    external_links: List[str] = []
+    has_vba = False
+
+    root = ET.fromstring(archive.read(CONTENT_TYPES_PART))
+    for element in root:
+        if _local_name(element.tag) != "Override":
+            continue
+        part = element.get("PartName", "").lstrip("/")
+        content_type = element.get("ContentType", "")
+        if content_type.endswith(_WORKBOOK_CONTENT_TYPES):
+            workbook_part = part
+        elif content_type.endswith(_EXTERNAL_LINK_CONTENT_TYPE):
+            external_links.append(part)
+        elif _VBA_CONTENT_TYPE in content_type:
+            has_vba = True
+    return workbook_part, external_links, has_vba
+
+
+def _parse_workbook_part(
+    data: bytes,
+) -> Tuple[List[Tuple[str, str]], List[Tuple[str, str]], bool]:
+    """Return (name, relationship id) per sheet, defined names and date1904."""
+    sheets: List[Tuple[str, str]] = []
+    defined_names: List[Tuple[str, str]] = []
+    date1904 = False
+
+    for element in ET.fromstring(data):
+        section = _local_name(element.tag)
+        if section == "sheets":
+            sheets.extend(
+                (sheet.get("name", ""), sheet.get(f"{_RELATIONSHIPS_NS}id", ""))
+                for sheet in element
+                if _local_name(sheet.tag) == "sheet"
+            )
+        elif section == "definedNames":
+            defined_names.extend(
+                (name.get("name", ""), (name.text or "").strip())
+                for name in element
+                if _local_name(name.tag) == "definedName"
+            )
+        elif section == "workbookPr":
+            date1904 = element.get("date1904", "0").lower() in ("1", "true")
+    return sheets, defined_names, date1904
+
+
+def _parse_workbook_relationships(
+    archive: zipfile.ZipFile, workbook_part: str
+) -> Dict[str, Tuple[str, str]]:
+    """Map relationship ids of the workbook part to (type, package part)."""
+    base = posixpath.dirname(workbook_part)
+    rels_part = posixpath.join(
+        base, "_rels", posixpath.basename(workbook_part) + ".rels"
+    )
+    try:
+        root = ET.fromstring(archive.read(rels_part))
+    except KeyError:
+        return {}
+
+    relationships = {}
+    for element in root:
+        target = element.get("Target", "")
+        if element.get("TargetMode") == "External":
+            continue
+        if target.startswith("/"):
+            part = target.lstrip("/")
+        else:
+            part = posixpath.normpath(posixpath.join(base, target))
+        relationships[element.get("Id", "")] = (element.get("Type", ""), part)
+    return relationships
+
+
+@lru_cache(maxsize=64)
+def _read_manifest(path: Path, fingerprint: Fingerprint) -> WorkbookManifest:
+    try:
+        with zipfile.ZipFile(path) as archive:
+            names = archive.namelist()
+            workbook_part, external_links, has_vba = _parse_content_types(archive)
+            sheets, defined_names, date1904 = _parse_workbook_part(
+                archive.read(workbook_part)
+            )
+            relationships = _parse_workbook_relationships(archive, workbook_part)
+    except (zipfile.BadZipFile, KeyError, ET.ParseError) as e:
+        raise ManifestError(f"Not a readable xlsx package: {path}: {e}") from e
+
+    # Fall back to the zip directory for packages with sparse content types
+    if not external_links:
+        external_links = [
+            name for name in names if posixpath.dirname(name) == "xl/externalLinks"
+        ]
+    has_vba = has_vba or any(name.endswith("vbaProject.bin") for name in names)
+
+    sheet_parts = []
+    for _, relationship_id in sheets:
+        rel_type, part = relationships.get(relationship_id, ("", ""))
+        sheet_parts.append(part if rel_type.endswith("/worksheet") else None)
+    related = {
+        rel_type.rsplit("/", 1)[-1]: part for rel_type, part in relationships.values()
+    }
+
+    return WorkbookManifest(
+        sheet_names=tuple(name for name, _ in sheets),
+        defined_names=tuple(defined_names),
+        external_link_parts=tuple(external_links),
+        has_vba_project=has_vba,
+        sheet_parts=tuple(sheet_parts),
+        shared_strings_part=related.get("sharedStrings"),
+        styles_part=related.get("styles"),
+        date1904=date1904,
+    )
+
+
+def read_workbook_manifest(
+    file_path: Union[str, Path], fingerprint: Optional[Fingerprint] = None
+) -> WorkbookManifest:
+    """Read (or reuse) the manifest of an xlsx/xlsm package.
+
+    Args:
+        file_path: Path to Excel file
+        fingerprint: Precomputed file fingerprint, if already known
+
+    Returns:
+        Manifest for the current contents of the file
+
+    Raises:
+        ManifestError: If the file is not an OOXML zip package (e.g. ``.xls``)
+        OSError: If the file cannot be read
+    """
+    path = Path(file_path).resolve()
+    return _read_manifest(path, fingerprint or file_fingerprint(path))
+
+
+def clear_manifest_cache() -> None:
+    """Forget every cached manifest."""
+    _read_manifest.cache_clear()
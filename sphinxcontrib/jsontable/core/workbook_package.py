@@ -0,0 +1,301 @@
+"""Workbook Package - Parse-once access to the parts of an xlsx package.
+
+The streamed reads (row windows, range detection, merged areas) used to
+reopen the zip and re-parse the workbook-global parts - the shared string
+table and the stylesheet - for every sheet they read, so fourteen directives
+rendering the fourteen sheets of one workbook parsed its shared strings
+fourteen times.
+
+A ``WorkbookPackage`` keeps the zip open, so its central directory is read
+once, and parses the global parts lazily, at most once:
+
+- shared strings are parsed incrementally, only as far as the highest index
+  requested so far; a later read needing more continues where the previous
+  one stopped
+- the date formats of the stylesheet are parsed on first use
+
+Packages are cached per resolved path and content fingerprint, like workbook
+handles: every directive reading an unchanged workbook shares one package,
+and modifying the file changes its fingerprint and opens a fresh one.
+"""
+
+import threading
+import xml.etree.ElementTree as ET
+import zipfile
+from collections import OrderedDict
+from pathlib import Path
+from typing import IO, Dict, Iterator, List, Optional, Set, Union
+
+from openpyxl.styles.numbers import (
+    BUILTIN_FORMATS,
+    is_date_format,
+    is_timedelta_format,
+)
+from openpyxl.utils.datetime import CALENDAR_MAC_1904, CALENDAR_WINDOWS_1900
+
+from .file_fingerprint import Fingerprint, file_fingerprint
+from .workbook_handle import MAX_OPEN_WORKBOOKS
+from .workbook_manifest import WorkbookManifest, read_workbook_manifest
+
+
+def local_name(tag: str) -> str:
+    """Strip the namespace of an element tag."""
+    return tag.rsplit("}", 1)[-1]
+
+
+def text_of(element: ET.Element) -> str:
+    """Concatenate the text runs of a string item, ignoring phonetic runs."""
+    parts = []
+    for child in element:
+        name = local_name(child.tag)
+        if name == "t":
+            parts.append(child.text or "")
+        elif name == "r":
+            parts.extend(run.text or "" for run in child if local_name(run.tag) == "t")
+    return "".join(parts)
+
+
+def _parse_date_styles(
+    archive: zipfile.ZipFile, styles_part: Optional[str]
+) -> Dict[int, bool]:
+    """Map cell style indices with date formats to "is a duration" flags.
+
+    Only ``numFmts`` and ``cellXfs`` are read; parsing stops after ``cellXfs``.
+    """
+    if not styles_part:
+        return {}
+
+    custom_formats: Dict[int, str] = {}
+    date_styles: Dict[int, bool] = {}
+    style_index = 0
+    in_cell_xfs = False
+
+    try:
+        source = archive.open(styles_part)
+    except KeyError:
+        return {}
+
+    with source:
+        for event, element in ET.iterparse(source, events=("start", "end")):
+            name = local_name(element.tag)
+            if event == "start":
+                if name == "cellXfs":
+                    in_cell_xfs = True
+                continue
+            if name == "numFmt":
+                custom_formats[int(element.get("numFmtId", "0"))] = element.get(
+                    "formatCode", ""
+                )
+            elif name == "xf" and in_cell_xfs:
+                format_id = int(element.get("numFmtId", "0"))
+                code = custom_formats.get(format_id) or BUILTIN_FORMATS.get(format_id)
+                if code and is_date_format(code):
+                    date_styles[style_index] = is_timedelta_format(code)
+                style_index += 1
+            elif name == "cellXfs":
+                break
+            element.clear()
+    return date_styles
+
+
+class SharedStringTable:
+    """Shared strings of a package, parsed on demand and kept.
+
+    Args:
+        archive: Open package
+        part: Package part of the shared string table (None if absent)
+    """
+
+    def __init__(self, archive: zipfile.ZipFile, part: Optional[str]):
+        self._archive = archive
+        self._part = part
+        self._strings: List[str] = []
+        self._items: Optional[Iterator[ET.Element]] = None
+        self._source: Optional[IO[bytes]] = None
+        self._complete = not part
+        self._empty: Optional[Set[int]] = None
+
+    @property
+    def parsed_count(self) -> int:
+        """Number of strings parsed so far."""
+        return len(self._strings)
+
+    def resolve(self, needed: Set[int]) -> Dict[int, str]:
+        """Return the strings at ``needed``, parsing up to the largest index."""
+        if not needed:
+            return {}
+        self._parse_through(max(needed))
+        strings = self._strings
+        return {index: strings[index] for index in needed if index < len(strings)}
+
+    def empty_indices(self) -> Set[int]:
+        """Indices of the strings without any text (parses the whole table)."""
+        if self._empty is None:
+            self._parse_through(None)
+            self._empty = {i for i, text in enumerate(self._strings) if not text}
+        return self._empty
+
+    def _parse_through(self, last: Optional[int]) -> None:
+        """Parse string items until index ``last`` (None = all) is known."""
+        if self._items is None and not self._complete:
+            try:
+                self._source = self._archive.open(self._part)
+            except KeyError:
+                self._complete = True
+                return
+            self._items = self._iter_items(self._source)
+
+        while not self._complete and (last is None or len(self._strings) <= last):
+            item = next(self._items, None)
+            if item is None:
+                self.close()
+                break
+            self._strings.append(text_of(item))
+            item.clear()
+
+    @staticmethod
+    def _iter_items(source: IO[bytes]) -> Iterator[ET.Element]:
+        for _, element in ET.iterparse(source, events=("end",)):
+            if local_name(element.tag) == "si":
+                yield element
+
+    def close(self) -> None:
+        """Stop parsing; strings parsed so far stay available."""
+        self._complete = True
+        self._items = None
+        if self._source is not None:
+            self._source.close()
+            self._source = None
+
+
+class WorkbookPackage:
+    """One open xlsx package shared by every streamed read of the same file.
+
+    Args:
+        file_path: Resolved path of the package
+        fingerprint: File fingerprint at open time
+        manifest: Manifest of the package
+    """
+
+    def __init__(
+        self, file_path: Path, fingerprint: Fingerprint, manifest: WorkbookManifest
+    ):
+        self.file_path = file_path
+        self.fingerprint = fingerprint
+        self.manifest = manifest
+        self.archive = zipfile.ZipFile(file_path)
+        self._shared_strings = SharedStringTable(
+            self.archive, manifest.shared_strings_part
+        )
+        self._date_styles: Optional[Dict[int, bool]] = None
+        self._lock = threading.Lock()
+
+    @property
+    def epoch(self):
+        """Date epoch of the workbook."""
+        return CALENDAR_MAC_1904 if self.manifest.date1904 else CALENDAR_WINDOWS_1900
+
+    @property
+    def shared_strings(self) -> SharedStringTable:
+        """Shared string table (parsed on demand)."""
+        return self._shared_strings
+
+    def open_part(self, part: str) -> IO[bytes]:
+        """Open a package part for reading."""
+        return self.archive.open(part)
+
+    def part_size(self, part: str) -> int:
+        """Uncompressed size of a package part."""
+        return self.archive.getinfo(part).file_size
+
+    def date_styles(self) -> Dict[int, bool]:
+        """Style indices with date formats (see ``_parse_date_styles``)."""
+        with self._lock:
+            if self._date_styles is None:
+                self._date_styles = _parse_date_styles(
+                    self.archive, self.manifest.styles_part
+                )
+            return self._date_styles
+
+    def resolve_shared_strings(self, needed: Set[int]) -> Dict[int, str]:
+        """Return the shared strings at ``needed``."""
+        with self._lock:
+            return self._shared_strings.resolve(needed)
+
+    def empty_shared_strings(self) -> Set[int]:
+        """Indices of the shared strings without any text."""
+        with self._lock:
+            return self._shared_strings.empty_indices()
+
+    def close(self) -> None:
+        """Release the underlying archive."""
+        with self._lock:
+            self._shared_strings.close()
+        self.archive.close()
+
+
+class PackageCache:
+    """Bounded LRU of open packages keyed by (path, fingerprint)."""
+
+    def __init__(self, max_open: int = MAX_OPEN_WORKBOOKS):
+        self.max_open = max_open
+        self._packages: OrderedDict[Path, WorkbookPackage] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def open(self, file_path: Union[str, Path]) -> WorkbookPackage:
+        """Return the package for ``file_path``, opening it if needed.
+
+        Raises:
+            ManifestError: If the file is not an xlsx package
+            OSError: If the file cannot be read
+        """
+        path = Path(file_path).resolve()
+        fingerprint = file_fingerprint(path)
+
+        with self._lock:
+            package = self._packages.get(path)
+            if package is not None:
+                if package.fingerprint == fingerprint:
+                    self._packages.move_to_end(path)
+                    return package
+                # File changed since it was opened
+                del self._packages[path]
+                package.close()
+
+        package = WorkbookPackage(
+            path, fingerprint, read_workbook_manifest(path, fingerprint)
+        )
+
+        with self._lock:
+            previous = self._packages.pop(path, None)
+            if previous is not None:
+                previous.close()
+            self._packages[path] = package
+            while len(self._packages) > self.max_open:
+                _, evicted = self._packages.popitem(last=False)
+                evicted.close()
+        return package
+
+    def clear(self) -> None:
+        """Close and forget every open package."""
+        with self._lock:
+            packages = list(self._packages.values())
+            self._packages.clear()
+        for package in packages:
+            package.close()
+
+    def __len__(self) -> int:
+        return len(self._packages)
+
+
+_package_cache = PackageCache()
+
+
+def open_package(file_path: Union[str, Path]) -> WorkbookPackage:
+    """Return the shared package for ``file_path`` from the process-wide cache."""
+    return _package_cache.open(file_path)
+
+
+def clear_package_cache() -> None:
+    """Close every shared package."""
+    _package_cache.clear()
@@ -0,0 +1,692 @@
+"""
+aggregation.py
+
+Build-time aggregation for jsontable directives.
+
+Implements the ``:group-by:`` and ``:aggregate:`` options. Rows are grouped by
+one or more columns and summarised with ``count``, ``sum``, ``mean``, ``min``,
+``max`` and ``distinct`` (number of distinct values); only the aggregated
+table is rendered.
+
+Two execution strategies produce the same table:
+    - Vectorized: a pandas ``groupby`` over a DataFrame, used for in-memory
+      data when pandas is installed and for Excel sheets inside the pipeline
+    - Streaming: a single-pass hash aggregation holding one small accumulator
+      per group, used without pandas and for JSON Lines sources, so arbitrarily
+      large files are summarised without being loaded into memory
+
+Examples:
+    >>> aggregation = compile_aggregation("region", "count, sum(amount)")
+    >>> aggregation.aggregate_records(
+    ...     [{"region": "EU", "amount": 3}, {"region": "EU", "amount": 4}]
+    ... )
+    [['region', 'count', 'sum(amount)'], ['EU', 2, 7]]
+"""
+
+from __future__ import annotations
+
+import importlib.util
+import operator
+import re
+from collections.abc import Callable, Iterable, Sequence
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any
+
+from sphinx.util import logging as sphinx_logging
+
+from .json_processor import JsonNumber
+from .validators import JsonTableError
+
+if TYPE_CHECKING:
+    from .row_query import RowPredicate
+
+# Module logger
+logger = sphinx_logging.getLogger(__name__)
+
+__all__ = [
+    "AGGREGATE_FUNCTIONS",
+    "AggregateSpec",
+    "Aggregation",
+    "compile_aggregation",
+    "parse_aggregate_spec",
+    "parse_group_by",
+]
+
+AGGREGATE_FUNCTIONS = ("count", "sum", "mean", "min", "max", "distinct")
+
+# pandas is an optional (Excel) dependency; import it lazily when used
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+
+_AGGREGATE_PATTERN = re.compile(r"^(\w+)\s*(?:\(\s*(.*?)\s*\))?$")
+
+
+def _is_missing(value: Any) -> bool:
+    """Missing cells (None, empty string, NaN) are ignored by aggregates."""
+    return value is None or value == "" or (isinstance(value, float) and value != value)
+
+
+def _as_number(value: Any) -> int | float | None:
+    """Return the numeric value of a cell, or None for non-numeric cells.
+
+    Numbers and numeric strings are numeric; booleans and NaN are not.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, JsonNumber):
+        return value.number
+    if isinstance(value, (int, float)):
+        return None if value != value else value
+    if isinstance(value, str):
+        try:
+            number = float(value)
+        except ValueError:
+            return None
+        return None if number != number else number
+    return None
+
+
+def _normalize_number(value: Any) -> Any:
+    """Render integral floats as integers so both strategies print alike."""
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _hashable(value: Any) -> Any:
+    """Return a hashable stand-in for nested JSON values."""
+    try:
+        hash(value)
+    except TypeError:
+        return repr(value)
+    return value
+
+
+@dataclass(frozen=True)
+class AggregateSpec:
+    """One entry of an ``:aggregate:`` specification, e.g. ``sum(amount)``."""
+
+    function: str
+    column: str | None = None
+
+    @property
+    def label(self) -> str:
+        """Column header of the aggregated value."""
+        return (
+            self.function if self.column is None else f"{self.function}({self.column})"
+        )
+
+
+def parse_group_by(spec: str) -> list[str]:
+    """
+    Parse a ``:group-by:`` option value into column names.
+
+    Raises:
+        JsonTableError: If the specification is empty or names a column twice
+    """
+    columns = [part.strip() for part in (spec or "").split(",")]
+    if not spec or not spec.strip() or not all(columns):
+        raise JsonTableError(
+            f"Invalid :group-by: specification '{spec}': empty column name"
+        )
+    if len(set(columns)) != len(columns):
+        raise JsonTableError(
+            f"Invalid :group-by: specification '{spec}': duplicate column"
+        )
+    return columns
+
+
+def parse_aggregate_spec(spec: str) -> list[AggregateSpec]:
+    """
+    Parse an ``:aggregate:`` option value.
+
+    Entries are separated by commas. ``count`` may be used without a column
+    (number of rows); every other function takes a column name, optionally
+    quoted: ``count, sum(amount), mean("Unit Price")``.
+
+    Raises:
+        JsonTableError: If the specification is empty or malformed
+    """
+    if not spec or not spec.strip():
+        raise JsonTableError("Invalid :aggregate: specification: value is empty")
+
+    specs = []
+    for part in spec.split(","):
+        part = part.strip()
+        match = _AGGREGATE_PATTERN.match(part)
+        if not match:
+            raise JsonTableError(
+                f"Invalid :aggregate: specification '{spec}': cannot parse '{part}'"
+            )
+
+        function, column = match.group(1).lower(), match.group(2)
+        if function not in AGGREGATE_FUNCTIONS:
+            raise JsonTableError(
+                f"Invalid :aggregate: specification '{spec}': unknown function "
+                f"'{function}' (expected one of: {', '.join(AGGREGATE_FUNCTIONS)})"
+            )
+        if column is not None:
+            column = column.strip("\"'").strip()
+        if not column:
+            if function != "count":
+                raise JsonTableError(
+                    f"Invalid :aggregate: specification '{spec}': "
+                    f"'{function}' requires a column"
+                )
+            column = None
+        specs.append(AggregateSpec(function=function, column=column))
+
+    return specs
+
+
+# Streaming accumulators
+
+
+class _Count:
+    __slots__ = ("column", "value")
+
+    def __init__(self, column: str | None) -> None:
+        self.column = column
+        self.value = 0
+
+    def add(self, value: Any) -> None:
+        if self.column is None or not _is_missing(value):
+            self.value += 1
+
+    def result(self) -> Any:
+        return self.value
+
+
+class _Sum:
+    __slots__ = ("count", "total")
+
+    def __init__(self) -> None:
+        self.total: int | float = 0
+        self.count = 0
+
+    def add(self, value: Any) -> None:
+        number = _as_number(value)
+        if number is not None:
+            self.total += number
+            self.count += 1
+
+    def result(self) -> Any:
+        return _normalize_number(self.total) if self.count else None
+
+
+class _Mean(_Sum):
+    __slots__ = ()
+
+    def result(self) -> Any:
+        return self.total / self.count if self.count else None
+
+
+class _Extreme:
+    """Minimum or maximum of a group.
+
+    Values compare numerically when every value of the group is numeric
+    (see ``_as_number``), otherwise by their string form. The first value
+    reaching the extreme is reported as it appears in the data.
+    """
+
+    __slots__ = ("number", "numeric", "sign", "text")
+
+    def __init__(self, sign: int) -> None:
+        self.sign = sign
+        self.numeric = True
+        # (comparison key, cell value) of the extreme so far
+        self.number: tuple[int | float, Any] | None = None
+        self.text: tuple[str, Any] | None = None
+
+    def _beats(self, key: Any, best: tuple[Any, Any] | None) -> bool:
+        if best is None:
+            return True
+        return key > best[0] if self.sign > 0 else key < best[0]
+
+    def add(self, value: Any) -> None:
+        if _is_missing(value):
+            return
+        number = _as_number(value)
+        if number is None:
+            self.numeric = False
+        elif self.numeric and self._beats(number, self.number):
+            self.number = (number, value)
+        text = str(value)
+        if self._beats(text, self.text):
+            self.text = (text, value)
+
+    def result(self) -> Any:
+        best = self.number if self.numeric else self.text
+        return None if best is None else _normalize_number(best[1])
+
+
+class _Distinct:
+    __slots__ = ("values",)
+
+    def __init__(self) -> None:
+        self.values: set[Any] = set()
+
+    def add(self, value: Any) -> None:
+        if not _is_missing(value):
+            self.values.add(_hashable(value))
+
+    def result(self) -> Any:
+        return len(self.values)
+
+
+def _new_accumulator(spec: AggregateSpec) -> Any:
+    if spec.function == "count":
+        return _Count(spec.column)
+    if spec.function == "sum":
+        return _Sum()
+    if spec.function == "mean":
+        return _Mean()
+    if spec.function == "min":
+        return _Extreme(-1)
+    if spec.function == "max":
+        return _Extreme(1)
+    return _Distinct()
+
+
+@dataclass(frozen=True)
+class Aggregation:
+    """
+    Compiled ``:group-by:`` / ``:aggregate:`` options.
+
+    Every ``aggregate_*`` method returns a 2D table whose first row is the
+    header (group columns followed by aggregate labels) and whose remaining
+    rows hold raw values, one per group in order of first appearance.
+
+    Attributes:
+        group_by: Grouping columns (empty for a single summary row)
+        aggregates: Aggregates computed for every group
+    """
+
+    group_by: tuple[str, ...]
+    aggregates: tuple[AggregateSpec, ...]
+
+    @property
+    def header(self) -> list[str]:
+        return [*self.group_by, *(spec.label for spec in self.aggregates)]
+
+    @property
+    def columns(self) -> list[str]:
+        """Every source column referenced by the aggregation."""
+        referenced = list(self.group_by)
+        referenced += [spec.column for spec in self.aggregates if spec.column]
+        return list(dict.fromkeys(referenced))
+
+    def check_columns(self, available: Iterable[str]) -> None:
+        """
+        Ensure every referenced column exists.
+
+        Raises:
+            JsonTableError: If ``:group-by:`` or ``:aggregate:`` names an
+                unknown column
+        """
+        known = set(available)
+        unknown = [column for column in self.columns if column not in known]
+        if unknown:
+            raise JsonTableError(
+                f"Unknown column(s) in :group-by:/:aggregate:: {', '.join(unknown)}. "
+                f"Available columns: {', '.join(sorted(known))}"
+            )
+
+    # Entry point
+
+    def aggregate(
+        self, data: Any, predicate: RowPredicate | None = None
+    ) -> list[list[Any]]:
+        """
+        Aggregate in-memory JSON data (array of objects or 2D array).
+
+        Uses the vectorized strategy when pandas is installed and the
+        streaming strategy otherwise.
+
+        Args:
+            data: Loaded JSON data
+            predicate: Optional ``:where:`` filter applied before grouping
+
+        Raises:
+            JsonTableError: If the data is not an array or a column is unknown
+        """
+        if not isinstance(data, list):
+            raise JsonTableError(
+                ":group-by: and :aggregate: require an array of objects or a 2D array"
+            )
+
+        if data and all(isinstance(row, list) for row in data):
+            header = [str(name).strip() for name in data[0]]
+            positions: dict[str, int] = {}
+            for index, name in enumerate(header):
+                positions.setdefault(name, index)
+            self.check_columns(positions)
+            if predicate is not None:
+                predicate_columns = [c for c in predicate.columns if c not in positions]
+                if predicate_columns:
+                    raise JsonTableError(
+                        f"Unknown column(s) in :where: expression: "
+                        f"{', '.join(predicate_columns)}"
+                    )
+
+            if PANDAS_AVAILABLE:
+                import pandas as pd
+
+                width = len(header)
+                frame = pd.DataFrame(
+                    [(row + [None] * width)[:width] for row in data[1:]],
+                    columns=range(width),
+                    dtype=object,
+                )
+                return self.aggregate_frame(frame, positions, predicate)
+            return self.aggregate_rows(data[1:], positions, predicate)
+
+        if not all(isinstance(row, dict) for row in data):
+            raise JsonTableError(
+                ":group-by: and :aggregate: require an array of objects or a 2D array"
+            )
+
+        if PANDAS_AVAILABLE and data:
+            import pandas as pd
+
+            names = list(dict.fromkeys(key for record in data for key in record))
+            self._check_record_columns(names, predicate)
+            frame = pd.DataFrame.from_records(data, columns=names).astype(object)
+            positions = {name: index for index, name in enumerate(names)}
+            return self.aggregate_frame(frame, positions, predicate)
+        return self.aggregate_records(data, predicate)
+
+    # Streaming strategy
+
+    def aggregate_records(
+        self, records: Iterable[dict[str, Any]], predicate: RowPredicate | None = None
+    ) -> list[list[Any]]:
+        """
+        Aggregate JSON objects in a single pass without materialising them.
+
+        Args:
+            records: Iterable of JSON objects (may be a lazy generator)
+            predicate: Optional ``:where:`` filter applied before grouping
+        """
+        seen_columns: set[str] = set()
+
+        def value_of(record: Any, column: str) -> Any:
+            return record.get(column)
+
+        def rows() -> Iterable[dict[str, Any]]:
+            for record in records:
+                if not isinstance(record, dict):
+                    raise JsonTableError(
+                        ":group-by: and :aggregate: require an array of objects "
+                        "or a 2D array"
+                    )
+                seen_columns.update(record)
+                yield record
+
+        table = self._aggregate_stream(rows(), value_of, predicate)
+        if seen_columns:
+            self._check_record_columns(seen_columns, predicate)
+        return table
+
+    def aggregate_rows(
+        self,
+        rows: Iterable[Sequence[Any]],
+        column_positions: dict[str, int],
+        predicate: RowPredicate | None = None,
+    ) -> list[list[Any]]:
+        """Aggregate positional rows (2D array body) in a single pass."""
+
+        def value_of(row: Any, column: str) -> Any:
+            position = column_positions[column]
+            return row[position] if position < len(row) else None
+
+        return self._aggregate_stream(rows, value_of, predicate)
+
+    def _check_record_columns(
+        self, names: Iterable[str], predicate: RowPredicate | None
+    ) -> None:
+        names = set(names)
+        self.check_columns(names)
+        if predicate is not None:
+            unknown = [column for column in predicate.columns if column not in names]
+            if unknown:
+                raise JsonTableError(
+                    f"Unknown column(s) in :where: expression: {', '.join(unknown)}"
+                )
+
+    def _aggregate_stream(
+        self,
+        rows: Iterable[Any],
+        value_of: Callable[[Any, str], Any],
+        predicate: RowPredicate | None,
+    ) -> list[list[Any]]:
+        groups: dict[tuple[Any, ...], tuple[list[Any], list[Any]]] = {}
+        group_by, aggregates = self.group_by, self.aggregates
+
+        for row in rows:
+            if predicate is not None and not predicate(
+                lambda column, row=row: value_of(row, column)
+            ):
+                continue
+
+            values = [value_of(row, column) for column in group_by]
+            key = tuple(_hashable(value) for value in values)
+            group = groups.get(key)
+            if group is None:
+                group = groups[key] = (
+                    values,
+                    [_new_accumulator(spec) for spec in aggregates],
+                )
+            for spec, accumulator in zip(aggregates, group[1]):
+                accumulator.add(value_of(row, spec.column) if spec.column else None)
+
+        if not groups and not group_by:
+            # Summaries of an empty input still produce one row
+            groups[()] = ([], [_new_accumulator(spec) for spec in aggregates])
+
+        table = [self.header]
+        for values, accumulators in groups.values():
+            table.append([*values, *(acc.result() for acc in accumulators)])
+        logger.debug(f"Streaming aggregation produced {len(table) - 1} group(s)")
+        return table
+
+    # Vectorized strategy
+
+    def aggregate_frame(
+        self,
+        frame: Any,
+        column_positions: dict[str, int],
+        predicate: RowPredicate | None = None,
+    ) -> list[list[Any]]:
+        """
+        Aggregate a pandas DataFrame of data rows with ``groupby``.
+
+        Args:
+            frame: DataFrame holding the data rows (no header row)
+            column_positions: Mapping of column name to positional index
+            predicate: Optional ``:where:`` filter, evaluated vectorized
+        """
+        import pandas as pd
+
+        self.check_columns(column_positions)
+        if predicate is not None:
+            frame = frame[predicate.mask(frame, column_positions).to_numpy()]
+
+        if frame.empty:
+            return self._aggregate_stream([], lambda row, column: None, None)
+
+        columns = {
+            name: frame.iloc[:, column_positions[name]].to_numpy()
+            for name in self.columns
+        }
+        source = pd.DataFrame(columns, index=pd.RangeIndex(len(frame)))
+
+        # Group number of every row, numbered in order of first appearance
+        if self.group_by:
+            codes = source.groupby(
+                list(self.group_by), sort=False, dropna=False
+            ).ngroup()
+        else:
+            codes = pd.Series(0, index=source.index)
+        first_rows = codes.drop_duplicates()
+        group_count = len(first_rows)
+
+        table = [self.header]
+        key_rows = (
+            source.loc[first_rows.index, list(self.group_by)]
+            .to_numpy(dtype=object)
+            .tolist()
+        )
+        value_columns = [
+            self._aggregate_series(source, codes, spec)
+            .reindex(
+                range(group_count),
+                fill_value=0 if spec.function in ("count", "distinct") else None,
+            )
+            .to_numpy(dtype=object)
+            .tolist()
+            for spec in self.aggregates
+        ]
+        for position, key_values in enumerate(key_rows):
+            row = [*key_values, *(values[position] for values in value_columns)]
+            table.append([self._to_python(value) for value in row])
+
+        logger.debug(f"Vectorized aggregation produced {len(table) - 1} group(s)")
+        return table
+
+    @staticmethod
+    def _present(series: Any) -> Any:
+        """Series with empty strings treated as missing."""
+        if series.dtype == object:
+            return series.mask(series.eq(""))
+        return series
+
+    @staticmethod
+    def _numeric(column: Any) -> Any:
+        """Numeric value of every cell, None where ``_as_number`` finds none.
+
+        The values stay Python numbers (object dtype), so pandas adds and
+        compares them exactly as the streaming accumulators do: integers
+        beyond 2**53 are not rounded, floats are summed in row order.
+        """
+        import pandas as pd
+
+        return pd.Series(
+            [_as_number(value) for value in column.tolist()],
+            index=column.index,
+            dtype=object,
+        )
+
+    @staticmethod
+    def _normalized(series: Any) -> Any:
+        """Object Series of results with integral floats as integers.
+
+        Kept as object dtype: a float Series would turn them back into floats.
+        """
+        import pandas as pd
+
+        return pd.Series(
+            [None if value != value else _normalize_number(value) for value in series],
+            index=series.index,
+            dtype=object,
+        )
+
+    @staticmethod
+    def _first_extreme(
+        keys: Any, codes: Any, function: str, approximate: Any = None
+    ) -> Any:
+        """Row label of the first ``min``/``max`` of ``keys`` in each group.
+
+        pandas reduces object numbers as floats, so for numbers the float
+        ``approximate`` keys only narrow the candidates; the exact extreme
+        is picked among them.
+        """
+        import pandas as pd
+
+        candidates = approximate if approximate is not None else keys
+        best = candidates.groupby(codes[candidates.index]).transform(function)
+        keys = keys[candidates.eq(best).to_numpy()]
+
+        beats = operator.gt if function == "max" else operator.lt
+        extremes: dict[Any, tuple[Any, Any]] = {}
+        for label, group, key in zip(keys.index, codes[keys.index], keys):
+            current = extremes.get(group)
+            if current is None or beats(key, current[0]):
+                extremes[group] = (key, label)
+        return pd.Series(
+            [label for _, label in extremes.values()],
+            index=list(extremes),
+            dtype=object,
+        )
+
+    def _aggregate_series(self, source: Any, codes: Any, spec: AggregateSpec) -> Any:
+        """Compute one aggregate per group number (same rules as streaming)."""
+        import pandas as pd
+
+        if spec.function == "count" and spec.column is None:
+            return codes.groupby(codes).size()
+
+        column = self._present(source[spec.column])
+        if spec.function == "count":
+            return column.groupby(codes).count()
+        if spec.function == "distinct":
+            return column.dropna().map(_hashable).groupby(codes).nunique()
+
+        numeric = self._numeric(column)
+        if spec.function == "sum":
+            return self._normalized(numeric.groupby(codes).sum(min_count=1))
+        if spec.function == "mean":
+            # Total over count, as the streaming accumulator divides
+            totals = numeric.groupby(codes).sum(min_count=1)
+            counts = numeric.notna().groupby(codes).sum()
+            return pd.Series(
+                [
+                    None if count == 0 else total / count
+                    for total, count in zip(totals, counts)
+                ],
+                index=totals.index,
+                dtype=object,
+            )
+
+        # min / max: numerically in groups whose present values are all
+        # numeric, by string form in the others
+        present = column.dropna()
+        all_numeric = numeric[present.index].notna().groupby(codes[present.index]).all()
+        texts = self._first_extreme(present.astype(str), codes, spec.function)
+        numbers = numeric.dropna()
+        try:
+            approximate = numbers.astype(float)
+        except OverflowError:
+            approximate = None
+        numbers = self._first_extreme(numbers, codes, spec.function, approximate)
+        rows = texts.mask(all_numeric[texts.index], numbers.reindex(texts.index))
+        values = column.loc[rows.astype(int).to_numpy()]
+        return self._normalized(values.set_axis(rows.index))
+
+    @staticmethod
+    def _to_python(value: Any) -> Any:
+        if value is None:
+            return None
+        try:
+            if value != value:  # NaN / NA
+                return None
+        except (TypeError, ValueError):
+            pass
+        return value.item() if hasattr(value, "item") else value
+
+
+@lru_cache(maxsize=256)
+def compile_aggregation(group_by: str | None, aggregate: str | None) -> Aggregation:
+    """
+    Compile ``:group-by:`` / ``:aggregate:`` option values.
+
+    ``:group-by:`` without ``:aggregate:`` counts the rows of each group, and
+    ``:aggregate:`` without ``:group-by:`` produces a single summary row.
+    """
+    columns = parse_group_by(group_by) if group_by is not None else []
+    specs = (
+        parse_aggregate_spec(aggregate)
+        if aggregate is not None
+        else [AggregateSpec("count")]
+    )
+    return Aggregation(group_by=tuple(columns), aggregates=tuple(specs))
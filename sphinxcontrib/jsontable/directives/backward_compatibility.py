@@ -38,10 +38,14 @@ class JsonDataLoader:
     while internally delegating to the new JsonProcessor implementation.
     """
 
-    def __init__(self, encoding: str = DEFAULT_ENCODING):
+    def __init__(self, encoding: str = DEFAULT_ENCODING, numbers_as_text: bool = False):
         """Initialize with backward-compatible interface."""
         self.encoding = self._validate_encoding(encoding)
-        self._processor = JsonProcessor(base_path=Path.cwd(), encoding=self.encoding)
+        self._processor = JsonProcessor(
+            base_path=Path.cwd(),
+            encoding=self.encoding,
+            numbers_as_text=numbers_as_text,
+        )
 
     def _validate_encoding(self, encoding: str) -> str:
         """Validate encoding and return valid encoding or default."""
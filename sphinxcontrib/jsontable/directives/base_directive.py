@@ -44,6 +44,7 @@ from docutils.parsers.rst import directives
 from sphinx.util import logging as sphinx_logging
 from sphinx.util.docutils import SphinxDirective
 
+from ..trace_events import span
 from .table_builder import TableBuilder
 from .validators import JsonTableError
 
@@ -241,7 +242,8 @@ class BaseDirective(SphinxDirective, ABC):
 
             # Step 2: Load data with comprehensive monitoring (delegated to concrete class)
             logger.debug("Initiating data loading phase")
-            data = self._load_data()
+            with span("load", "directive", directive=directive_name):
+                data = self._load_data()
 
             # Validate loaded data structure
             if data is None:
@@ -263,7 +265,8 @@ class BaseDirective(SphinxDirective, ABC):
 
             # Step 5: Table generation with performance monitoring
             logger.debug("Building table with enterprise table builder")
-            table_nodes = self.table_builder.build_table(validated_data)
+            with span("node build", "directive", directive=directive_name):
+                table_nodes = self.table_builder.build_table(validated_data)
 
             # Step 6: Post-execution validation
             if not table_nodes or not isinstance(table_nodes, list):
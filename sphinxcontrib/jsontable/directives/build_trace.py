@@ -0,0 +1,88 @@
+"""Build Trace - Record a build's jsontable stages as trace-event JSON.
+
+With ``jsontable_trace_file`` set, the spans of every directive run during
+the read phase (``trace_events``) are written to that file, relative to the
+output directory, when the build finishes. Load it in Perfetto or
+chrome://tracing.
+
+The workers of ``sphinx-build -j N`` record their own spans; each worker
+hands them to its environment after every document (``doctree-read``), and
+the main process takes them over when the worker's environment is merged
+(``env-merge-info``). Only documents read in this build are traced, so use
+``-E`` for a timeline of every table.
+"""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docutils import nodes
+from sphinx.util import logging as sphinx_logging
+
+from ..trace_events import (
+    add_events,
+    disable_tracing,
+    enable_tracing,
+    take_events,
+    tracing_enabled,
+    write_trace,
+)
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = sphinx_logging.getLogger(__name__)
+
+# Environment attribute carrying a worker's events to the main process
+TRACE_EVENTS = "jsontable_trace_events"
+
+
+def start_trace(app: Sphinx) -> None:
+    """Start recording spans if a trace file is configured (``builder-inited``)."""
+    if app.config.jsontable_trace_file:
+        enable_tracing()
+
+
+def stash_trace_events(app: Sphinx, doctree: nodes.document) -> None:
+    """Move the spans of a read document to the environment (``doctree-read``)."""
+    if not tracing_enabled():
+        return
+    events = take_events()
+    if events:
+        app.env.__dict__.setdefault(TRACE_EVENTS, []).extend(events)
+
+
+def merge_trace_events(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Take over the spans of a parallel worker (``env-merge-info``)."""
+    add_events(other.__dict__.pop(TRACE_EVENTS, ()))
+
+
+def collect_trace_events(app: Sphinx, env: BuildEnvironment) -> list[str]:
+    """Take back the spans stashed by a serial read (``env-updated``).
+
+    Nothing is left on the environment when it is pickled.
+    """
+    add_events(env.__dict__.pop(TRACE_EVENTS, ()))
+    return []
+
+
+def write_trace_file(app: Sphinx, exception: Exception | None) -> None:
+    """Write the recorded spans and stop tracing (``build-finished``)."""
+    if not tracing_enabled():
+        return
+    events = disable_tracing()
+    path = Path(app.outdir) / app.config.jsontable_trace_file
+    try:
+        write_trace(path, events, main_pid=os.getpid())
+    except OSError as e:
+        logger.warning(f"jsontable: could not write trace file {path}: {e}")
+        return
+    logger.info(f"jsontable: wrote {len(events)} trace events to {path}")
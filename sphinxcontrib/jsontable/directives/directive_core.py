@@ -8,26 +8,39 @@ CLAUDE.md Code Excellence Compliance:
 - SOLID Principles: Interface implementation with delegation pattern
 """
 
+from collections.abc import Callable
 from pathlib import Path
-from typing import Any, ClassVar
+from typing import Any, ClassVar, TypeVar
 
 from docutils import nodes
 from docutils.parsers.rst import directives
 from sphinx.util import logging as sphinx_logging
 
+from ..trace_events import span
+from .aggregation import Aggregation, compile_aggregation
 from .backward_compatibility import (
     DEFAULT_ENCODING,
     DEFAULT_MAX_ROWS,
     NO_JSON_SOURCE_ERROR,
 )
 from .base_directive import BaseDirective
-from .json_processor import JsonProcessor
+from .json_processor import JSON_LINES_SUFFIXES, JsonProcessor
+from .processor_pool import processor_pool
+from .row_query import RowQuery, compile_where, parse_sort_spec
+from .table_builder import (
+    DEFAULT_SEARCH_SAMPLE_ROWS,
+    SEARCHABLE_MODES,
+    TableBuilder,
+    search_exclusion_supported,
+    search_exclusion_warning,
+)
 from .table_converter import TableConverter
 from .validators import JsonTableError, ValidationUtils
 
 # Type definitions
 JsonData = list[Any] | dict[str, Any]
 TableData = list[list[str]]
+T = TypeVar("T")
 
 # Module logger
 logger = sphinx_logging.getLogger(__name__)
@@ -49,6 +62,29 @@ except ImportError:
     logger.debug("Excel support not available")
 
 
+def snapshot_dir(env: Any) -> Path | None:
+    """Directory for sheet snapshots, kept with the build's doctrees."""
+    if getattr(env.config, "jsontable_excel_snapshots", False) is not True:
+        return None
+    doctreedir = getattr(env, "doctreedir", None)
+    if not isinstance(doctreedir, (str, Path)):
+        return None
+    return Path(doctreedir) / "jsontable_snapshots"
+
+
+def _table_shape(table_data: Any) -> dict[str, int]:
+    """Row and column counts of converted table data, for trace arguments."""
+    if not isinstance(table_data, list):
+        return {}
+    cols = max((len(row) for row in table_data if isinstance(row, list)), default=0)
+    return {"rows": len(table_data), "cols": cols}
+
+
+def searchable_mode(argument: str) -> str:
+    """Convert a ``:searchable:`` option value (one of SEARCHABLE_MODES)."""
+    return directives.choice(argument, SEARCHABLE_MODES)
+
+
 class JsonTableDirective(BaseDirective):
     """
     Unified JsonTable directive with 100% backward compatibility.
@@ -78,6 +114,13 @@ class JsonTableDirective(BaseDirective):
         "merge-cells": directives.unchanged,
         "merge-headers": directives.unchanged,
         "json-cache": directives.flag,
+        "where": directives.unchanged_required,
+        "sort-by": directives.unchanged_required,
+        "group-by": directives.unchanged_required,
+        "aggregate": directives.unchanged_required,
+        "numbers-as-text": directives.flag,
+        "smartquotes": directives.flag,
+        "searchable": searchable_mode,
     }
 
     def _initialize_processors(self) -> None:
@@ -100,18 +143,71 @@ class JsonTableDirective(BaseDirective):
             srcdir = "/tmp/test_docs"
         self.base_path = Path(srcdir)
 
+        # String-native decoding keeps JSON numbers as their source lexemes
+        numbers_as_text = "numbers-as-text" in self.options or (
+            getattr(self.env.config, "jsontable_numbers_as_text", False) is True
+        )
+
+        # Cell text is left out of smart quotes unless asked for
+        smartquotes = "smartquotes" in self.options or (
+            getattr(self.env.config, "jsontable_smartquotes", False) is True
+        )
+
+        # Text of the table the HTML search index sees
+        searchable = self.options.get("searchable") or getattr(
+            self.env.config, "jsontable_searchable", "all"
+        )
+        if searchable not in SEARCHABLE_MODES:
+            searchable = "all"
+        # Sphinx releases before the no-search class would index the table
+        explicit = self.options.get("searchable", "all")
+        if explicit != "all" and not search_exclusion_supported():
+            logger.warning(
+                search_exclusion_warning(":searchable:"),
+                location=(self.env.docname, self.lineno),
+            )
+        search_sample_rows = getattr(
+            self.env.config, "jsontable_search_sample_rows", DEFAULT_SEARCH_SAMPLE_ROWS
+        )
+        if not isinstance(search_sample_rows, int):
+            search_sample_rows = DEFAULT_SEARCH_SAMPLE_ROWS
+
+        # Header cells become i18n messages; data cells never do
+        translatable_headers = (
+            getattr(self.env.config, "jsontable_translatable", "none") == "headers"
+        )
+
         logger.debug(
             f"Initializing JsonTableDirective: encoding={encoding}, "
-            f"max_rows={default_max_rows}, base_path={self.base_path}"
+            f"max_rows={default_max_rows}, base_path={self.base_path}, "
+            f"numbers_as_text={numbers_as_text}, smartquotes={smartquotes}, "
+            f"searchable={searchable}, translatable_headers={translatable_headers}"
+        )
+
+        # Processors are shared by directives with the same configuration
+        self.table_builder = self._pooled(
+            TableBuilder,
+            smartquotes=smartquotes,
+            searchable=searchable,
+            search_sample_rows=search_sample_rows,
+            translatable_headers=translatable_headers,
         )
 
         # Initialize JSON processor
-        self.json_processor = JsonProcessor(base_path=self.base_path, encoding=encoding)
+        self.json_processor = self._pooled(
+            JsonProcessor,
+            base_path=self.base_path,
+            encoding=encoding,
+            numbers_as_text=numbers_as_text,
+        )
 
         # Initialize JsonDataLoader for backward compatibility
         from . import JsonDataLoader
 
-        self.json_data_loader = JsonDataLoader(encoding=encoding)
+        loader_options: dict[str, Any] = {"encoding": encoding}
+        if numbers_as_text:
+            loader_options["numbers_as_text"] = True
+        self.json_data_loader = self._pooled(JsonDataLoader, **loader_options)
         # Backward compatibility alias
         self.loader = self.json_data_loader
 
@@ -120,22 +216,116 @@ class JsonTableDirective(BaseDirective):
             try:
                 from .excel_processor import ExcelProcessor
 
-                self.excel_processor = ExcelProcessor(base_path=self.base_path)
-                logger.debug("Excel processor initialized successfully")
+                excel_engine = getattr(
+                    self.env.config, "jsontable_excel_engine", "auto"
+                )
+                if not isinstance(excel_engine, str):
+                    excel_engine = "auto"
+                self.excel_processor = self._pooled(
+                    ExcelProcessor,
+                    base_path=self.base_path,
+                    excel_engine=excel_engine,
+                    snapshot_dir=self._snapshot_dir(),
+                )
+                logger.debug("Excel processor ready")
             except ImportError:
                 self.excel_processor = None
                 logger.warning("Excel processor unavailable despite EXCEL_SUPPORT=True")
         else:
             self.excel_processor = None
 
-        # Initialize table converter
-        self.table_converter = TableConverter(default_max_rows)
+        # Initialize table converter (large arrays may use the process pool)
+        parallel_threshold = getattr(self.env.config, "jsontable_parallel_threshold", 0)
+        if not isinstance(parallel_threshold, int) or parallel_threshold < 0:
+            parallel_threshold = 0
+        parallel_workers = getattr(self.env.config, "jsontable_parallel_workers", None)
+        if not isinstance(parallel_workers, int) or parallel_workers <= 0:
+            parallel_workers = None
+        self.table_converter = self._pooled(
+            TableConverter,
+            max_rows=default_max_rows,
+            parallel_threshold=parallel_threshold,
+            parallel_workers=parallel_workers,
+        )
 
         # Backward compatibility aliases
         self.converter = self.table_converter
         self.builder = self.table_builder
 
-        logger.info("JsonTableDirective processors initialized successfully")
+        logger.debug("JsonTableDirective processors initialized successfully")
+
+    def _pooled(self, factory: Callable[..., T], **options: Any) -> T:
+        """Return ``factory(**options)`` shared across the application's directives."""
+        pool = processor_pool(getattr(self.env, "app", None))
+        if pool is None:
+            return factory(**options)
+        return pool.get(factory, **options)
+
+    def _set_header_source_info(self, table_nodes: list[nodes.table]) -> None:
+        """Give header cells the source info gettext needs to extract them."""
+        for table in table_nodes:
+            for thead in table.findall(nodes.thead):
+                for paragraph in thead.findall(nodes.paragraph):
+                    self.set_source_info(paragraph)
+
+    def _snapshot_dir(self) -> Path | None:
+        """Directory for sheet snapshots, kept with the build's doctrees."""
+        return snapshot_dir(self.env)
+
+    def _is_excel_source(self) -> bool:
+        """Return True when the directive argument names an Excel workbook."""
+        return bool(self.arguments) and Path(self.arguments[0]).suffix.lower() in {
+            ".xlsx",
+            ".xls",
+        }
+
+    def _build_row_query(self) -> RowQuery | None:
+        """Compile :where: and :sort-by: into a row query (None if unused)."""
+        where = self.options.get("where")
+        sort_by = self.options.get("sort-by")
+        if where is None and sort_by is None:
+            return None
+
+        predicate = compile_where(where) if where is not None else None
+        if predicate is not None and (
+            self._is_excel_source() or self._build_aggregation() is not None
+        ):
+            # The filter runs before grouping, or vectorized in the Excel pipeline
+            predicate = None
+
+        sort_keys = parse_sort_spec(sort_by) if sort_by is not None else []
+        # With sorting, :limit: turns the full sort into a top-k selection
+        limit = self.options.get("limit") if sort_keys else None
+
+        query = RowQuery(predicate=predicate, sort_keys=sort_keys, limit=limit)
+        logger.debug(f"Row query compiled: {query}")
+        return query
+
+    def _build_aggregation(self) -> Aggregation | None:
+        """Compile :group-by: and :aggregate: (None if unused)."""
+        group_by = self.options.get("group-by")
+        aggregate = self.options.get("aggregate")
+        if group_by is None and aggregate is None:
+            return None
+        return compile_aggregation(group_by, aggregate)
+
+    def _load_aggregated_data(self, aggregation: Aggregation) -> JsonData:
+        """Load the source and reduce it to the aggregated table."""
+        # The Excel pipeline aggregates the sheet DataFrame itself
+        if self._is_excel_source():
+            return self._load_data()
+
+        where = self.options.get("where")
+        predicate = compile_where(where) if where is not None else None
+
+        # JSON Lines files are aggregated in a single pass without loading them
+        if self.arguments and (
+            Path(self.arguments[0]).suffix.lower() in JSON_LINES_SUFFIXES
+        ):
+            records = self.json_processor.iter_records(self.arguments[0])
+            return aggregation.aggregate_records(records, predicate)
+
+        return aggregation.aggregate(self._load_data(), predicate)
 
     def _load_data(self) -> JsonData:
         """Load data from file argument or inline content."""
@@ -170,8 +360,12 @@ class JsonTableDirective(BaseDirective):
     def _load_json_file(self, file_path: str) -> JsonData:
         """Load JSON data from file using JsonDataLoader for backward compatibility."""
         logger.debug(f"Loading JSON file: {file_path}")
-        # Use JsonDataLoader for backward compatibility and proper path handling
-        return self.loader.load_from_file(file_path, Path(self.env.srcdir))
+        with span("read", "json", file=file_path) as trace:
+            if trace.enabled:
+                path = Path(self.env.srcdir) / file_path
+                trace.set(file_size=path.stat().st_size if path.is_file() else None)
+            # Use JsonDataLoader for backward compatibility and proper path handling
+            return self.loader.load_from_file(file_path, Path(self.env.srcdir))
 
     def _load_excel_data(self, file_path: str) -> JsonData:
         """Load Excel data with complete option compatibility."""
@@ -234,11 +428,28 @@ class JsonTableDirective(BaseDirective):
 
     def run(self) -> list[nodes.Node]:
         """Execute directive using new architecture with original behavior."""
+        with span("jsontable", "directive") as trace:
+            if trace.enabled:
+                trace.set(
+                    docname=getattr(self.env, "docname", None),
+                    source=self.arguments[0] if self.arguments else "<inline>",
+                    line=self.lineno,
+                )
+            return self._run()
+
+    def _run(self) -> list[nodes.Node]:
+        """Load, convert and build the table (or an error node)."""
         try:
             logger.debug("Starting JsonTableDirective execution")
 
-            # Step 1: Load data
-            json_data = self._load_data()
+            # Step 1: Compile row selection options and load data
+            with span("load", "directive"):
+                query = self._build_row_query()
+                aggregation = self._build_aggregation()
+                if aggregation is not None:
+                    json_data = self._load_aggregated_data(aggregation)
+                else:
+                    json_data = self._load_data()
 
             # Step 2: Process directive options
             include_header = "header" in self.options
@@ -249,7 +460,13 @@ class JsonTableDirective(BaseDirective):
             )
 
             # Step 3: Convert to table format
-            table_data = self.table_converter.convert(json_data)
+            with span("convert", "directive") as trace:
+                if query is not None:
+                    table_data = self.table_converter.convert(json_data, query=query)
+                else:
+                    table_data = self.table_converter.convert(json_data)
+                if trace.enabled:
+                    trace.set(**_table_shape(table_data))
 
             # Step 4: Apply directive options to table data
             if limit is not None:
@@ -260,9 +477,14 @@ class JsonTableDirective(BaseDirective):
                     table_data = table_data[:limit]
 
             # Step 5: Build docutils table
-            table_nodes = self.table_builder.build_table(table_data)
-
-            logger.info("JsonTableDirective execution completed successfully")
+            with span("node build", "directive") as trace:
+                if trace.enabled:
+                    trace.set(**_table_shape(table_data))
+                table_nodes = self.table_builder.build_table(table_data)
+                if self.table_builder.translatable_headers is True:
+                    self._set_header_source_info(table_nodes)
+
+            logger.debug("JsonTableDirective execution completed successfully")
             return table_nodes
 
         except (JsonTableError, FileNotFoundError) as e:
@@ -358,6 +580,16 @@ class JsonTableDirective(BaseDirective):
         if "merge-headers" in options:
             processing_config["merge_headers"] = options["merge-headers"]
 
+        # 行フィルタオプション（DataFrame上でベクトル化評価）
+        if "where" in options:
+            processing_config["row_filter"] = compile_where(options["where"])
+
+        # 集計オプション（DataFrame上でgroupby集計）
+        if "group-by" in options or "aggregate" in options:
+            processing_config["aggregation"] = compile_aggregation(
+                options.get("group-by"), options.get("aggregate")
+            )
+
         # パフォーマンスオプション
         if "json-cache" in options:
             processing_config["enable_cache"] = True
@@ -41,27 +41,46 @@ class ExcelProcessor:
         base_path: ベースディレクトリパス（相対パス解決用）
     """
 
-    def __init__(self, base_path: str | Path):
+    CACHE_MAX_ENTRIES = 100  # キャッシュの最大エントリ数
+
+    # キャッシュ指定（ローダーには渡さない）
+    _CACHE_OPTIONS = ("json-cache", "enable_cache")
+
+    def __init__(
+        self,
+        base_path: str | Path,
+        excel_engine: str = "auto",
+        snapshot_dir: str | Path | None = None,
+    ):
         """
         ExcelProcessor の初期化
 
         Args:
             base_path: ベースディレクトリパス
+            excel_engine: シート読み込みエンジン（"auto" で自動選択）
+            snapshot_dir: シートスナップショットの保存先（None で無効）
 
         Raises:
             JsonTableError: Excel対応が利用できない場合
         """
         self.base_path = Path(base_path) if isinstance(base_path, str) else base_path
-        # Enhanced caching system with file modification time tracking
-        self._cache = {}  # Data cache: {cache_key: (data, timestamp, file_mtime)}
-        self._cache_max_size = 100  # Maximum cache entries
-        self._cache_ttl = 300  # Time-to-live in seconds (5 minutes)
 
         try:
             # ExcelDataLoaderFacadeの動的インポートと初期化
+            from ..core.data_cache import LRUCache
             from ..facade.excel_data_loader_facade import ExcelDataLoaderFacade
 
-            self.excel_loader = ExcelDataLoaderFacade()
+            # データキャッシュ: {cache_key: (data, timestamp, fingerprint)}
+            # 推定バイト数で上限管理するLRU（有効性はファイル内容で判定）
+            self._cache = LRUCache(
+                max_entries=self.CACHE_MAX_ENTRIES,
+                sizeof=self._cache_entry_size,
+                name="excel_data",
+            )
+
+            self.excel_loader = ExcelDataLoaderFacade(
+                excel_engine=excel_engine, snapshot_dir=snapshot_dir
+            )
             logger.info(
                 f"ExcelProcessor initialized successfully with base_path: {self.base_path}"
             )
@@ -162,6 +181,8 @@ class ExcelProcessor:
         """ディレクティブオプション名をAPIパラメータ名に変換"""
         converted_options = {}
         for key, value in options.items():
+            if key in self._CACHE_OPTIONS:
+                continue
             if key == "header-row":
                 converted_options["header_row"] = value
             elif key == "skip-rows":
@@ -176,41 +197,28 @@ class ExcelProcessor:
         options_str = str(sorted(options.items()))
         return f"{normalized_path}:{hash(options_str)}"
 
-    def _get_file_modification_time(self, file_path: str) -> float:
-        """Get file modification time safely"""
+    def _get_file_fingerprint(self, file_path: str) -> str:
+        """Get the content fingerprint of the file safely"""
+        from ..core.file_fingerprint import file_fingerprint
+
         try:
-            return Path(file_path).stat().st_mtime
+            return file_fingerprint(file_path)
         except OSError:
-            return 0.0
+            return ""
 
     def _is_cache_valid(self, cache_entry: tuple, file_path: str) -> bool:
-        """Check if cache entry is still valid"""
-        data, cache_timestamp, cached_file_mtime = cache_entry
-        current_time = time.time()
-        current_file_mtime = self._get_file_modification_time(file_path)
+        """Check if cache entry is still valid (file content unchanged)"""
+        data, cache_timestamp, cached_fingerprint = cache_entry
+        return self._get_file_fingerprint(file_path) == cached_fingerprint
 
-        # Check TTL expiration
-        if current_time - cache_timestamp > self._cache_ttl:
-            return False
+    @staticmethod
+    def _cache_entry_size(cache_entry: Any) -> int:
+        """キャッシュエントリの推定バイト数（行数×列数×平均セルサイズ）"""
+        from ..core.data_cache import estimate_size
 
-        # Check file modification
-        if current_file_mtime != cached_file_mtime:
-            return False
-
-        return True
-
-    def _evict_old_cache_entries(self):
-        """Evict old cache entries when cache size limit is reached"""
-        if len(self._cache) >= self._cache_max_size:
-            # Remove oldest entries (simple FIFO for now)
-            oldest_keys = sorted(
-                self._cache.keys(),
-                key=lambda k: self._cache[k][1],  # Sort by timestamp
-            )
-            # Remove oldest 20% of entries
-            remove_count = max(1, len(oldest_keys) // 5)
-            for key in oldest_keys[:remove_count]:
-                del self._cache[key]
+        if isinstance(cache_entry, tuple) and cache_entry:
+            return estimate_size(cache_entry[0])
+        return estimate_size(cache_entry)
 
     def clear_cache(self):
         """Enhanced cache clearing with logging"""
@@ -219,35 +227,53 @@ class ExcelProcessor:
         logger.debug(f"Cache cleared: {cache_size} entries removed")
 
     def _load_with_cache(self, file_path: str, options: dict):
-        """Enhanced cache system with file modification time and TTL"""
+        """Load through the LRU data cache, revalidating against the file content"""
         cache_key = self._generate_cache_key(file_path, options)
-        current_time = time.time()
 
         # Check if valid cache entry exists
-        if cache_key in self._cache:
-            cache_entry = self._cache[cache_key]
+        cache_entry = self._cache.get(cache_key)
+        if cache_entry is not None:
             if self._is_cache_valid(cache_entry, file_path):
                 logger.debug(f"Cache hit for {file_path}")
                 return cache_entry[0]  # Return cached data
-            else:
-                logger.debug(f"Cache invalidated for {file_path}")
-                del self._cache[cache_key]
+            logger.debug(f"Cache invalidated for {file_path}")
+            self._cache.pop(cache_key, None)
 
         # Cache miss or invalid - load data
         logger.debug(f"Cache miss for {file_path}")
+        current_time = time.time()
+        data = self._load_uncached(file_path, options)
 
-        # Evict old entries if necessary
-        self._evict_old_cache_entries()
+        # Store in cache with metadata
+        fingerprint = self._get_file_fingerprint(file_path)
+        self._cache[cache_key] = (data, current_time, fingerprint)
+
+        return data
 
-        # Convert options and load data
+    def _load_uncached(self, file_path: str, options: dict) -> JsonData:
+        """ローダーで読み込み、テーブル行を返す"""
+        # ディレクティブオプション名をAPIパラメータ名に変換
         converted_options = self._convert_directive_options(options)
         result = self.excel_loader.load_from_excel(file_path, **converted_options)
-        data = result.get("data", [])
 
-        # Store in cache with metadata
-        file_mtime = self._get_file_modification_time(file_path)
-        self._cache[cache_key] = (data, current_time, file_mtime)
+        # Check for error result
+        if result.get("error"):
+            error_msg = result.get("error_message", "Unknown error")
+            raise JsonTableError(f"Excel processing error: {error_msg}")
+
+        return self._result_rows(result)
 
+    @staticmethod
+    def _result_rows(result: dict) -> JsonData:
+        """読み込み結果からテーブル行を取り出す（ヘッダー行を先頭に戻す）
+
+        パイプラインは検出したヘッダー行を ``data`` から ``headers`` へ移すため、
+        ``:header:`` で描画できるよう先頭行として戻す。
+        """
+        data = result.get("data", [])
+        headers = result.get("headers")
+        if result.get("has_header") is True and headers and isinstance(data, list):
+            return [list(headers), *data]
         return data
 
     def load_excel_data(self, file_path: str, options: ExcelOptions) -> JsonData:
@@ -342,21 +368,11 @@ class ExcelProcessor:
             validated_options = self._validate_options(options)
 
             # キャッシュ機能使用時
-            if validated_options.get("json-cache", False):
+            if any(validated_options.get(key) for key in self._CACHE_OPTIONS):
                 return self._load_with_cache(file_path, validated_options)
 
-            # ディレクティブオプション名をAPIパラメータ名に変換
-            converted_options = self._convert_directive_options(validated_options)
-
             # 通常の読み込み処理
-            result = self.excel_loader.load_from_excel(file_path, **converted_options)
-
-            # Check for error result
-            if result.get("error"):
-                error_msg = result.get("error_message", "Unknown error")
-                raise JsonTableError(f"Excel processing error: {error_msg}")
-
-            return result.get("data", [])
+            return self._load_uncached(file_path, validated_options)
 
         except Exception as e:
             if isinstance(e, JsonTableError):
@@ -22,6 +22,7 @@ from __future__ import annotations
 
 import json
 import logging
+from collections.abc import Iterator
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Union
 
@@ -36,11 +37,40 @@ JsonData = Union[list[Any], dict[str, Any]]
 # 定数（設定の中央管理）
 DEFAULT_ENCODING = "utf-8"
 EMPTY_CONTENT_ERROR = "No inline JSON content provided"
+# 1行1レコードのJSON Lines形式として扱う拡張子
+JSON_LINES_SUFFIXES = frozenset({".jsonl", ".ndjson"})
 
 # ロガー（デバッグとモニタリング用）
 logger = logging.getLogger(__name__)
 
-__all__ = ["JsonProcessor", "JsonData"]
+__all__ = ["JSON_LINES_SUFFIXES", "JsonNumber", "JsonProcessor", "JsonData"]
+
+
+class JsonNumber(str):
+    """
+    JSON数値をソース上の表記（レクシム）のまま保持する文字列
+
+    文字列ネイティブデコードモードで ``parse_int`` / ``parse_float`` フックとして
+    使用します。セル文字列としてはそのまま出力されるため数値の解析・再整形が
+    不要になり、``1.0e3`` のような表記も保たれます。比較・集計が必要な場合は
+    :attr:`number` で数値を遅延取得します。
+
+    Examples:
+        >>> json.loads('[1.0e3, 42]', parse_float=JsonNumber, parse_int=JsonNumber)
+        ['1.0e3', '42']
+        >>> JsonNumber("1.0e3").number
+        1000.0
+    """
+
+    __slots__ = ()
+
+    @property
+    def number(self) -> int | float:
+        """表記を解析した数値（整数表記はint、それ以外はfloat）"""
+        try:
+            return int(self)
+        except ValueError:
+            return float(self)
 
 
 class JsonProcessor:
@@ -114,16 +144,30 @@ class JsonProcessor:
         - Error Disclosure: セキュリティ情報漏洩防止
     """
 
-    def __init__(self, base_path: Path | None = None, encoding: str = DEFAULT_ENCODING):
+    def __init__(
+        self,
+        base_path: Path | None = None,
+        encoding: str = DEFAULT_ENCODING,
+        numbers_as_text: bool = False,
+    ):
         """
         JsonProcessor の初期化
 
         Args:
             base_path: ベースディレクトリパス（Noneの場合はカレントディレクトリ）
             encoding: 文字エンコーディング
+            numbers_as_text: 数値をint/floatに変換せず、ソース表記のまま
+                :class:`JsonNumber` として保持する（文字列ネイティブデコード）
         """
         self.base_path = base_path or Path.cwd()
         self.encoding = self._validate_encoding(encoding)
+        self.numbers_as_text = numbers_as_text
+        # json.load/loadsに渡すデコードオプション（通常モードでは空）
+        self._decode_options: dict[str, Any] = (
+            {"parse_int": JsonNumber, "parse_float": JsonNumber}
+            if numbers_as_text
+            else {}
+        )
 
     def _validate_encoding(self, encoding: str) -> str:
         """
@@ -239,8 +283,11 @@ class JsonProcessor:
         # Phase 3: 安全なファイル読み込みとJSON解析
         try:
             logger.debug(f"Opening file with encoding: {self.encoding}")
-            with open(file_path, encoding=self.encoding) as f:
-                data = json.load(f)
+            if file_path.suffix.lower() in JSON_LINES_SUFFIXES:
+                data = list(self._iter_json_lines(file_path, source))
+            else:
+                with open(file_path, encoding=self.encoding) as f:
+                    data = json.load(f, **self._decode_options)
 
             # 成功ログとデータ統計
             data_type = "object" if isinstance(data, dict) else "array"
@@ -271,6 +318,52 @@ class JsonProcessor:
                 ValidationUtils.format_error(f"Failed to load {source}", e)
             ) from e
 
+    def iter_records(self, source: str) -> Iterator[Any]:
+        """
+        JSON Linesファイルのレコードを1件ずつ遅延読み込みする
+
+        ファイル全体をメモリに載せずに処理できるため、集計
+        （``:group-by:`` / ``:aggregate:``）のような単一パス処理で
+        巨大なファイルを扱う場合に使用します。
+
+        Args:
+            source: 相対ファイルパス（base_pathからの相対）
+
+        Yields:
+            各行を解析したJSON値（空行はスキップ）
+
+        Raises:
+            JsonTableError: パス検証失敗、JSON解析失敗、エンコーディングエラー
+            FileNotFoundError: ファイルが存在しない場合
+        """
+        file_path = self._validate_file_path(source)
+        ValidationUtils.ensure_file_exists(file_path)
+        logger.debug(f"Streaming JSON Lines records: {file_path}")
+
+        try:
+            yield from self._iter_json_lines(file_path, source)
+        except UnicodeDecodeError as e:
+            raise JsonTableError(
+                ValidationUtils.format_error(f"Failed to load {source}", e)
+            ) from e
+        except json.JSONDecodeError as e:
+            raise JsonTableError(
+                ValidationUtils.format_error(f"Failed to load {source}", e)
+            ) from e
+
+    def _iter_json_lines(self, file_path: Path, source: str) -> Iterator[Any]:
+        """JSON Linesファイルを1行ずつ解析（行番号付きのエラーを送出）"""
+        with open(file_path, encoding=self.encoding) as f:
+            for line_number, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+                try:
+                    yield json.loads(line, **self._decode_options)
+                except json.JSONDecodeError as e:
+                    raise json.JSONDecodeError(
+                        f"{e.msg} (record on line {line_number})", e.doc, e.pos
+                    ) from e
+
     def parse_inline(self, content: list[str]) -> JsonData:
         """
         インラインJSONコンテンツを高速・安全に解析してPythonオブジェクトに変換
@@ -348,7 +441,7 @@ class JsonProcessor:
             logger.debug(f"Text preparation complete, size: {text_size} characters")
 
             # Phase 3: JSON解析実行
-            data = json.loads(json_text)
+            data = json.loads(json_text, **self._decode_options)
 
             # 成功ログと統計情報
             data_type = "object" if isinstance(data, dict) else "array"
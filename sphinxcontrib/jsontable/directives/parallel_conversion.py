@@ -0,0 +1,176 @@
+"""
+parallel_conversion.py
+
+Process-pool conversion of very large object arrays.
+
+Converting JSON objects to table rows is pure Python and runs on a single
+core. Above a configurable row threshold, :class:`TableConverter` splits the
+rows into chunks that are converted by worker processes and reassembled in
+their original order.
+
+One pool is shared by every directive for the whole build: it is created
+lazily on first use and shut down when Sphinx emits ``build-finished``, or
+when the process that started it exits (the forked read workers of
+``sphinx-build -j N`` start their own pools and never see
+``build-finished``). A pool inherited through a fork is never used.
+
+The column schema reaches the workers once, through the executor's
+initializer; tasks carry only rows. Converting a table with other columns
+restarts the workers.
+
+If the pool cannot be used (pickling errors, broken workers) conversion falls
+back to the serial path.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import util as multiprocessing_util
+from typing import Any
+
+from sphinx.util import logging as sphinx_logging
+
+# Module logger
+logger = sphinx_logging.getLogger(__name__)
+
+__all__ = ["ConversionPool", "get_conversion_pool", "shutdown_conversion_pool"]
+
+# Smallest chunk worth the cost of shipping rows to a worker
+MIN_CHUNK_ROWS = 2000
+
+_pool: ConversionPool | None = None
+_pool_lock = threading.Lock()
+
+
+# Column schema of the worker process, set by the executor's initializer
+_worker_schema: tuple[str, ...] = ()
+
+
+def _init_worker(schema: tuple[str, ...]) -> None:
+    """Worker initializer: receive the column schema once."""
+    global _worker_schema
+    _worker_schema = schema
+
+
+def _convert_object_chunk(chunk: list[Any]) -> list[list[str]]:
+    """Worker entry point: convert one chunk of objects to table rows."""
+    from .table_converter import TableConverter
+
+    converter = TableConverter(max_rows=max(len(chunk), 1))
+    return converter._object_rows(chunk, _worker_schema)
+
+
+class ConversionPool:
+    """
+    Lazily started process pool for chunked row conversion.
+
+    Args:
+        workers: Number of worker processes (None uses ``os.cpu_count()``)
+    """
+
+    def __init__(self, workers: int | None = None) -> None:
+        self.workers = max(1, workers or os.cpu_count() or 1)
+        # Process that created the pool; only it may use or stop the executor
+        self.pid = os.getpid()
+        self._executor: ProcessPoolExecutor | None = None
+        self._schema: tuple[str, ...] | None = None
+        self._finalizer: multiprocessing_util.Finalize | None = None
+
+    def _get_executor(self, schema: tuple[str, ...]) -> ProcessPoolExecutor:
+        if self._executor is not None and self._schema != schema:
+            self.shutdown()
+        if self._executor is None:
+            executor = ProcessPoolExecutor(
+                max_workers=self.workers,
+                initializer=_init_worker,
+                initargs=(schema,),
+            )
+            # Runs when this process exits, before multiprocessing joins its
+            # children: forked -j workers never see build-finished. It must
+            # run before the executor's queues are closed (exit priority 10),
+            # or the workers never receive their stop sentinels.
+            self._finalizer = multiprocessing_util.Finalize(
+                None,
+                executor.shutdown,
+                kwargs={"wait": True, "cancel_futures": True},
+                exitpriority=100,
+            )
+            self._executor, self._schema = executor, schema
+            logger.debug(f"Started conversion pool with {self.workers} worker(s)")
+        return self._executor
+
+    def chunk_size(self, row_count: int) -> int:
+        """Rows per task: a few tasks per worker to balance uneven rows."""
+        return max(MIN_CHUNK_ROWS, -(-row_count // (self.workers * 4)))
+
+    def convert_object_rows(
+        self, data: list[Any], keys: list[str]
+    ) -> list[list[str]] | None:
+        """
+        Convert objects to rows in parallel, preserving order.
+
+        Args:
+            data: Objects to convert
+            keys: Column order shared by every chunk
+
+        Returns:
+            Converted rows, or None when the pool is unusable and the caller
+            should convert serially
+        """
+        size = self.chunk_size(len(data))
+        chunks = [data[start : start + size] for start in range(0, len(data), size)]
+        schema = tuple(keys)
+
+        try:
+            executor = self._get_executor(schema)
+            rows: list[list[str]] = []
+            for chunk_rows in executor.map(_convert_object_chunk, chunks):
+                rows.extend(chunk_rows)
+        except Exception as e:
+            logger.warning(
+                f"Parallel table conversion failed, converting serially: {e}"
+            )
+            self.shutdown()
+            return None
+
+        logger.debug(
+            f"Converted {len(data)} rows in {len(chunks)} chunk(s) "
+            f"on {self.workers} worker(s)"
+        )
+        return rows
+
+    def shutdown(self) -> None:
+        """Stop the worker processes (a later conversion starts new ones)."""
+        if self._finalizer is not None:
+            # Calls executor.shutdown() and drops the exit-time registration
+            self._finalizer()
+            self._finalizer = None
+        self._executor = self._schema = None
+
+
+def get_conversion_pool(workers: int | None = None) -> ConversionPool:
+    """Return the build-wide conversion pool, creating it on first use.
+
+    A pool inherited from the parent of a forked process is left alone (its
+    executor belongs to the parent) and replaced by a new one.
+    """
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid != os.getpid():
+            _pool = None
+        if _pool is None or (workers is not None and _pool.workers != workers):
+            if _pool is not None:
+                _pool.shutdown()
+            _pool = ConversionPool(workers)
+        return _pool
+
+
+def shutdown_conversion_pool(*args: Any) -> None:
+    """Shut down the build-wide pool (``build-finished`` event handler)."""
+    global _pool
+    with _pool_lock:
+        if _pool is not None and _pool.pid == os.getpid():
+            _pool.shutdown()
+        _pool = None
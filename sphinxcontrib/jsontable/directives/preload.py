@@ -0,0 +1,213 @@
+"""Preload - Parse shared workbook sheets before a parallel read.
+
+Sphinx forks the workers of ``sphinx-build -j N`` after the
+``env-before-read-docs`` event, and each worker used to parse every workbook
+its documents reference. The handler here scans the sources about to be read
+for ``jsontable`` directives; sheets referenced by at least
+``jsontable_preload_min_docs`` documents are parsed once in the parent
+process, and the forked workers inherit the parsed rows copy-on-write
+(``core.preloaded_data``) instead of parsing the workbook again.
+
+Serial builds are left alone: every sheet is parsed once there anyway, and
+the snapshots and caches serve the repeated reads.
+"""
+
+from __future__ import annotations
+
+import gc
+import re
+import sys
+from collections import Counter
+from collections.abc import Iterator
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, Any
+
+from sphinx.util import logging as sphinx_logging
+
+from .directive_core import EXCEL_SUPPORT, snapshot_dir
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+    from ..core.excel_reader_core import ExcelReader
+
+logger = sphinx_logging.getLogger(__name__)
+
+# Workbooks the streamed reader parses (legacy .xls is not a zip package)
+PRELOAD_SUFFIXES = frozenset({".xlsx", ".xlsm"})
+
+# ``.. jsontable:: source`` (reST) or ```{jsontable} source`` (MyST)
+_DIRECTIVE = re.compile(
+    r"^\s*(?:\.\.\s+jsontable::|(?:`{3,}|:{3,})\{jsontable\})\s*(\S*)"
+)
+_OPTION = re.compile(r"^\s*:([\w-]+):\s*(.*?)\s*$")
+
+# Whether the preloaded objects were moved out of the collector's reach
+_frozen = False
+
+
+@dataclass(frozen=True)
+class SheetReference:
+    """A workbook sheet read by a directive."""
+
+    source: str
+    sheet: str | None = None
+    sheet_index: int = 0
+
+
+def scan_directives(text: str) -> Iterator[tuple[str, dict[str, str]]]:
+    """Yield the source argument and options of each directive in a text.
+
+    Directives without a source argument (inline data) are skipped.
+    """
+    lines = text.splitlines()
+    for number, line in enumerate(lines):
+        match = _DIRECTIVE.match(line)
+        if match is None or not match.group(1):
+            continue
+
+        # The option field list directly follows the directive line
+        options: dict[str, str] = {}
+        for index in range(number + 1, len(lines)):
+            option = _OPTION.match(lines[index])
+            if option is None:
+                break
+            options[option.group(1)] = option.group(2)
+        yield match.group(1), options
+
+
+def scan_sheet_references(text: str) -> Iterator[SheetReference]:
+    """Yield the workbook sheets read by the directives of a source text."""
+    for source, options in scan_directives(text):
+        if Path(source).suffix.lower() not in PRELOAD_SUFFIXES:
+            continue
+        sheet_index = options.get("sheet-index", "")
+        yield SheetReference(
+            source=source,
+            sheet=options.get("sheet") or None,
+            sheet_index=int(sheet_index) if sheet_index.isdigit() else 0,
+        )
+
+
+def resolve_source(srcdir: Path, source: str) -> Path | None:
+    """Resolve a directive argument like ExcelProcessor (None if refused)."""
+    if ".." in source:
+        return None
+    path = Path(source)
+    if not path.is_absolute():
+        path = srcdir / path
+    return path.resolve()
+
+
+def _shared_sheets(
+    reader: ExcelReader, env: BuildEnvironment, docnames: list[str], min_docs: int
+) -> list[tuple[Path, str]]:
+    """Return the sheets read by at least ``min_docs`` of the documents."""
+    srcdir = Path(env.srcdir)
+    encoding = env.config.source_encoding
+    resolved: dict[SheetReference, tuple[Path, str] | None] = {}
+    documents: Counter[tuple[Path, str]] = Counter()
+
+    for docname in docnames:
+        try:
+            text = Path(env.doc2path(docname)).read_text(
+                encoding=encoding, errors="replace"
+            )
+        except OSError:
+            continue
+
+        sheets = set()
+        for reference in scan_sheet_references(text):
+            if reference not in resolved:
+                resolved[reference] = None
+                path = resolve_source(srcdir, reference.source)
+                if path is None:
+                    continue
+                try:
+                    sheet_names = reader.validate_file(path).sheet_names
+                    resolved[reference] = (
+                        path,
+                        reference.sheet or sheet_names[reference.sheet_index],
+                    )
+                except Exception as e:
+                    # The directive reports unreadable sources when it runs
+                    logger.debug(f"Not preloading {reference}: {e}")
+            if resolved[reference] is not None:
+                sheets.add(resolved[reference])
+        documents.update(sheets)
+
+    return [sheet for sheet, count in documents.items() if count >= min_docs]
+
+
+def _preload_sheets(
+    reader: ExcelReader, env: BuildEnvironment, docnames: list[str], min_docs: int
+) -> int:
+    """Parse the shared sheets into the preloaded store.
+
+    Returns:
+        Number of sheets preloaded
+    """
+    from ..core.preloaded_data import preloaded_sheets
+
+    store = preloaded_sheets()
+    count = 0
+    for path, sheet in _shared_sheets(reader, env, docnames, min_docs):
+        try:
+            rows = reader.sheet_rows(path, sheet)
+        except Exception as e:
+            logger.debug(f"Not preloading {path} [{sheet}]: {e}")
+            continue
+        if rows is not None:
+            store.put(path, sheet, rows)
+            count += 1
+    return count
+
+
+def preload_shared_sheets(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Parse sheets shared by several documents before the workers fork.
+
+    ``env-before-read-docs`` event handler; does nothing unless the read can
+    be parallel.
+    """
+    global _frozen
+    min_docs = app.config.jsontable_preload_min_docs
+    if not EXCEL_SUPPORT or min_docs <= 0 or app.parallel <= 1:
+        return
+    if app.config.jsontable_excel_engine not in ("auto", "streaming"):
+        # A pinned engine never reads preloaded rows
+        return
+
+    from ..core.excel_reader_core import ExcelReader
+    from ..core.workbook_handle import clear_workbook_cache
+    from ..core.workbook_package import clear_package_cache
+
+    reader = ExcelReader(snapshot_dir=snapshot_dir(env))
+    try:
+        count = _preload_sheets(reader, env, docnames, min_docs)
+    finally:
+        # Open archives must not reach the workers: they would share the
+        # file offsets of the parent's descriptors
+        clear_workbook_cache()
+        clear_package_cache()
+
+    if count:
+        # Keep the collector of the workers from writing to the inherited
+        # pages of long-lived objects
+        gc.freeze()
+        _frozen = True
+        logger.info(f"jsontable: preloaded {count} shared sheet(s) for parallel read")
+
+
+def release_preloaded_sheets(*args: Any) -> None:
+    """Drop the preloaded sheets (``build-finished`` event handler)."""
+    global _frozen
+    module = sys.modules.get("sphinxcontrib.jsontable.core.preloaded_data")
+    if module is not None:
+        module.clear_preloaded_sheets()
+    if _frozen:
+        gc.unfreeze()
+        _frozen = False
@@ -0,0 +1,85 @@
+"""Processor Pool - Processors shared by the directives of one application.
+
+Docutils instantiates a directive class for every use, so building the
+processing stack per directive (JSON and Excel processors, the converter,
+the Excel facade with its reader, detectors and pipeline) costs more than
+rendering a small inline table. The processors only hold configuration, so
+one instance per distinct configuration serves every directive of a Sphinx
+application; sharing the ExcelProcessor also shares its data cache.
+
+Pools are attached weakly to the application and released at the end of
+each build, so processors never outlive the configuration they were built
+from.
+"""
+
+from __future__ import annotations
+
+import threading
+import weakref
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+
+class ProcessorPool:
+    """Processor instances keyed by their class and constructor arguments."""
+
+    def __init__(self) -> None:
+        self._processors: dict[tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+
+    def get(self, factory: Callable[..., T], **options: Any) -> T:
+        """Return the pooled ``factory(**options)``, constructing it once.
+
+        The options must be hashable; they form the pool key together with
+        the factory.
+        """
+        key = (factory, *sorted(options.items()))
+        with self._lock:
+            processor = self._processors.get(key)
+        if processor is None:
+            processor = factory(**options)
+            with self._lock:
+                processor = self._processors.setdefault(key, processor)
+        return processor
+
+    def clear(self) -> None:
+        """Drop every pooled processor."""
+        with self._lock:
+            self._processors.clear()
+
+    def __len__(self) -> int:
+        return len(self._processors)
+
+
+_pools: weakref.WeakKeyDictionary[Any, ProcessorPool] = weakref.WeakKeyDictionary()
+_pools_lock = threading.Lock()
+
+
+def processor_pool(app: Any) -> ProcessorPool | None:
+    """Return the processor pool of a Sphinx application.
+
+    Returns None when ``app`` cannot key a pool (no application, or an
+    object that is not weakly referenceable); callers then construct their
+    processors directly.
+    """
+    if app is None:
+        return None
+    with _pools_lock:
+        try:
+            pool = _pools.get(app)
+            if pool is None:
+                pool = _pools[app] = ProcessorPool()
+        except TypeError:
+            return None
+    return pool
+
+
+def release_processors(app: Any, *args: Any) -> None:
+    """Drop the processor pool of an application (``build-finished`` handler)."""
+    with _pools_lock:
+        try:
+            _pools.pop(app, None)
+        except TypeError:
+            pass
@@ -0,0 +1,185 @@
+"""Read Order - Spread expensive documents over the chunks of a parallel read.
+
+Sphinx splits the documents of a ``sphinx-build -j N`` read into chunks by
+count, in order, and hands the chunks to the workers as they become free.
+Whichever chunk gets the few pages with huge tables finishes long after the
+others and sets the wall-clock time of the read.
+
+The ``env-before-read-docs`` handler here estimates the cost of every
+document and reorders the list so that Sphinx's chunks carry similar costs:
+
+- a document read in a previous build costs the seconds its read took then
+  (recorded per document in the environment)
+- otherwise it costs a fixed base plus the size of the data files its
+  ``jsontable`` directives reference, weighted by how expensive each format
+  is to parse
+
+Documents are assigned heaviest first to the least loaded chunk that still
+has room (the chunk sizes are Sphinx's own), and the heaviest chunks are
+placed first so that they start first.
+"""
+
+from __future__ import annotations
+
+import heapq
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from docutils import nodes
+from sphinx.util import logging as sphinx_logging
+from sphinx.util.parallel import make_chunks
+
+from .preload import resolve_source, scan_directives
+
+if TYPE_CHECKING:
+    from sphinx.application import Sphinx
+    from sphinx.environment import BuildEnvironment
+
+logger = sphinx_logging.getLogger(__name__)
+
+# Estimated cost of a document without data files, in seconds
+BASE_COST = 0.01
+
+# Estimated parse throughput in bytes per second; workbook XML is compressed
+# and much slower to parse than JSON
+_BYTES_PER_SECOND = {".xlsx": 500_000, ".xlsm": 500_000, ".xls": 500_000}
+_DEFAULT_BYTES_PER_SECOND = 20_000_000
+
+# Environment attribute holding the read time of each document
+READ_TIMES = "jsontable_read_times"
+
+# Start of the read of the documents being read by this process
+_read_started: dict[str, float] = {}
+
+
+def read_times(env: BuildEnvironment) -> dict[str, float]:
+    """Return the recorded read times of the environment's documents."""
+    times = getattr(env, READ_TIMES, None)
+    if times is None:
+        times = {}
+        setattr(env, READ_TIMES, times)
+    return times
+
+
+def start_read_timer(app: Sphinx, docname: str, source: list[str]) -> None:
+    """Note when the read of a document starts (``source-read`` handler)."""
+    _read_started[docname] = time.perf_counter()
+
+
+def record_read_time(app: Sphinx, doctree: nodes.document) -> None:
+    """Record how long a document took to read (``doctree-read`` handler)."""
+    docname = app.env.docname
+    started = _read_started.pop(docname, None)
+    if started is not None:
+        read_times(app.env)[docname] = time.perf_counter() - started
+
+
+def purge_read_time(app: Sphinx, env: BuildEnvironment, docname: str) -> None:
+    """Forget the read time of a removed document (``env-purge-doc``)."""
+    read_times(env).pop(docname, None)
+
+
+def merge_read_times(
+    app: Sphinx,
+    env: BuildEnvironment,
+    docnames: set[str],
+    other: BuildEnvironment,
+) -> None:
+    """Take the read times from a parallel worker (``env-merge-info``)."""
+    other_times = read_times(other)
+    times = read_times(env)
+    for docname in docnames:
+        if docname in other_times:
+            times[docname] = other_times[docname]
+
+
+def estimate_costs(env: BuildEnvironment, docnames: list[str]) -> dict[str, float]:
+    """Estimate the read cost of each document in seconds."""
+    srcdir = Path(env.srcdir)
+    encoding = env.config.source_encoding
+    recorded = read_times(env)
+    file_costs: dict[Path, float] = {}
+    costs: dict[str, float] = {}
+
+    for docname in docnames:
+        if docname in recorded:
+            costs[docname] = recorded[docname]
+            continue
+
+        cost = BASE_COST
+        try:
+            text = Path(env.doc2path(docname)).read_text(
+                encoding=encoding, errors="replace"
+            )
+        except OSError:
+            text = ""
+        for source, _options in scan_directives(text):
+            path = resolve_source(srcdir, source)
+            if path is None:
+                continue
+            if path not in file_costs:
+                try:
+                    size = path.stat().st_size
+                except OSError:
+                    size = 0
+                rate = _BYTES_PER_SECOND.get(
+                    path.suffix.lower(), _DEFAULT_BYTES_PER_SECOND
+                )
+                file_costs[path] = size / rate
+            cost += file_costs[path]
+        costs[docname] = cost
+    return costs
+
+
+def balance_docnames(
+    docnames: list[str], costs: dict[str, float], nproc: int
+) -> list[str]:
+    """Order documents so that Sphinx's read chunks carry similar costs.
+
+    Args:
+        docnames: Documents to read
+        costs: Estimated cost of each document
+        nproc: Number of parallel workers
+
+    Returns:
+        The documents reordered; Sphinx's ``make_chunks`` cuts them into
+        chunks of the same sizes as before, heaviest chunk first
+    """
+    sizes = [len(chunk) for chunk in make_chunks(docnames, nproc)]
+    if len(sizes) <= 1:
+        return list(docnames)
+
+    members: list[list[str]] = [[] for _ in sizes]
+    loads = [0.0] * len(sizes)
+    # (load, chunk index) of the chunks with room left
+    open_chunks = [(0.0, index) for index in range(len(sizes))]
+    for docname in sorted(docnames, key=lambda name: (-costs.get(name, 0.0), name)):
+        load, index = heapq.heappop(open_chunks)
+        members[index].append(docname)
+        loads[index] = load + costs.get(docname, 0.0)
+        if len(members[index]) < sizes[index]:
+            heapq.heappush(open_chunks, (loads[index], index))
+
+    # Chunks of equal size are interchangeable: the heaviest go first
+    by_size: dict[int, list[int]] = {}
+    for index in sorted(range(len(sizes)), key=lambda index: -loads[index]):
+        by_size.setdefault(sizes[index], []).append(index)
+    return [docname for size in sizes for docname in members[by_size[size].pop(0)]]
+
+
+def balance_parallel_read(
+    app: Sphinx, env: BuildEnvironment, docnames: list[str]
+) -> None:
+    """Reorder the documents of a parallel read by estimated cost.
+
+    ``env-before-read-docs`` event handler; the list is reordered in place.
+    """
+    if app.config.jsontable_balance_parallel_read is not True or app.parallel <= 1:
+        return
+    costs = estimate_costs(env, docnames)
+    docnames[:] = balance_docnames(docnames, costs, app.parallel)
+    logger.debug(
+        f"Parallel read balanced over {app.parallel} workers: "
+        f"{sum(costs.values()):.2f}s estimated in total"
+    )
@@ -0,0 +1,553 @@
+"""
+row_query.py
+
+Build-time row selection for jsontable directives.
+
+Provides the small, safe expression language behind the ``:where:`` option and
+the sort specification behind ``:sort-by:``. Expressions are compiled once per
+directive into closures that are evaluated either row by row while the JSON
+data is converted, or vectorized over a pandas DataFrame on the Excel path.
+
+Expression Language:
+    - Column references: bare identifiers (``status``) or ``col("Unit Price")``
+    - Literals: strings, numbers, ``True``/``False``/``None``, lists/tuples
+    - Comparisons: ``==``, ``!=``, ``<``, ``<=``, ``>``, ``>=``, ``in``, ``not in``
+    - Boolean logic: ``and``, ``or``, ``not`` and parentheses
+
+Examples:
+    >>> predicate = RowPredicate('status == "active" and age >= 30')
+    >>> predicate.matches({"status": "active", "age": 42})
+    True
+    >>> parse_sort_spec("-score, name")
+    [SortKey(column='score', descending=True), SortKey(column='name', descending=False)]
+"""
+
+from __future__ import annotations
+
+import ast
+import heapq
+import operator
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass, field
+from functools import cmp_to_key, lru_cache
+from itertools import islice
+from typing import Any
+
+from sphinx.util import logging as sphinx_logging
+
+from .json_processor import JsonNumber
+from .validators import JsonTableError
+
+# Module logger
+logger = sphinx_logging.getLogger(__name__)
+
+__all__ = [
+    "RowPredicate",
+    "RowQuery",
+    "SortKey",
+    "compare_cell_values",
+    "compile_where",
+    "parse_sort_spec",
+]
+
+# Resolves a column name to the raw cell value of one row
+ValueLookup = Callable[[str], Any]
+
+_COMPARISON_OPERATORS: dict[type, Callable[[Any, Any], bool]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+}
+
+_MISSING = object()
+
+
+def _is_number(value: Any) -> bool:
+    """Return True for int/float values (bool is deliberately excluded)."""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _coerce_pair(left: Any, right: Any) -> tuple[Any, Any]:
+    """Align a number and a numeric string so they compare numerically.
+
+    Numbers decoded as source lexemes (:class:`JsonNumber`) compare by value.
+    """
+    if isinstance(left, JsonNumber):
+        left = left.number
+    if isinstance(right, JsonNumber):
+        right = right.number
+    if _is_number(left) and isinstance(right, str):
+        try:
+            return left, float(right)
+        except ValueError:
+            return left, right
+    if isinstance(left, str) and _is_number(right):
+        try:
+            return float(left), right
+        except ValueError:
+            return left, right
+    return left, right
+
+
+def _compare_scalars(op: type, left: Any, right: Any) -> bool:
+    """Compare two cell values; incomparable values never match."""
+    if op is ast.In or op is ast.NotIn:
+        members = right if isinstance(right, (list, tuple)) else [right]
+        found = any(_compare_scalars(ast.Eq, left, member) for member in members)
+        return found if op is ast.In else not found
+
+    if left is None or right is None:
+        if op is ast.Eq:
+            return left is right
+        if op is ast.NotEq:
+            return left is not right
+        return False
+
+    left, right = _coerce_pair(left, right)
+    try:
+        return bool(_COMPARISON_OPERATORS[op](left, right))
+    except TypeError:
+        return False
+
+
+class RowPredicate:
+    """
+    Compiled ``:where:`` expression.
+
+    The expression is parsed with :mod:`ast` in ``eval`` mode and only a small
+    whitelist of node types is accepted, so arbitrary code can never run during
+    a documentation build. Compilation produces a tree of closures which makes
+    per-row evaluation a handful of function calls.
+
+    Args:
+        expression: Source text of the ``:where:`` option
+
+    Raises:
+        JsonTableError: If the expression is empty, malformed or uses
+            unsupported syntax
+    """
+
+    def __init__(self, expression: str) -> None:
+        if not expression or not expression.strip():
+            raise JsonTableError("Invalid :where: expression: expression is empty")
+
+        self.expression = expression.strip()
+        try:
+            tree = ast.parse(self.expression, mode="eval")
+        except SyntaxError as e:
+            raise JsonTableError(
+                f"Invalid :where: expression '{self.expression}': {e.msg}"
+            ) from e
+
+        self._tree = tree.body
+        self.columns: list[str] = []
+        self._evaluate = self._compile(self._tree)
+        logger.debug(
+            f"Compiled :where: expression '{self.expression}' (columns: {self.columns})"
+        )
+
+    def __repr__(self) -> str:
+        return f"RowPredicate({self.expression!r})"
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, RowPredicate) and other.expression == self.expression
+
+    def __hash__(self) -> int:
+        return hash(self.expression)
+
+    def __call__(self, lookup: ValueLookup) -> bool:
+        """Evaluate the predicate against one row."""
+        return bool(self._evaluate(lookup))
+
+    def matches(self, record: dict[str, Any]) -> bool:
+        """Evaluate the predicate against a JSON object."""
+        return self(record.get)
+
+    # Scalar compilation
+
+    def _unsupported(self, node: ast.AST) -> JsonTableError:
+        return JsonTableError(
+            f"Invalid :where: expression '{self.expression}': "
+            f"unsupported syntax {type(node).__name__}"
+        )
+
+    def _column_name(self, node: ast.AST) -> str | None:
+        """Return the column referenced by a Name or ``col("...")`` node."""
+        if isinstance(node, ast.Name):
+            return node.id
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "col"
+            and len(node.args) == 1
+            and not node.keywords
+            and isinstance(node.args[0], ast.Constant)
+            and isinstance(node.args[0].value, str)
+        ):
+            return node.args[0].value
+        return None
+
+    def _literal(self, node: ast.AST) -> Any:
+        """Return the Python value of a literal node or _MISSING."""
+        try:
+            return ast.literal_eval(node)
+        except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+            return _MISSING
+
+    def _compile(self, node: ast.AST) -> Callable[[ValueLookup], Any]:
+        column = self._column_name(node)
+        if column is not None:
+            if column not in self.columns:
+                self.columns.append(column)
+            return lambda lookup: lookup(column)
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self._compile(node.operand)
+            return lambda lookup: not operand(lookup)
+
+        if isinstance(node, (ast.Constant, ast.List, ast.Tuple, ast.UnaryOp)):
+            value = self._literal(node)
+            if value is _MISSING:
+                raise self._unsupported(node)
+            return lambda lookup: value
+
+        if isinstance(node, ast.BoolOp):
+            parts = [self._compile(value) for value in node.values]
+            if isinstance(node.op, ast.And):
+                return lambda lookup: all(part(lookup) for part in parts)
+            return lambda lookup: any(part(lookup) for part in parts)
+
+        if isinstance(node, ast.Compare):
+            return self._compile_compare(node)
+
+        raise self._unsupported(node)
+
+    def _compile_compare(self, node: ast.Compare) -> Callable[[ValueLookup], bool]:
+        operands = [self._compile(node.left)] + [
+            self._compile(comparator) for comparator in node.comparators
+        ]
+        ops = [type(op) for op in node.ops]
+        for op_node, op in zip(node.ops, ops):
+            if op not in _COMPARISON_OPERATORS and op not in (ast.In, ast.NotIn):
+                raise self._unsupported(op_node)
+
+        def evaluate(lookup: ValueLookup) -> bool:
+            left = operands[0](lookup)
+            for op, operand in zip(ops, operands[1:]):
+                right = operand(lookup)
+                if not _compare_scalars(op, left, right):
+                    return False
+                left = right
+            return True
+
+        return evaluate
+
+    # Vectorized evaluation
+
+    def mask(self, frame: Any, column_positions: dict[str, int]) -> Any:
+        """
+        Evaluate the predicate over every row of a DataFrame at once.
+
+        Args:
+            frame: pandas DataFrame holding the data rows (no header row)
+            column_positions: Mapping of column name to positional index
+
+        Returns:
+            Boolean pandas Series aligned with ``frame.index``
+        """
+        import pandas as pd
+
+        missing = [name for name in self.columns if name not in column_positions]
+        if missing:
+            raise JsonTableError(
+                f"Unknown column(s) in :where: expression: {', '.join(missing)}"
+            )
+
+        result = self._vector(self._tree, frame, column_positions)
+        if not isinstance(result, pd.Series):
+            return pd.Series(bool(result), index=frame.index)
+        return result.fillna(False).astype(bool)
+
+    def _vector(self, node: ast.AST, frame: Any, positions: dict[str, int]) -> Any:
+        column = self._column_name(node)
+        if column is not None:
+            return frame.iloc[:, positions[column]]
+
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            return ~self._as_mask(self._vector(node.operand, frame, positions), frame)
+
+        if isinstance(node, ast.BoolOp):
+            masks = [
+                self._as_mask(self._vector(value, frame, positions), frame)
+                for value in node.values
+            ]
+            combined = masks[0]
+            for mask in masks[1:]:
+                combined = (
+                    combined & mask if isinstance(node.op, ast.And) else combined | mask
+                )
+            return combined
+
+        if isinstance(node, ast.Compare):
+            operands = [self._vector(node.left, frame, positions)] + [
+                self._vector(comparator, frame, positions)
+                for comparator in node.comparators
+            ]
+            combined = None
+            for index, op in enumerate(node.ops):
+                mask = self._vector_compare(
+                    type(op), operands[index], operands[index + 1], frame
+                )
+                combined = mask if combined is None else combined & mask
+            return combined
+
+        return self._literal(node)
+
+    @staticmethod
+    def _as_mask(value: Any, frame: Any) -> Any:
+        import pandas as pd
+
+        if isinstance(value, pd.Series):
+            return value.fillna(False).astype(bool)
+        return pd.Series(bool(value), index=frame.index)
+
+    @staticmethod
+    def _vector_compare(op: type, left: Any, right: Any, frame: Any) -> Any:
+        import pandas as pd
+
+        if not isinstance(left, pd.Series) and not isinstance(right, pd.Series):
+            return pd.Series(_compare_scalars(op, left, right), index=frame.index)
+
+        if op is ast.In or op is ast.NotIn:
+            if not isinstance(left, pd.Series):
+                left = pd.Series([left] * len(frame), index=frame.index)
+            members = list(right) if isinstance(right, (list, tuple)) else [right]
+            if members and all(_is_number(member) for member in members):
+                found = pd.to_numeric(left, errors="coerce").isin(members)
+            else:
+                texts = [str(member) for member in members if member is not None]
+                found = left.notna() & left.astype(str).isin(texts)
+                if None in members:
+                    found |= left.isna()
+            return found if op is ast.In else ~found
+
+        if left is None or right is None:
+            series = left if isinstance(left, pd.Series) else right
+            if op is ast.Eq:
+                return series.isna()
+            if op is ast.NotEq:
+                return series.notna()
+            return pd.Series(False, index=frame.index)
+
+        compare = _COMPARISON_OPERATORS[op]
+        if _is_number(left) or _is_number(right):
+            left = (
+                pd.to_numeric(left, errors="coerce")
+                if isinstance(left, pd.Series)
+                else left
+            )
+            right = (
+                pd.to_numeric(right, errors="coerce")
+                if isinstance(right, pd.Series)
+                else right
+            )
+            return compare(left, right).fillna(False).astype(bool)
+
+        # Text (or boolean) comparison: nulls never match
+        valid = pd.Series(True, index=frame.index)
+        if isinstance(left, pd.Series):
+            valid &= left.notna()
+        if isinstance(right, pd.Series):
+            valid &= right.notna()
+        if isinstance(left, bool) or isinstance(right, bool):
+            return (compare(left, right) & valid).astype(bool)
+        left = left.astype(str) if isinstance(left, pd.Series) else str(left)
+        right = right.astype(str) if isinstance(right, pd.Series) else str(right)
+        return (compare(left, right) & valid).astype(bool)
+
+
+@lru_cache(maxsize=256)
+def compile_where(expression: str) -> RowPredicate:
+    """
+    Compile a ``:where:`` expression, reusing earlier compilations.
+
+    Predicates are immutable, so directives that share a filter expression
+    also share its compiled form for the whole build.
+    """
+    return RowPredicate(expression)
+
+
+@dataclass(frozen=True)
+class SortKey:
+    """One column of a ``:sort-by:`` specification."""
+
+    column: str
+    descending: bool = False
+
+
+def parse_sort_spec(spec: str) -> list[SortKey]:
+    """
+    Parse a ``:sort-by:`` option value.
+
+    Columns are separated by commas. A leading ``-`` or a trailing ``desc``
+    sorts that column in descending order; ``asc`` is accepted for symmetry.
+
+    Args:
+        spec: Option value such as ``"-score, name"`` or ``"score desc, name"``
+
+    Returns:
+        Ordered list of sort keys
+
+    Raises:
+        JsonTableError: If the specification is empty or malformed
+    """
+    if not spec or not spec.strip():
+        raise JsonTableError("Invalid :sort-by: specification: value is empty")
+
+    keys = []
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            raise JsonTableError(
+                f"Invalid :sort-by: specification '{spec}': empty column name"
+            )
+
+        descending = False
+        words = part.rsplit(None, 1)
+        if len(words) == 2 and words[1].lower() in ("asc", "desc"):
+            part, descending = words[0].strip(), words[1].lower() == "desc"
+        elif part.startswith("-"):
+            part, descending = part[1:].strip(), True
+
+        if not part:
+            raise JsonTableError(
+                f"Invalid :sort-by: specification '{spec}': empty column name"
+            )
+        keys.append(SortKey(column=part, descending=descending))
+
+    return keys
+
+
+def compare_cell_values(left: Any, right: Any) -> int:
+    """Three-way comparison of raw cell values that tolerates mixed types.
+
+    Numbers (and numeric strings compared with numbers) compare numerically,
+    everything else compares by its string form.
+    """
+    if _is_number(left) and _is_number(right):
+        return (left > right) - (left < right)
+    left, right = _coerce_pair(left, right)
+    if _is_number(left) and _is_number(right):
+        return (left > right) - (left < right)
+    left_text, right_text = str(left), str(right)
+    return (left_text > right_text) - (left_text < right_text)
+
+
+@dataclass
+class RowQuery:
+    """
+    Row selection applied while converting data to a table.
+
+    Combines an optional compiled predicate, an ordered list of sort keys and
+    an optional row limit. When both sort keys and a limit are present, a
+    heap-based top-k selection is used instead of sorting every row.
+
+    Attributes:
+        predicate: Compiled ``:where:`` expression, or None
+        sort_keys: Parsed ``:sort-by:`` columns (empty for source order)
+        limit: Maximum number of rows to keep, or None
+    """
+
+    predicate: RowPredicate | None = None
+    sort_keys: list[SortKey] = field(default_factory=list)
+    limit: int | None = None
+
+    @property
+    def is_empty(self) -> bool:
+        """True when the query would return rows unchanged."""
+        return self.predicate is None and not self.sort_keys and self.limit is None
+
+    def without_predicate(self) -> RowQuery:
+        """Return a copy of this query whose filter has already been applied."""
+        return RowQuery(predicate=None, sort_keys=self.sort_keys, limit=self.limit)
+
+    def check_columns(self, available: Iterable[str]) -> None:
+        """
+        Ensure every column referenced by the query exists.
+
+        Raises:
+            JsonTableError: If ``:where:`` or ``:sort-by:`` names an unknown column
+        """
+        known = set(available)
+        referenced = list(self.predicate.columns) if self.predicate else []
+        referenced += [sort_key.column for sort_key in self.sort_keys]
+        unknown = [
+            column for column in dict.fromkeys(referenced) if column not in known
+        ]
+        if unknown:
+            raise JsonTableError(
+                f"Unknown column(s) in :where:/:sort-by:: {', '.join(unknown)}. "
+                f"Available columns: {', '.join(sorted(known))}"
+            )
+
+    def select(
+        self, rows: Iterable[Any], value_of: Callable[[Any, str], Any]
+    ) -> list[Any]:
+        """
+        Filter, order and truncate rows.
+
+        Args:
+            rows: Source rows in their original order
+            value_of: Returns the raw value of a named column for one row,
+                or None when the row has no such column
+
+        Returns:
+            Selected rows
+        """
+        selected: Iterable[Any] = rows
+        if self.predicate is not None:
+            predicate = self.predicate
+            selected = (
+                row
+                for row in selected
+                if predicate(lambda column, row=row: value_of(row, column))
+            )
+
+        if self.sort_keys:
+            key = cmp_to_key(self._row_comparator(value_of))
+            if self.limit is not None:
+                # Top-k: O(n log k) instead of sorting every row
+                return heapq.nsmallest(self.limit, selected, key=key)
+            return sorted(selected, key=key)
+
+        if self.limit is not None:
+            return list(islice(selected, self.limit))
+        return list(selected)
+
+    def _row_comparator(
+        self, value_of: Callable[[Any, str], Any]
+    ) -> Callable[[Any, Any], int]:
+        sort_keys = self.sort_keys
+
+        def compare(left_row: Any, right_row: Any) -> int:
+            for sort_key in sort_keys:
+                left = value_of(left_row, sort_key.column)
+                right = value_of(right_row, sort_key.column)
+                left_missing = left is None or left == ""
+                right_missing = right is None or right == ""
+
+                # Missing values sort last in either direction
+                if left_missing or right_missing:
+                    if left_missing and right_missing:
+                        continue
+                    return 1 if left_missing else -1
+
+                result = compare_cell_values(left, right)
+                if result:
+                    return -result if sort_key.descending else result
+            return 0
+
+        return compare
@@ -9,6 +9,8 @@ supporting complex table structures, robust error handling, and optimal memory u
 
 Classes:
     TableBuilder: Main table generation class with docutils integration
+    cell_paragraph: Paragraph node of a table cell, skipped by i18n
+    literal_cell_paragraph: Cell paragraph also skipped by SmartQuotes
 
 Type Definitions:
     TableData: 2D list structure for table content representation
@@ -26,6 +28,9 @@ Security:
 
 from __future__ import annotations
 
+from typing import Any
+
+import sphinx
 from docutils import nodes
 from sphinx.util import logging as sphinx_logging
 
@@ -36,10 +41,60 @@ TableData = list[list[str]]
 DEFAULT_MAX_ROWS = 10000
 DEFAULT_ENCODING = "utf-8"
 
+# What text of a table reaches the HTML search index: every cell, the header
+# and the first rows of the body, the header only, or nothing
+SEARCHABLE_MODES = ("all", "sample", "headers", "none")
+DEFAULT_SEARCH_SAMPLE_ROWS = 10
+
+# Class Sphinx's search indexer skips, subtree included
+NO_SEARCH_CLASS = "no-search"
+
+# First Sphinx release whose search indexer honors NO_SEARCH_CLASS
+NO_SEARCH_MIN_SPHINX = (7, 3)
+
 # Create module-level logger for comprehensive debugging
 logger = sphinx_logging.getLogger(__name__)
 
 
+def search_exclusion_supported() -> bool:
+    """Whether the running Sphinx leaves NO_SEARCH_CLASS nodes unindexed."""
+    return tuple(sphinx.version_info[:2]) >= NO_SEARCH_MIN_SPHINX
+
+
+def search_exclusion_warning(setting: str) -> str:
+    """Message for a ``searchable`` setting the running Sphinx ignores."""
+    minimum = ".".join(map(str, NO_SEARCH_MIN_SPHINX))
+    return (
+        f"jsontable: {setting} needs Sphinx {minimum} or later, "
+        f"Sphinx {sphinx.__version__} indexes the whole table"
+    )
+
+
+class cell_paragraph(nodes.paragraph, nodes.Inline):
+    """
+    Paragraph holding the text of one table cell.
+
+    Sphinx's i18n treats ``Inline`` elements without a ``translatable``
+    attribute as untranslatable at its first check, so message extraction
+    and the gettext builder's versioning pass skip cells without serializing
+    each one for their debug log. Sphinx's translators dispatch along the
+    class hierarchy and render the node as a paragraph; the tag name keeps
+    doctree dumps unchanged.
+    """
+
+    tagname = "paragraph"
+
+
+class literal_cell_paragraph(cell_paragraph, nodes.Special):
+    """
+    Cell paragraph left out of smart-quote education.
+
+    docutils' SmartQuotes transform skips ``Special`` elements before looking
+    at their text, so cell data keeps its straight quotes, dashes and
+    ellipses and the transform does no per-cell work.
+    """
+
+
 class TableBuilder:
     """
     Enterprise-grade table builder for converting structured data into docutils table nodes.
@@ -71,10 +126,20 @@ class TableBuilder:
     Attributes:
         max_rows (int): Maximum allowed rows for memory protection
         encoding (str): Text encoding for string processing
+        smartquotes (bool): Whether cell text is subject to smart quotes
+        searchable (str): Which part of the table the search index sees
+        search_sample_rows (int): Body rows indexed in "sample" mode
+        translatable_headers (bool): Whether header cells are i18n messages
     """
 
     def __init__(
-        self, max_rows: int = DEFAULT_MAX_ROWS, encoding: str = DEFAULT_ENCODING
+        self,
+        max_rows: int = DEFAULT_MAX_ROWS,
+        encoding: str = DEFAULT_ENCODING,
+        smartquotes: bool = False,
+        searchable: str = "all",
+        search_sample_rows: int = DEFAULT_SEARCH_SAMPLE_ROWS,
+        translatable_headers: bool = False,
     ) -> None:
         """
         Initialize TableBuilder with enterprise-grade configuration options.
@@ -84,9 +149,21 @@ class TableBuilder:
                      Used for memory protection and performance optimization
             encoding: Text encoding for string processing (default: utf-8)
                      Ensures proper character handling across different locales
+            smartquotes: Let SmartQuotes educate the cell text (default: False)
+                     Cells are built as ``literal_cell_paragraph`` nodes
+                     otherwise
+            searchable: Text left to the HTML search index (default: "all")
+                     "sample" keeps the header and the first
+                     ``search_sample_rows`` body rows, "headers" the header
+                     only and "none" nothing; the rest is marked
+                     ``no-search``, which Sphinx before 7.3 indexes anyway
+            search_sample_rows: Body rows indexed in "sample" mode (default: 10)
+            translatable_headers: Build header cells as translatable paragraphs
+                     (default: False); the caller sets their source info
 
         Raises:
-            ValueError: If max_rows is 0 or negative (invalid configuration)
+            ValueError: If max_rows is 0 or negative (invalid configuration),
+                       or searchable is not one of SEARCHABLE_MODES
 
         Examples:
             >>> builder = TableBuilder()  # Default configuration
@@ -94,12 +171,24 @@ class TableBuilder:
         """
         if max_rows <= 0:
             raise ValueError(f"max_rows must be positive, got: {max_rows}")
+        if searchable not in SEARCHABLE_MODES:
+            raise ValueError(
+                f"searchable must be one of {', '.join(SEARCHABLE_MODES)}, "
+                f"got: {searchable}"
+            )
 
         self.max_rows = max_rows
         self.encoding = encoding
+        self.smartquotes = smartquotes
+        self.searchable = searchable
+        self.search_sample_rows = max(search_sample_rows, 0)
+        self.translatable_headers = translatable_headers
+        self._paragraph = cell_paragraph if smartquotes else literal_cell_paragraph
 
         logger.debug(
-            f"TableBuilder initialized: max_rows={max_rows}, encoding={encoding}"
+            f"TableBuilder initialized: max_rows={max_rows}, encoding={encoding}, "
+            f"smartquotes={smartquotes}, searchable={searchable}, "
+            f"translatable_headers={translatable_headers}"
         )
 
     def build_table(
@@ -214,8 +303,33 @@ class TableBuilder:
             body_data = table_data
 
         self._add_body(table, body_data, max_cols)
+        self._exclude_from_search(table)
         return table
 
+    def _exclude_from_search(self, table: nodes.table) -> None:
+        """
+        Mark the parts of a table the search index should not see.
+
+        The class goes on the outermost node covering the excluded text, so
+        the indexer skips whole subtrees instead of visiting every cell.
+
+        Args:
+            table: nodes.table with its body added
+        """
+        if self.searchable == "all":
+            return
+        if self.searchable == "none":
+            table["classes"].append(NO_SEARCH_CLASS)
+            return
+
+        tbody = table[0][-1]
+        if self.searchable == "headers":
+            tbody["classes"].append(NO_SEARCH_CLASS)
+            return
+
+        for row in tbody.children[self.search_sample_rows :]:
+            row["classes"].append(NO_SEARCH_CLASS)
+
     def _create_empty_table(self) -> nodes.table:
         """
         Create an empty table node with one column.
@@ -276,9 +390,29 @@ class TableBuilder:
         """
         thead = nodes.thead()
         header_row = self._create_table_row(header_data)
+        if self.translatable_headers:
+            self._make_translatable(header_row)
         thead += header_row
         table[0] += thead
 
+    def _make_translatable(self, row: nodes.row) -> None:
+        """
+        Turn the cells of a row into paragraphs gettext extracts.
+
+        Sphinx extracts a paragraph's ``rawsource`` once the paragraph has
+        source info. Without smart quotes the paragraph opts out of Sphinx's
+        SmartQuotes, like the cells it replaces.
+
+        Args:
+            row: nodes.row built by _create_table_row
+        """
+        for entry in row.children:
+            text = entry[0].astext()
+            paragraph = nodes.paragraph(text, text)
+            if not self.smartquotes:
+                paragraph["support_smartquotes"] = False
+            entry[0] = paragraph
+
     def _add_body(
         self,
         table: nodes.table,
@@ -295,13 +429,17 @@ class TableBuilder:
         """
         tbody = nodes.tbody()
 
+        # Cell texts shared by every row, so each distinct value is prepared once
+        texts: dict[Any, str] = {}
         for row_data in body_data:
             padded_row = row_data + [""] * (max_cols - len(row_data))
-            tbody += self._create_table_row(padded_row)
+            tbody += self._create_table_row(padded_row, texts)
 
         table[0] += tbody
 
-    def _create_table_row(self, row_data: list[str]) -> nodes.row:
+    def _create_table_row(
+        self, row_data: list[str], texts: dict[Any, str] | None = None
+    ) -> nodes.row:
         """
         Create optimized docutils row node from a list of cell strings.
 
@@ -311,6 +449,8 @@ class TableBuilder:
         Args:
             row_data: List of strings for each cell in the row.
                      None values are automatically converted to empty strings.
+            texts: Optional table-wide cache of prepared cell texts; non-string
+                   cells are converted once per distinct value and reused
 
         Returns:
             nodes.row containing properly structured entry and paragraph nodes
@@ -327,24 +467,46 @@ class TableBuilder:
             - Protection against malformed data
         """
         row = nodes.row()
+        paragraph = self._paragraph
 
         for cell_data in row_data:
             entry = nodes.entry()
 
             # Robust cell data processing with type safety
-            if cell_data is None:
-                text_content = ""
-                logger.debug("Converted None cell to empty string")
+            if type(cell_data) is str:
+                # Fast path: converter output is already text
+                text_content = cell_data
             else:
-                # Ensure string conversion with encoding safety
-                try:
-                    text_content = str(cell_data)
-                except (UnicodeDecodeError, UnicodeEncodeError) as e:
-                    logger.warning(f"Cell encoding issue, using fallback: {e}")
-                    text_content = repr(cell_data)  # Safe fallback representation
+                text_content = self._cell_text(cell_data, texts)
 
             # Create paragraph node with optimized text content
-            entry += nodes.paragraph(text=text_content)
+            entry += paragraph(text=text_content)
             row += entry
 
         return row
+
+    def _cell_text(self, cell_data: Any, texts: dict[Any, str] | None = None) -> str:
+        """Convert one non-string cell value, once per distinct value."""
+        key = (type(cell_data), cell_data)
+        if texts is not None:
+            try:
+                return texts[key]
+            except KeyError:
+                pass
+            except TypeError:
+                texts = None  # Unhashable values are converted every time
+
+        if cell_data is None:
+            text_content = ""
+            logger.debug("Converted None cell to empty string")
+        else:
+            # Ensure string conversion with encoding safety
+            try:
+                text_content = str(cell_data)
+            except (UnicodeDecodeError, UnicodeEncodeError) as e:
+                logger.warning(f"Cell encoding issue, using fallback: {e}")
+                text_content = repr(cell_data)  # Safe fallback representation
+
+        if texts is not None:
+            texts[key] = text_content
+        return text_content
@@ -7,12 +7,15 @@ Extracted from original directives.py with enhanced error handling and performan
 
 from __future__ import annotations
 
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from sphinx.util import logging as sphinx_logging
 
 from .validators import JsonTableError, ValidationUtils
 
+if TYPE_CHECKING:
+    from .row_query import RowQuery
+
 # Type definitions
 JsonData = list[Any] | dict[str, Any]
 TableData = list[list[str]]
@@ -20,6 +23,9 @@ TableData = list[list[str]]
 # Configuration constants
 DEFAULT_MAX_ROWS = 10000
 
+# Columns stop growing their value dictionary past this many distinct values
+DICTIONARY_MAX_VALUES = 1024
+
 # Error messages
 INVALID_JSON_DATA_ERROR = "JSON data must be an array or object"
 
@@ -57,7 +63,11 @@ class TableConverter:
     """
 
     def __init__(
-        self, max_rows: int | None = None, performance_mode: bool = False
+        self,
+        max_rows: int | None = None,
+        performance_mode: bool = False,
+        parallel_threshold: int = 0,
+        parallel_workers: int | None = None,
     ) -> None:
         """
         Initialize TableConverter with enterprise-grade configuration.
@@ -66,6 +76,9 @@ class TableConverter:
             max_rows: Custom maximum row limit for performance protection
                      (None uses DEFAULT_MAX_ROWS constant)
             performance_mode: Enable performance optimizations
+            parallel_threshold: Object arrays with at least this many rows are
+                     converted in chunks by the shared process pool (0 disables)
+            parallel_workers: Worker processes for the pool (None: CPU count)
 
         Example:
             >>> converter = TableConverter()  # Use default limits
@@ -76,11 +89,18 @@ class TableConverter:
 
         self.max_rows = max_rows or DEFAULT_MAX_ROWS
         self.performance_mode = performance_mode
+        self.parallel_threshold = parallel_threshold
+        self.parallel_workers = parallel_workers
         logger.debug(
             f"TableConverter initialized with max_rows={self.max_rows}, performance_mode={performance_mode}"
         )
 
-    def convert(self, data: JsonData, include_header: bool | None = None) -> TableData:
+    def convert(
+        self,
+        data: JsonData,
+        include_header: bool | None = None,
+        query: RowQuery | None = None,
+    ) -> TableData:
         """
         Convert JSON data to tabular format with comprehensive validation and optimization.
 
@@ -113,6 +133,10 @@ class TableConverter:
                           - None (default): Automatic header detection (current behavior)
                           - True: Force include header (same as None for backward compatibility)
                           - False: Return data rows only (header stripped if present)
+            query: Optional row selection (``:where:``/``:sort-by:``) evaluated on the
+                   raw values while rows are converted. For 2D arrays the first row
+                   supplies the column names. With a query, the row limit applies
+                   to the selected rows rather than to the source.
 
         Returns:
             TableData: 2D list structure where:
@@ -164,8 +188,11 @@ class TableConverter:
 
         ValidationUtils.validate_not_empty(data, "No JSON data to process")
 
-        # Check row limit
-        if isinstance(data, list) and len(data) > self.max_rows:
+        if query is not None and query.is_empty:
+            query = None
+
+        # Check row limit (a query checks the selected rows instead)
+        if query is None and isinstance(data, list) and len(data) > self.max_rows:
             raise JsonTableError(
                 f"Data size {len(data)} exceeds maximum {self.max_rows} rows"
             )
@@ -174,7 +201,7 @@ class TableConverter:
         if isinstance(data, dict):
             result = self._convert_single_object(data)
         elif isinstance(data, list):
-            result = self._convert_array(data)
+            result = self._convert_array(data, query)
         else:
             raise JsonTableError(INVALID_JSON_DATA_ERROR)
 
@@ -216,18 +243,27 @@ class TableConverter:
 
         return [header, values]
 
-    def _convert_array(self, data: list) -> TableData:
+    def _convert_array(self, data: list, query: RowQuery | None = None) -> TableData:
         """Convert array to table format."""
         if not data:
             return []
 
         # Check if it's an array of objects
         if data and isinstance(data[0], dict):
-            return self._convert_object_array(data)
+            return self._convert_object_array(data, query)
         else:
-            return self._convert_2d_array(data)
+            return self._convert_2d_array(data, query)
+
+    def _check_selected_rows(self, row_count: int) -> None:
+        """Apply the row limit to rows selected by a query."""
+        if row_count > self.max_rows:
+            raise JsonTableError(
+                f"Data size {row_count} exceeds maximum {self.max_rows} rows"
+            )
 
-    def _convert_object_array(self, data: list) -> TableData:
+    def _convert_object_array(
+        self, data: list, query: RowQuery | None = None
+    ) -> TableData:
         """Convert array of objects to table format."""
         if not data:
             return []
@@ -244,29 +280,84 @@ class TableConverter:
         # Build header row
         result = [sorted_keys]
 
-        # Build data rows
+        # Select rows on raw values before any string conversion
+        if query is not None:
+            query.check_columns(sorted_keys)
+            data = query.select(
+                data,
+                lambda item, column: (
+                    item.get(column) if isinstance(item, dict) else None
+                ),
+            )
+            self._check_selected_rows(len(data))
+
+        # Build data rows, in worker processes for very large arrays
+        rows = None
+        if self.parallel_threshold and len(data) >= self.parallel_threshold:
+            from .parallel_conversion import get_conversion_pool
+
+            pool = get_conversion_pool(self.parallel_workers)
+            rows = pool.convert_object_rows(data, sorted_keys)
+        if rows is None:
+            rows = self._object_rows(data, sorted_keys)
+        result.extend(rows)
+
+        return result
+
+    def _object_rows(self, data: list, keys: list[str] | tuple[str, ...]) -> TableData:
+        """Convert objects to rows (repeated values share one string per column)."""
+        columns = list(enumerate(keys))
+        dictionaries: list[dict[Any, str]] = [{} for _ in keys]
+        encode = self._encode_cell
+        rows = []
         for item in data:
             if isinstance(item, dict):
-                row = [self._safe_str(item.get(key, "")) for key in sorted_keys]
+                row = [
+                    encode(dictionaries[index], item.get(key, ""))
+                    for index, key in columns
+                ]
             else:
-                row = ["" for _ in sorted_keys]
-            result.append(row)
+                row = ["" for _ in keys]
+            rows.append(row)
+        return rows
 
-        return result
-
-    def _convert_2d_array(self, data: list) -> TableData:
+    def _convert_2d_array(self, data: list, query: RowQuery | None = None) -> TableData:
         """Convert 2D array to table format."""
         if not data:
             return []
 
+        # The first row names the columns a query refers to
+        if query is not None:
+            header = data[0] if isinstance(data[0], list) else [data[0]]
+            positions: dict[str, int] = {}
+            for index, name in enumerate(header):
+                positions.setdefault(self._safe_str(name).strip(), index)
+            query.check_columns(positions)
+
+            def value_of(row: Any, column: str) -> Any:
+                position = positions.get(column)
+                if position is None:
+                    return None
+                if not isinstance(row, list):
+                    return row if position == 0 else None
+                return row[position] if position < len(row) else None
+
+            body = query.select(data[1:], value_of)
+            self._check_selected_rows(len(body))
+            data = [data[0], *body]
+
         # Find maximum row length
         max_length = max(len(row) if isinstance(row, list) else 1 for row in data)
 
         result = []
+        dictionaries: list[dict[Any, str]] = [{} for _ in range(max_length)]
+        encode = self._encode_cell
         for row in data:
             if isinstance(row, list):
                 # Normalize row length
-                normalized_row = [self._safe_str(item) for item in row]
+                normalized_row = [
+                    encode(dictionaries[index], item) for index, item in enumerate(row)
+                ]
                 while len(normalized_row) < max_length:
                     normalized_row.append("")
             else:
@@ -277,8 +368,42 @@ class TableConverter:
 
         return result
 
+    def _encode_cell(self, dictionary: dict[Any, str], value: Any) -> str:
+        """
+        Convert a cell value through its column's value dictionary.
+
+        Low-cardinality columns (status, region, flags) repeat a handful of
+        values; each distinct value is converted once and every repetition
+        shares the same string object. The dictionary stops growing once a
+        column proves to be high-cardinality.
+
+        Args:
+            dictionary: Per-column mapping of raw value to rendered text
+            value: Raw cell value
+
+        Returns:
+            Cell text
+        """
+        value_type = type(value)
+        # Keep equal values of different types (1, 1.0, True) apart
+        key = value if value_type is str else (value_type, value)
+        try:
+            text = dictionary.get(key)
+        except TypeError:
+            # Unhashable values (nested objects/arrays) are not encoded
+            return self._safe_str(value)
+
+        if text is None:
+            text = self._safe_str(value)
+            if len(dictionary) < DICTIONARY_MAX_VALUES:
+                dictionary[key] = text
+        return text
+
     def _safe_str(self, value) -> str:
         """Safely convert value to string."""
+        # Fast path: strings, including numbers decoded as source lexemes
+        if isinstance(value, str):
+            return value
         if value is None:
             return ""
         elif isinstance(value, (dict, list)):
@@ -14,7 +14,9 @@ from pathlib import Path
 from typing import Any, Dict, List, Optional, Union
 
 from ..core.data_converter import DataConverter, IDataConverter
+from ..core.excel_engines import ENGINE_AUTO
 from ..core.excel_reader import ExcelReader, IExcelReader
+from ..core.range_detector import parse_detect_mode
 from ..core.range_parser import IRangeParser, RangeParser
 from ..errors.error_handlers import ErrorHandler, IErrorHandler
 from ..security.security_scanner import ISecurityValidator, SecurityScanner
@@ -45,10 +47,14 @@ class ExcelDataLoaderFacadeRefactored:
         error_handler: Optional[IErrorHandler] = None,
         enable_security: bool = True,
         enable_error_handling: bool = True,
+        excel_engine: str = ENGINE_AUTO,
+        snapshot_dir: Optional[Union[str, Path]] = None,
     ):
         """Initialize facade with dependency injection and specialized processors."""
         # Initialize components with defaults if not provided
-        self.excel_reader = excel_reader or ExcelReader()
+        self.excel_reader = excel_reader or ExcelReader(
+            engine=excel_engine, snapshot_dir=snapshot_dir
+        )
         self.data_converter = data_converter or DataConverter()
         self.range_parser = range_parser or RangeParser()
         self.security_validator = security_validator or SecurityScanner()
@@ -88,6 +94,8 @@ class ExcelDataLoaderFacadeRefactored:
         header_row: Optional[int] = None,
         skip_rows: Optional[str] = None,
         merge_mode: Optional[str] = None,
+        row_filter: Optional[Any] = None,
+        aggregation: Optional[Any] = None,
         **kwargs,
     ) -> Dict[str, Any]:
         """Load Excel data using processing pipeline.
@@ -102,6 +110,8 @@ class ExcelDataLoaderFacadeRefactored:
             header_row: Header row number (0-based)
             skip_rows: Row skip specification (e.g., "0,1,2" or "0-2,5,7-9")
             merge_mode: How to handle merged cells ('expand', 'first', 'skip')
+            row_filter: Compiled ``:where:`` predicate applied to data rows
+            aggregation: Compiled ``:group-by:``/``:aggregate:`` options
             **kwargs: Additional parameters
 
         Returns:
@@ -123,6 +133,8 @@ class ExcelDataLoaderFacadeRefactored:
             header_row=header_row,
             skip_rows=skip_rows,
             merge_mode=merge_mode,
+            row_filter=row_filter,
+            aggregation=aggregation,
             **kwargs,
         )
 
@@ -206,30 +218,30 @@ class ExcelDataLoaderFacadeRefactored:
 
         Args:
             file_path: Path to Excel file
-            detect_range: Detection mode ('auto', 'smart', 'manual')
+            detect_range: Detection mode ('auto', 'largest', a 1-based island
+                number, 'smart' as an alias of 'auto', or 'manual')
             **kwargs: Additional parameters including range_hint for manual mode
 
         Returns:
             Processing result with detected range information
         """
-        # Validate detect_range mode
-        valid_modes = {"auto", "smart", "manual"}
-        if detect_range not in valid_modes:
-            raise ValueError(
-                f"Invalid detect mode: {detect_range}. Must be one of {valid_modes}"
-            )
-
         # Extract range_hint before delegating to avoid unexpected keyword argument
-        range_hint = kwargs.pop("range_hint", "A1:Z100")
+        range_hint = kwargs.pop("range_hint", None)
 
-        # For now, delegate to basic load_from_excel and add detection metadata
-        # TODO: Implement actual range detection algorithms
-        result = self.load_from_excel(file_path=file_path, **kwargs)
+        if detect_range == "manual":
+            result = self.load_from_excel(
+                file_path=file_path, range_spec=range_hint, **kwargs
+            )
+            result["detected_range"] = range_hint
+        else:
+            mode = "auto" if detect_range == "smart" else detect_range
+            parse_detect_mode(mode)  # Raises ValueError for invalid modes
+            result = self.load_from_excel(
+                file_path=file_path, detect_range=mode, **kwargs
+            )
+            result.setdefault("detected_range", None)
 
-        # Add detection metadata
         result["detect_mode"] = detect_range
-        result["detected_range"] = range_hint  # Use extracted range_hint
-
         return result
 
     def load_from_excel_with_skip_rows_range_and_header(
@@ -9,16 +9,27 @@ CLAUDE.md Code Excellence Compliance:
 - SOLID Principles: Interface segregation and dependency injection
 """
 
+import os
 from pathlib import Path
 from typing import Any, Dict, Optional, Union
 
 import pandas as pd
 
+from ..core.data_conversion_types import ConversionResult
 from ..core.data_converter import IDataConverter
-from ..core.excel_reader import IExcelReader
+from ..core.excel_reader import ExcelReader, IExcelReader
+from ..core.merged_cells import MergedCellIndex, parse_merge_mode
+from ..core.range_detector import (
+    DetectMode,
+    dataframe_cells,
+    detect_islands,
+    parse_detect_mode,
+    select_island,
+)
 from ..core.range_parser import IRangeParser, RangeInfo
 from ..errors.error_handlers import IErrorHandler
 from ..security.security_scanner import ISecurityValidator
+from ..trace_events import span
 
 
 class ExcelProcessingPipeline:
@@ -64,6 +75,9 @@ class ExcelProcessingPipeline:
         header_row: Optional[int] = None,
         skip_rows: Optional[str] = None,
         merge_mode: Optional[str] = None,
+        row_filter: Optional[Any] = None,
+        aggregation: Optional[Any] = None,
+        detect_range: Optional[str] = None,
     ) -> Dict[str, Any]:
         """Execute 5-stage Excel processing pipeline.
 
@@ -75,32 +89,99 @@ class ExcelProcessingPipeline:
             header_row: Header row number (0-based)
             skip_rows: Row skip specification (e.g., "0,1,2" or "0-2,5,7-9")
             merge_mode: How to handle merged cells ('expand', 'first', 'skip')
+            row_filter: Compiled ``:where:`` predicate evaluated over the DataFrame
+            aggregation: Compiled ``:group-by:``/``:aggregate:`` options; when
+                given, only the aggregated table (header first) is returned
+            detect_range: ``:detect-range:`` mode ('auto', 'largest' or a
+                1-based island number); ignored when ``range_spec`` is given
 
         Returns:
             Processing result with data and metadata
         """
         context = "excel_processing_pipeline"
+        detection = None
 
         try:
             # Stage 1: Security validation
             if self.enable_security and self.security_validator:
-                self._perform_security_validation(file_path, context)
+                with span("security scan", "excel"):
+                    self._perform_security_validation(file_path, context)
 
-            # Stage 2: Range parsing (if specified)
+            # Stage 2: Range detection (if requested) and parsing (if specified)
             range_info = None
-            if range_spec:
-                range_info = self._parse_range_specification(range_spec, context)
+            with span("range parse", "excel", range=range_spec) as trace:
+                if detect_range is not None and not range_spec:
+                    detection = self._detect_data_range(
+                        file_path,
+                        sheet_name,
+                        sheet_index,
+                        parse_detect_mode(detect_range),
+                        context,
+                    )
+                    if detection["island"] is not None:
+                        range_spec = detection["island"].range_spec
+                        trace.set(detected_range=range_spec)
+
+                if range_spec:
+                    range_info = self._parse_range_specification(range_spec, context)
+
+            # Stage 3: File reading (only the rows covered by the range, if any)
+            with span("read", "excel", sheet=sheet_name) as trace:
+                if trace.enabled:
+                    trace.set(file_size=self._file_size(file_path))
+                read_options = (
+                    self._range_read_options(range_info) if range_info else {}
+                )
+                read_result = self._read_excel_file(
+                    file_path, sheet_name, sheet_index, context, **read_options
+                )
+                row_offset = read_options.get("skiprows", 0)
+                if (
+                    read_options
+                    and len(read_result.dataframe.columns) < range_info.end_col
+                ):
+                    # The window is narrower than the range: check the column
+                    # bounds against the whole sheet, exactly as a full read would
+                    read_result = self._read_excel_file(
+                        file_path, sheet_name, sheet_index, context
+                    )
+                    row_offset = 0
+                if trace.enabled:
+                    rows, cols = read_result.dataframe.shape
+                    trace.set(
+                        rows=rows,
+                        cols=cols,
+                        engine=read_result.metadata.get("engine"),
+                    )
 
-            # Stage 3: File reading
-            read_result = self._read_excel_file(
-                file_path, sheet_name, sheet_index, context
-            )
+            # Stage 3.25: Merged cells (if requested), still in sheet coordinates
+            merged_index = None
+            merge_cells = parse_merge_mode(merge_mode) if merge_mode else None
+            if merge_cells:
+                merged_refs = self._read_merged_ranges(
+                    file_path, sheet_name, sheet_index, context
+                )
+                merged_index = self._index_merged_ranges(
+                    merged_refs, read_result.dataframe, row_offset
+                )
+                if merged_index.anchors_above(row_offset + 1):
+                    # Areas reaching into the window from above need their anchor
+                    read_result = self._read_excel_file(
+                        file_path, sheet_name, sheet_index, context
+                    )
+                    row_offset = 0
+                    merged_index = self._index_merged_ranges(
+                        merged_refs, read_result.dataframe, row_offset
+                    )
+                read_result.dataframe = merged_index.apply(
+                    read_result.dataframe, merge_cells, row_offset
+                )
 
             # Stage 3.5: Apply range to raw DataFrame (if specified)
             # This ensures range operates on Excel's 1-based row numbering
             if range_info:
                 read_result.dataframe = self._apply_range_to_dataframe(
-                    read_result.dataframe, range_info, context
+                    read_result.dataframe, range_info, context, row_offset
                 )
 
                 # Adjust header_row index to be relative to the range
@@ -123,22 +204,51 @@ class ExcelProcessingPipeline:
                         header_row, skip_rows_list, context
                     )
 
-            # Stage 4: Data conversion
-            conversion_result = self._convert_data_to_json(
-                read_result.dataframe, header_row, context
-            )
+            # Stage 3.9: Filter data rows vectorized over the DataFrame (if specified)
+            # Runs before conversion so rejected rows are never converted
+            if row_filter is not None:
+                read_result.dataframe = self._apply_row_filter_to_dataframe(
+                    read_result.dataframe, row_filter, header_row, context
+                )
+
+            # Stage 4: Data conversion (aggregated tables are already JSON rows)
+            with span("convert", "excel") as trace:
+                if trace.enabled:
+                    rows, cols = read_result.dataframe.shape
+                    trace.set(rows=rows, cols=cols)
+                if aggregation is not None:
+                    conversion_result = self._aggregate_dataframe(
+                        read_result.dataframe, aggregation, header_row, context
+                    )
+                    header_row = None
+                else:
+                    conversion_result = self._convert_data_to_json(
+                        read_result.dataframe, header_row, context
+                    )
 
             # Stage 5: Result integration (header processing only)
-            return self._build_integrated_result(
-                conversion_result,
-                read_result,
-                range_info,
-                context,
-                header_row,
-                skip_rows_list,
-                skip_rows,
-                merge_mode,
-            )
+            with span("header processing", "excel", header_row=header_row):
+                result = self._build_integrated_result(
+                    conversion_result,
+                    read_result,
+                    range_info,
+                    context,
+                    header_row,
+                    skip_rows_list,
+                    skip_rows,
+                    merge_mode,
+                    merged_index,
+                )
+            if detection is not None:
+                island = detection["island"]
+                result["detected_range"] = island.range_spec if island else None
+                result["metadata"]["detect_range_info"] = {
+                    "mode": detect_range,
+                    "detected_range": result["detected_range"],
+                    "island_count": len(detection["islands"]),
+                    "islands": [i.range_spec for i in detection["islands"]],
+                }
+            return result
 
         except ValueError:
             # Re-raise ValueError directly for proper test behavior
@@ -146,6 +256,14 @@ class ExcelProcessingPipeline:
         except Exception as e:
             return self._handle_processing_error(e, context)
 
+    @staticmethod
+    def _file_size(file_path: Union[str, Path]) -> Optional[int]:
+        """Size of the file in bytes (None if it cannot be read)."""
+        try:
+            return os.path.getsize(file_path)
+        except OSError:
+            return None
+
     def _perform_security_validation(
         self, file_path: Union[str, Path], context: str
     ) -> None:
@@ -170,6 +288,63 @@ class ExcelProcessingPipeline:
             else:
                 raise
 
+    def _detect_data_range(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: Optional[str],
+        sheet_index: Optional[int],
+        detect_mode: DetectMode,
+        context: str,
+    ) -> Dict[str, Any]:
+        """Stage 2: Locate the table to render from the sheet's non-empty cells.
+
+        ``ExcelReader`` streams the cell coordinates without building a
+        DataFrame; other readers fall back to the read sheet.
+        """
+        if isinstance(self.excel_reader, ExcelReader):
+            cells = self.excel_reader.occupied_cells(file_path, sheet_name, sheet_index)
+        else:
+            read_result = self._read_excel_file(
+                file_path, sheet_name, sheet_index, context
+            )
+            cells = dataframe_cells(read_result.dataframe)
+
+        islands = detect_islands(cells)
+        return {"islands": islands, "island": select_island(islands, detect_mode)}
+
+    def _read_merged_ranges(
+        self,
+        file_path: Union[str, Path],
+        sheet_name: Optional[str],
+        sheet_index: Optional[int],
+        context: str,
+    ) -> list[str]:
+        """Stage 3.25: Read the sheet's merged areas (``A1:D1`` references)."""
+        if not isinstance(self.excel_reader, ExcelReader):
+            return []
+
+        try:
+            return self.excel_reader.merged_ranges(file_path, sheet_name, sheet_index)
+        except Exception as e:
+            if self.enable_error_handling and self.error_handler:
+                error_response = self.error_handler.create_error_response(e, context)
+                raise ProcessingError(
+                    f"Merged cell reading failed: {error_response}"
+                ) from e
+            else:
+                raise
+
+    @staticmethod
+    def _index_merged_ranges(
+        merged_refs: list[str], dataframe: pd.DataFrame, row_offset: int
+    ) -> MergedCellIndex:
+        """Index the merged areas crossing the rows held by ``dataframe``."""
+        return MergedCellIndex.from_refs(
+            merged_refs,
+            first_row=row_offset + 1,
+            last_row=row_offset + len(dataframe),
+        )
+
     def _parse_range_specification(
         self, range_spec: str, context: str
     ) -> Optional[RangeInfo]:
@@ -189,11 +364,19 @@ class ExcelProcessingPipeline:
         sheet_name: Optional[str],
         sheet_index: Optional[int],
         context: str,
+        **read_options: Any,
     ) -> Any:
-        """Stage 3: Read Excel file."""
+        """Stage 3: Read Excel file.
+
+        ``read_options`` are forwarded to the reader (e.g. ``skiprows`` and
+        ``nrows`` from :meth:`_range_read_options`).
+        """
         try:
             return self.excel_reader.read_workbook(
-                file_path, sheet_name=sheet_name, sheet_index=sheet_index
+                file_path,
+                sheet_name=sheet_name,
+                sheet_index=sheet_index,
+                **read_options,
             )
         except Exception as e:
             if self.enable_error_handling and self.error_handler:
@@ -235,6 +418,7 @@ class ExcelProcessingPipeline:
         skip_rows_list: Optional[list] = None,
         skip_rows_original: Optional[str] = None,
         merge_mode: Optional[str] = None,
+        merged_index: Optional[MergedCellIndex] = None,
     ) -> Dict[str, Any]:
         """Stage 5: Build integrated result with header processing only.
 
@@ -302,8 +486,11 @@ class ExcelProcessingPipeline:
                 result["merge_mode"] = merge_mode
                 result["metadata"]["merge_info"] = {
                     "merge_mode": merge_mode,
-                    "has_merged_cells": False,  # Placeholder - TODO: implement actual detection
-                    "merged_ranges": [],  # Placeholder
+                    "has_merged_cells": bool(merged_index),
+                    "merged_ranges": [
+                        merged.range_spec
+                        for merged in (merged_index.ranges if merged_index else [])
+                    ],
                 }
 
             return result
@@ -337,8 +524,29 @@ class ExcelProcessingPipeline:
                 "data": None,
             }
 
+    def _range_read_options(self, range_info: RangeInfo) -> Dict[str, int]:
+        """Translate a range into reader options that parse only its rows.
+
+        Args:
+            range_info: Range specification with 1-based indices
+
+        Returns:
+            ``skiprows``/``nrows`` for the reader, or an empty dict when the
+            range cannot be expressed as a row window
+        """
+        if range_info.start_row < 1 or range_info.end_row < range_info.start_row:
+            return {}
+        return {
+            "skiprows": range_info.start_row - 1,
+            "nrows": range_info.end_row - range_info.start_row + 1,
+        }
+
     def _apply_range_to_dataframe(
-        self, dataframe: pd.DataFrame, range_info: RangeInfo, context: str
+        self,
+        dataframe: pd.DataFrame,
+        range_info: RangeInfo,
+        context: str,
+        row_offset: int = 0,
     ) -> pd.DataFrame:
         """Apply range specification to raw DataFrame.
 
@@ -348,14 +556,16 @@ class ExcelProcessingPipeline:
             dataframe: Original pandas DataFrame
             range_info: Range specification with 1-based indices
             context: Processing context for error reporting
+            row_offset: Number of sheet rows skipped by the reader before the
+                first DataFrame row
 
         Returns:
             DataFrame subset matching the specified range
         """
         try:
             # Convert 1-based Excel indices to 0-based DataFrame indices
-            start_row = range_info.start_row - 1
-            end_row = range_info.end_row - 1
+            start_row = range_info.start_row - 1 - row_offset
+            end_row = range_info.end_row - 1 - row_offset
             start_col = range_info.start_col - 1
             end_col = range_info.end_col - 1
 
@@ -366,7 +576,7 @@ class ExcelProcessingPipeline:
             if start_row >= max_df_rows or end_row >= max_df_rows:
                 raise ProcessingError(
                     f"Range row indices ({range_info.start_row}-{range_info.end_row}) "
-                    f"exceed DataFrame rows (1-{max_df_rows})"
+                    f"exceed DataFrame rows (1-{row_offset + max_df_rows})"
                 )
 
             if start_col >= max_df_cols or end_col >= max_df_cols:
@@ -673,6 +883,100 @@ class ExcelProcessingPipeline:
             else:
                 raise
 
+    def _apply_row_filter_to_dataframe(
+        self,
+        dataframe: pd.DataFrame,
+        row_filter: Any,
+        header_row: Optional[int],
+        context: str,
+    ) -> pd.DataFrame:
+        """Keep only the data rows matching a compiled ``:where:`` predicate.
+
+        Column names come from the header row (the first row when no header
+        row is specified). The header row and any rows above it are kept.
+
+        Args:
+            dataframe: DataFrame after range and skip rows have been applied
+            row_filter: Compiled predicate providing a vectorized ``mask``
+            header_row: Header row index relative to the DataFrame (0-based)
+            context: Processing context for error reporting
+
+        Returns:
+            DataFrame with non-matching data rows removed and reset index
+        """
+        try:
+            header_index = header_row if header_row is not None else 0
+            if dataframe.empty or header_index >= len(dataframe):
+                return dataframe
+
+            column_positions: Dict[str, int] = {}
+            for position, value in enumerate(dataframe.iloc[header_index]):
+                name = "" if pd.isna(value) else str(value).strip()
+                column_positions.setdefault(name, position)
+
+            body = dataframe.iloc[header_index + 1 :]
+            mask = row_filter.mask(body, column_positions)
+
+            return pd.concat(
+                [dataframe.iloc[: header_index + 1], body[mask.to_numpy()]]
+            ).reset_index(drop=True)
+
+        except Exception as e:
+            if self.enable_error_handling and self.error_handler:
+                error_response = self.error_handler.create_error_response(e, context)
+                raise ProcessingError(
+                    f"Row filter application failed: {error_response}"
+                ) from e
+            else:
+                raise
+
+    def _aggregate_dataframe(
+        self,
+        dataframe: pd.DataFrame,
+        aggregation: Any,
+        header_row: Optional[int],
+        context: str,
+    ) -> ConversionResult:
+        """Group and aggregate the data rows instead of converting them.
+
+        Column names come from the header row (the first row when no header
+        row is specified); rows above the header are ignored. The aggregated
+        table keeps its header as the first data row so it renders as-is.
+
+        Args:
+            dataframe: DataFrame after range, skip rows and row filter
+            aggregation: Compiled aggregation providing ``aggregate_frame``
+            header_row: Header row index relative to the DataFrame (0-based)
+            context: Processing context for error reporting
+
+        Returns:
+            Conversion result holding the aggregated table
+        """
+        try:
+            header_index = header_row if header_row is not None else 0
+            column_positions: Dict[str, int] = {}
+            if header_index < len(dataframe):
+                for position, value in enumerate(dataframe.iloc[header_index]):
+                    name = "" if pd.isna(value) else str(value).strip()
+                    column_positions.setdefault(name, position)
+
+            body = dataframe.iloc[header_index + 1 :]
+            table = aggregation.aggregate_frame(body, column_positions)
+
+            return ConversionResult(
+                data=table,
+                has_header=False,
+                headers=[],
+                metadata={"aggregated": True, "source_rows": len(body)},
+            )
+
+        except Exception as e:
+            if self.enable_error_handling and self.error_handler:
+                error_response = self.error_handler.create_error_response(e, context)
+                raise ProcessingError(f"Aggregation failed: {error_response}") from e
+            else:
+                raise
+
     def _adjust_header_row_for_skip_rows(
         self, header_row: int, skip_rows_list: list[int], context: str
     ) -> int:
@@ -111,7 +111,7 @@ class ExcelUtilities:
 
         try:
             workbook_info = self.excel_reader.validate_file(file_path)
-            sheet_names = self.excel_reader.get_sheet_names(file_path)
+            sheet_names = workbook_info.sheet_names
 
             return {
                 "file_path": str(file_path),
@@ -0,0 +1,177 @@
+"""Trace Events - Opt-in timeline of the jsontable pipeline stages.
+
+Spans (directive phases, Excel pipeline stages, cache lookups) are recorded
+as complete ("X") events of the Trace Event Format, with the process and
+thread that ran them and arguments such as row and column counts. The JSON
+written by ``write_trace`` loads in Perfetto (https://ui.perfetto.dev) and
+chrome://tracing.
+
+Tracing is off until ``enable_tracing`` is called. While it is off, ``span``
+returns one shared no-op span, so instrumented code pays a function call per
+stage and nothing else; arguments that are expensive to compute are guarded
+with the span's ``enabled`` flag.
+"""
+
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Union
+
+# Events recorded by this process; None while tracing is off
+_events: Optional[List[Dict[str, Any]]] = None
+
+
+class Span:
+    """A timed stage, recorded as one complete event when it ends."""
+
+    __slots__ = ("name", "category", "args", "_start")
+
+    enabled = True
+
+    def __init__(self, name: str, category: str, args: Dict[str, Any]):
+        self.name = name
+        self.category = category
+        self.args = args
+        self._start = 0
+
+    def set(self, **args: Any) -> None:
+        """Add arguments known only once the stage has run (e.g. rows)."""
+        self.args.update(args)
+
+    def __enter__(self) -> "Span":
+        self._start = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        end = time.perf_counter_ns()
+        events = _events
+        if events is not None:
+            if exc_type is not None:
+                self.args["error"] = exc_type.__name__
+            events.append(
+                {
+                    "name": self.name,
+                    "cat": self.category,
+                    "ph": "X",
+                    "ts": self._start / 1000,
+                    "dur": (end - self._start) / 1000,
+                    "pid": os.getpid(),
+                    "tid": threading.get_native_id(),
+                    "args": self.args,
+                }
+            )
+        return False
+
+
+class _NullSpan:
+    """Span returned while tracing is off."""
+
+    __slots__ = ()
+
+    enabled = False
+
+    def set(self, **args: Any) -> None:
+        pass
+
+    def __enter__(self) -> "_NullSpan":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, traceback: Any) -> bool:
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+def span(name: str, category: str = "jsontable", **args: Any) -> Union[Span, _NullSpan]:
+    """Return a context manager timing one stage.
+
+    Args:
+        name: Stage name shown on the timeline
+        category: Event category (e.g. "directive", "excel", "cache")
+        **args: Arguments shown with the event
+
+    Returns:
+        A recording span, or a shared no-op span while tracing is off
+    """
+    if _events is None:
+        return _NULL_SPAN
+    return Span(name, category, args)
+
+
+def tracing_enabled() -> bool:
+    """Whether spans are being recorded."""
+    return _events is not None
+
+
+def enable_tracing() -> None:
+    """Start recording spans (events recorded so far are kept)."""
+    global _events
+    if _events is None:
+        _events = []
+
+
+def disable_tracing() -> List[Dict[str, Any]]:
+    """Stop recording spans and return the events not taken yet."""
+    global _events
+    events, _events = _events or [], None
+    return events
+
+
+def take_events() -> List[Dict[str, Any]]:
+    """Return and forget the events recorded so far; tracing stays on."""
+    global _events
+    if not _events:
+        return []
+    events, _events = _events, []
+    return events
+
+
+def add_events(events: Iterable[Dict[str, Any]]) -> None:
+    """Add events recorded by another process (ignored while tracing is off)."""
+    if _events is not None:
+        _events.extend(events)
+
+
+def write_trace(
+    path: Union[str, Path],
+    events: List[Dict[str, Any]],
+    main_pid: Optional[int] = None,
+) -> None:
+    """Write events as a trace-event JSON file.
+
+    Args:
+        path: Output file
+        events: Recorded events
+        main_pid: Process to label as the build's main process; the other
+            processes are labelled as workers
+    """
+    metadata = [
+        {
+            "name": "process_name",
+            "ph": "M",
+            "pid": pid,
+            "args": {"name": "sphinx-build" if pid == main_pid else f"worker {pid}"},
+        }
+        for pid in sorted({event["pid"] for event in events})
+    ]
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(
+            {"traceEvents": metadata + events, "displayTimeUnit": "ms"},
+            f,
+            default=str,
+        )
+
+
+def _forget_parent_events() -> None:
+    """Start a forked child with no events, so they are not reported twice."""
+    if _events is not None:
+        _events.clear()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_forget_parent_events)
@@ -10,6 +10,7 @@ from unittest.mock import Mock
 
 import pandas as pd
 import pytest
+from docutils import nodes
 
 from sphinxcontrib.jsontable.directives.directive_core import JsonTableDirective
 
@@ -161,6 +162,33 @@ class TestBenchmarkCore:
         result = benchmark(directive_init)
         assert result is not None
 
+    @pytest.mark.benchmark
+    def test_inline_directive_fixed_cost_benchmark(self, benchmark):
+        """小さなインラインテーブル1件あたりの固定コストのベンチマーク.
+
+        プロセッサはディレクティブ間で共有されるため、構築コストは含まれない。
+        """
+
+        def inline_directive():
+            """ベンチマーク対象の処理."""
+            directive = JsonTableDirective(
+                name="jsontable",
+                arguments=[],
+                options={"header": None},
+                content=['[{"name": "Alice", "age": 30}]'],
+                lineno=1,
+                content_offset=0,
+                block_text="",
+                state=self.mock_state,
+                state_machine=Mock(),
+            )
+            return directive, directive.run()
+
+        directive, result = benchmark(inline_directive)
+        assert isinstance(result[0], nodes.table)
+        assert directive.json_processor is self.directive.json_processor
+        assert directive.table_converter is self.directive.table_converter
+
 
 if __name__ == "__main__":
     # スタンドアロンテスト実行
@@ -0,0 +1,133 @@
+"""Unit tests for the size-aware LRU data cache."""
+
+import threading
+
+import pytest
+
+from sphinxcontrib.jsontable.core.data_cache import (
+    CacheStats,
+    LRUCache,
+    cache_statistics,
+    estimate_size,
+)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def _table(rows, columns=4):
+    return [[f"cell{row}-{column}" for column in range(columns)] for row in range(rows)]
+
+
+class TestLRUCache:
+    """Test suite for ordering, budgets and expiry."""
+
+    def test_least_recently_used_evicted(self):
+        cache = LRUCache(max_entries=2, stripes=1)
+        cache["a"] = 1
+        cache["b"] = 2
+        assert cache["a"] == 1  # refreshes "a"
+        cache["c"] = 3
+
+        assert "b" not in cache
+        assert cache.keys() == ["a", "c"]
+        assert cache.stats().evictions == 1
+
+    def test_byte_budget(self):
+        cache = LRUCache(max_bytes=1000, stripes=1, sizeof=lambda value: value)
+        cache["small"] = 300
+        cache["medium"] = 500
+        cache["large"] = 600  # needs both older entries gone
+
+        assert cache.keys() == ["large"]
+        assert cache.stats().bytes == 600
+
+    def test_entry_over_budget_not_cached(self):
+        cache = LRUCache(max_bytes=100, stripes=1, sizeof=lambda value: value)
+        assert cache.put("huge", 101) is False
+        assert len(cache) == 0
+
+    def test_ttl(self):
+        clock = FakeClock()
+        cache = LRUCache(ttl=10, clock=clock)
+        cache["key"] = "value"
+
+        clock.now = 10
+        assert cache.get("key") == "value"
+        clock.now = 10.5
+        assert cache.get("key") is None
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.expirations) == (1, 1, 1)
+        assert stats.entries == 0
+
+    def test_replace_and_pop(self):
+        cache = LRUCache(sizeof=lambda value: 10)
+        cache["key"] = "old"
+        cache["key"] = "new"
+        assert cache.stats().bytes == 10
+        assert cache.pop("key") == "new"
+        assert cache.pop("key", None) is None
+        with pytest.raises(KeyError):
+            cache["key"]
+
+    def test_clear_keeps_counters(self):
+        cache = LRUCache()
+        cache["key"] = "value"
+        cache.get("key")
+        cache.clear()
+
+        assert len(cache) == 0
+        assert cache.stats() == CacheStats(hits=1)
+
+    def test_concurrent_access(self):
+        cache = LRUCache(max_entries=50, stripes=4)
+
+        def work(offset):
+            for i in range(500):
+                cache[(offset, i % 80)] = i
+                cache.get((offset, (i * 7) % 80))
+
+        threads = [threading.Thread(target=work, args=(n,)) for n in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        stats = cache.stats()
+        assert len(cache) == stats.entries <= 52  # 13 per stripe
+        assert stats.lookups == 2000
+
+
+class TestEstimateSize:
+    """Test suite for table size estimates."""
+
+    def test_grows_with_rows_and_columns(self):
+        assert estimate_size(_table(100)) > 9 * estimate_size(_table(10))
+        assert estimate_size(_table(10, columns=8)) > estimate_size(_table(10))
+
+    def test_sampled_estimate_close_to_full_walk(self):
+        table = _table(5000)
+        exact = estimate_size(table[:32]) * len(table) / 32
+        assert estimate_size(table) == pytest.approx(exact, rel=0.1)
+
+    def test_scalars(self):
+        assert estimate_size("x" * 1000) > 1000
+        assert estimate_size([]) > 0
+
+
+def test_cache_statistics_summed_by_name():
+    first = LRUCache(name="stats-test")
+    second = LRUCache(name="stats-test")
+    first.get("missing")
+    second["key"] = "value"
+    second.get("key")
+
+    stats = cache_statistics()["stats-test"]
+    assert (stats.hits, stats.misses, stats.entries) == (1, 1, 1)
+    assert stats.hit_rate == 0.5
@@ -574,6 +574,58 @@ class TestPrivateMethodsCore:
 
         assert result[1][0] == "NULL"  # カスタム置換文字
 
+    def test_convert_dataframe_values_mixed_object_column(self, converter):
+        """シート読み込み時の混在列(object)の型変換を確認する。
+
+        機能保証項目:
+        - 整数値のfloatはintへ変換
+        - int・bool・文字列はそのまま保持
+        - その他の型(日時・NumPy整数)は文字列化
+        """
+        df = pd.DataFrame(
+            {
+                "A": ["name", 2.0, 2.5, True, np.int64(4), pd.Timestamp("2024-03-01")],
+                "B": [1e20, -0.0, np.inf, None, "12", 3],
+            }
+        )
+
+        result = converter._convert_dataframe_values(df)
+
+        assert result == [
+            ["name", int(1e20)],
+            [2, 0],
+            [2.5, np.inf],
+            [True, ""],
+            ["4", "12"],
+            ["2024-03-01 00:00:00", 3],
+        ]
+        assert type(result[1][0]) is int
+        assert type(result[3][0]) is bool
+
+    def test_convert_dataframe_values_typed_columns(self, converter):
+        """数値型・日時型の列がPythonの値へ変換されることを確認する。"""
+        df = pd.DataFrame(
+            {
+                "A": [1, 2],
+                "B": [1.0, np.nan],
+                "C": pd.to_datetime(["2024-03-01", None]),
+            }
+        )
+
+        result = converter._convert_dataframe_values(df)
+
+        assert result == [[1, 1, "2024-03-01 00:00:00"], [2, "", ""]]
+        assert [type(value) for value in result[0][:2]] == [int, int]
+
+    def test_convert_dataframe_values_skip_row(self, converter):
+        """指定行(ヘッダー行)が結果から除かれることを確認する。"""
+        df = pd.DataFrame([["a", 1], ["name", "qty"], ["b", 2]])
+
+        assert converter._convert_dataframe_values(df, skip_row=1) == [
+            ["a", 1],
+            ["b", 2],
+        ]
+
     def test_is_numeric_value_various_types(self, converter):
         """様々な型での数値判定を確認する。
 
@@ -0,0 +1,168 @@
+"""Unit tests for the pluggable Excel engine registry."""
+
+import datetime
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+import pytest
+from openpyxl.styles import PatternFill
+
+from sphinxcontrib.jsontable.core import excel_engines
+from sphinxcontrib.jsontable.core.excel_engines import (
+    ExcelEngine,
+    available_engines,
+    get_engine,
+    register_engine,
+    select_engine,
+    trim_blank_rows,
+)
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+
+
+@pytest.fixture(scope="module")
+def workbook_path(tmp_path_factory):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Data"
+    sheet.append(["name", "joined", "score", "active"])
+    for i in range(20):
+        sheet.append(
+            [f"user{i}", datetime.datetime(2024, 3, 1 + i), i * 1.5, i % 3 == 0]
+        )
+    sheet["F5"] = "#DIV/0!"
+    sheet["A30"] = "total"
+
+    path = tmp_path_factory.mktemp("engines") / "data.xlsx"
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture(scope="module")
+def phantom_path(tmp_path_factory):
+    """Small table inside a huge formatted-but-empty used range."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Export"
+    for row in [["id", "name"], [1, "a"], [2, None], [3, "c"]]:
+        sheet.append(row)
+    fill = PatternFill("solid", fgColor="FFFF00")
+    sheet.cell(row=1, column=300).fill = fill
+    for row in range(5, 3000):
+        sheet.cell(row=row, column=1).fill = fill
+
+    path = tmp_path_factory.mktemp("engines") / "phantom.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestEngineParity:
+    """Every engine returns the pandas DataFrame for the same read."""
+
+    @pytest.mark.parametrize("engine", ["openpyxl", "streaming"])
+    @pytest.mark.parametrize(
+        "options", [{}, {"nrows": 4}, {"skiprows": 3, "nrows": 5}, {"skiprows": 25}]
+    )
+    def test_matches_pandas(self, workbook_path, engine, options):
+        result = ExcelReader(engine=engine).read_workbook(workbook_path, **options)
+        expected = ExcelReader(engine="pandas").read_workbook(workbook_path, **options)
+
+        assert result.metadata["engine"] == engine
+        pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+
+    def test_openpyxl_engine_bypasses_read_excel(self, workbook_path):
+        with patch("pandas.read_excel") as read_excel:
+            result = ExcelReader(engine="openpyxl").read_workbook(
+                workbook_path, nrows=2
+            )
+
+        read_excel.assert_not_called()
+        assert result.dataframe.iloc[1, 0] == "user0"
+
+
+class TestPhantomUsedRange:
+    """Formatted-but-empty trailing rows and columns are trimmed on read."""
+
+    @pytest.mark.parametrize("engine", ["auto", "openpyxl", "streaming"])
+    def test_trailing_blank_cells_trimmed(self, phantom_path, engine):
+        result = ExcelReader(engine=engine).read_workbook(phantom_path)
+        expected = ExcelReader(engine="pandas").read_workbook(phantom_path)
+
+        assert result.dataframe.shape == (4, 2)
+        pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+
+    def test_auto_streams_phantom_used_range(self, phantom_path, workbook_path):
+        phantom = select_engine(phantom_path, {"header": None}, sheet_name="Export")
+        dense = select_engine(workbook_path, {"header": None}, sheet_name="Data")
+
+        assert phantom.name == "streaming"
+        assert dense.name == "pandas"
+
+    def test_trim_blank_rows_defers_blank_rows(self):
+        rows = [["a", ""], [], ["", ""], ["b"], [""], []]
+        assert list(trim_blank_rows(rows)) == [["a"], [], [], ["b"]]
+
+
+class TestSelectEngine:
+    """Test suite for automatic and pinned engine choice."""
+
+    def test_auto_uses_pandas_for_full_reads(self, workbook_path):
+        assert select_engine(workbook_path, {"header": None}).name == "pandas"
+
+    def test_auto_streams_row_windows(self, workbook_path):
+        options = {"header": None, "skiprows": 5, "nrows": 10}
+        assert select_engine(workbook_path, options).name == "streaming"
+
+    def test_auto_uses_pandas_for_other_options(self, workbook_path):
+        options = {"header": None, "nrows": 10, "usecols": "A:B"}
+        assert select_engine(workbook_path, options).name == "pandas"
+
+    def test_large_files_prefer_calamine_when_installed(self, workbook_path):
+        calamine = get_engine("calamine")
+        options = {"header": None}
+        with patch.object(excel_engines, "LARGE_FILE_BYTES", 1):
+            with patch.object(type(calamine), "available", return_value=True):
+                assert select_engine(workbook_path, options) is calamine
+            with patch.object(type(calamine), "available", return_value=False):
+                assert select_engine(workbook_path, options).name == "streaming"
+
+    def test_pinned_engine_used_when_it_supports_the_read(self, workbook_path):
+        engine = select_engine(workbook_path, {"header": None}, "openpyxl")
+        assert engine.name == "openpyxl"
+
+    def test_pinned_engine_falls_back_for_unsupported_options(self, workbook_path):
+        options = {"header": 0}
+        assert select_engine(workbook_path, options, "streaming").name == "pandas"
+
+    def test_unavailable_engine_falls_back_to_auto(self):
+        calamine = get_engine("calamine")
+        with patch.object(type(calamine), "available", return_value=False):
+            assert ExcelReader(engine="calamine").engine == "auto"
+        assert ExcelReader(engine="lotus").engine == "auto"
+
+
+class TestRegistry:
+    """Test suite for engine registration."""
+
+    def test_builtin_engines_registered(self):
+        assert {"pandas", "openpyxl", "streaming"} <= set(available_engines())
+
+    def test_unknown_engine_rejected(self):
+        with pytest.raises(ValueError, match="Unknown Excel engine"):
+            get_engine("lotus")
+
+    def test_custom_engine_can_be_registered(self, workbook_path):
+        class FixedEngine(ExcelEngine):
+            name = "fixed"
+
+            def read(self, reader, file_path, sheet_name, options):
+                return pd.DataFrame([[sheet_name]])
+
+        register_engine(FixedEngine())
+        try:
+            result = ExcelReader(engine="fixed").read_workbook(workbook_path)
+        finally:
+            excel_engines._ENGINES.pop("fixed")
+
+        assert result.dataframe.iloc[0, 0] == "Data"
+        assert result.metadata["engine"] == "fixed"
@@ -0,0 +1,162 @@
+"""Unit tests for the streaming (iterparse) Excel sheet reader."""
+
+import datetime
+from unittest.mock import patch
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.core import excel_reader_streaming
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.excel_reader_streaming import StreamingExcelReader
+from sphinxcontrib.jsontable.core.workbook_package import WorkbookPackage, open_package
+from sphinxcontrib.jsontable.errors.excel_errors import WorksheetNotFoundError
+
+
+@pytest.fixture(scope="module")
+def workbook_path(tmp_path_factory):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Orders"
+    sheet.append(["item", "ordered", "qty", "paid", "ratio"])
+    for i in range(60):
+        sheet.append(
+            [
+                f"item{i % 7}",
+                datetime.datetime(2024, 1, 1) + datetime.timedelta(days=i),
+                i,
+                i % 2 == 0,
+                i / 4 if i % 5 else None,
+            ]
+        )
+    sheet["G4"] = "#N/A"
+    sheet["A80"] = "footer"
+    workbook.create_sheet("Sparse")["C3"] = "only"
+
+    path = tmp_path_factory.mktemp("streaming") / "orders.xlsx"
+    workbook.save(path)
+    return path
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"nrows": 5}, {"skiprows": 2, "nrows": 10}, {"skiprows": 55, "nrows": 40}],
+)
+@pytest.mark.parametrize("sheet_name", ["Orders", "Sparse"])
+def test_matches_pandas_reader(workbook_path, sheet_name, options):
+    streamed = StreamingExcelReader().read_workbook(
+        workbook_path, sheet_name=sheet_name, **options
+    )
+    expected = ExcelReader().read_workbook(
+        workbook_path, sheet_name=sheet_name, **options
+    )
+
+    pd.testing.assert_frame_equal(streamed.dataframe, expected.dataframe)
+    assert streamed.metadata["engine"] == "streaming"
+    assert streamed.metadata["sheet_name"] == sheet_name
+
+
+@pytest.fixture(scope="module")
+def formula_workbook_path(tmp_path_factory):
+    # openpyxl saves formulas without a cached result: <c><f>B2*2</f><v /></c>
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["item", "qty", "double", "note"])
+    for i in range(2, 12):
+        sheet.append([f"item{i}", i, f"=B{i}*2", "x" if i % 3 else None])
+    sheet["E6"] = '=A6&"!"'
+
+    path = tmp_path_factory.mktemp("streaming") / "formulas.xlsx"
+    workbook.save(path)
+    return path
+
+
+def test_formula_without_cached_value_reads_as_blank(formula_workbook_path):
+    result = StreamingExcelReader().read_workbook(formula_workbook_path)
+
+    assert result.dataframe.iloc[1, 1] == 2
+    assert result.dataframe.iloc[1:, 2].isna().all()
+
+
+@pytest.mark.parametrize(
+    "options", [{}, {"nrows": 3}, {"skiprows": 4, "nrows": 3}, {"skiprows": 6}]
+)
+def test_formula_workbook_matches_pandas(formula_workbook_path, options):
+    streamed = StreamingExcelReader().read_workbook(formula_workbook_path, **options)
+    expected = pd.read_excel(
+        formula_workbook_path, sheet_name=0, header=None, engine="openpyxl", **options
+    )
+
+    pd.testing.assert_frame_equal(streamed.dataframe, expected)
+
+
+def test_stops_after_last_requested_row(workbook_path):
+    decoded_rows = []
+    original = excel_reader_streaming._iter_sheet_rows
+
+    def tracking(*args, **kwargs):
+        for row_number, cells in original(*args, **kwargs):
+            decoded_rows.append(row_number)
+            yield row_number, cells
+
+    with patch.object(excel_reader_streaming, "_iter_sheet_rows", tracking):
+        result = StreamingExcelReader().read_workbook(workbook_path, nrows=3)
+
+    assert result.dataframe.shape == (3, 7)
+    # pandas semantics: one row past the window is inspected, nothing more
+    assert max(decoded_rows) == 4
+
+
+def test_resolves_only_referenced_shared_strings(tmp_path):
+    xlsxwriter = pytest.importorskip("xlsxwriter")
+    path = tmp_path / "shared.xlsx"
+    workbook = xlsxwriter.Workbook(str(path))
+    sheet = workbook.add_worksheet("Data")
+    for row in range(50):
+        sheet.write_row(row, 0, [f"name{row}", f"group{row % 3}", row])
+    workbook.close()
+
+    with patch.object(
+        WorkbookPackage,
+        "resolve_shared_strings",
+        autospec=True,
+        side_effect=WorkbookPackage.resolve_shared_strings,
+    ) as resolver:
+        result = StreamingExcelReader().read_workbook(path, skiprows=10, nrows=2)
+
+    # name10, name11, group1, group2 (indices in first-use order)
+    assert resolver.call_args.args[1] == {13, 14, 3, 5}
+    # The table is parsed no further than the highest index needed
+    assert open_package(path).shared_strings.parsed_count == 15
+    assert result.dataframe.values.tolist() == [
+        ["name10", "group1", 10],
+        ["name11", "group2", 11],
+    ]
+    pd.testing.assert_frame_equal(
+        result.dataframe,
+        ExcelReader().read_workbook(path, skiprows=10, nrows=2).dataframe,
+    )
+
+
+def test_unsupported_options_fall_back_to_pandas(workbook_path):
+    result = StreamingExcelReader().read_workbook(workbook_path, usecols="A:B")
+
+    assert result.metadata["engine"] == "pandas"
+    assert result.dataframe.shape == (80, 2)
+
+
+def test_parse_failure_falls_back_to_pandas(workbook_path):
+    with patch.object(
+        excel_reader_streaming, "read_sheet_window", side_effect=ValueError
+    ):
+        result = StreamingExcelReader().read_workbook(workbook_path, nrows=5)
+
+    expected = ExcelReader().read_workbook(workbook_path, nrows=5)
+    pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+    assert result.metadata["engine"] == "pandas"
+
+
+def test_unknown_sheet_raises(workbook_path):
+    with pytest.raises(WorksheetNotFoundError):
+        StreamingExcelReader().read_workbook(workbook_path, sheet_name="Missing")
@@ -0,0 +1,71 @@
+"""Unit tests for content fingerprints."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sphinxcontrib.jsontable.core import file_fingerprint as fingerprints
+from sphinxcontrib.jsontable.core.file_fingerprint import (
+    FingerprintService,
+    content_digest,
+)
+
+
+def _touch(path, nanoseconds=1_000_000_000):
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + nanoseconds))
+
+
+@pytest.fixture
+def data_file(tmp_path):
+    path = tmp_path / "data.xlsx"
+    path.write_bytes(b"spreadsheet" * 1000)
+    return path
+
+
+class TestFingerprintService:
+    """Test suite for memoized content fingerprints."""
+
+    def test_unchanged_stat_not_rehashed(self, data_file):
+        service = FingerprintService()
+        with patch.object(
+            fingerprints, "content_digest", wraps=fingerprints.content_digest
+        ) as digest:
+            first = service.fingerprint(data_file)
+            assert service.fingerprint(str(data_file)) == first
+        assert digest.call_count == 1
+
+    def test_new_mtime_same_content(self, data_file):
+        service = FingerprintService()
+        first = service.fingerprint(data_file)
+        _touch(data_file)
+
+        assert service.fingerprint(data_file) == first
+        assert service.hashed_files == 2
+
+    def test_changed_content(self, data_file):
+        service = FingerprintService()
+        first = service.fingerprint(data_file)
+        data_file.write_bytes(b"spreadsheet" * 999 + b"changed!!!!")
+        _touch(data_file)
+
+        assert service.fingerprint(data_file) != first
+
+    def test_clear_forgets_memo(self, data_file):
+        service = FingerprintService()
+        service.fingerprint(data_file)
+        service.clear()
+        service.fingerprint(data_file)
+        assert service.hashed_files == 2
+
+    def test_missing_file(self, tmp_path):
+        with pytest.raises(OSError):
+            FingerprintService().fingerprint(tmp_path / "missing.xlsx")
+
+
+def test_digest_streams_in_chunks(data_file):
+    with patch.object(fingerprints, "_CHUNK_BYTES", 7):
+        chunked = content_digest(data_file)
+    assert chunked == content_digest(data_file)
+    assert chunked.split(":")[0] in ("xxh3", "b2b")
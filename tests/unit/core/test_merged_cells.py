@@ -0,0 +1,124 @@
+"""Unit tests for merged cell handling."""
+
+from unittest.mock import patch
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.core import excel_reader_streaming
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.merged_cells import (
+    MergedCellIndex,
+    MergedRange,
+    parse_merge_mode,
+)
+
+
+@pytest.fixture
+def merged_path(tmp_path):
+    """Title merged across A1:D1 and a group label merged over A4:A6."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet["A1"] = "Report"
+    sheet.merge_cells("A1:D1")
+    sheet.append([])
+    sheet.append(["region", "q1", "q2", "q3"])
+    sheet["A4"] = "EU"
+    sheet.merge_cells("A4:A6")
+    for row in range(4, 7):
+        for column in range(2, 5):
+            sheet.cell(row, column, row * column)
+
+    path = tmp_path / "merged.xlsx"
+    workbook.save(path)
+    return path
+
+
+def _sheet():
+    return pd.DataFrame(
+        [
+            ["Report", np.nan, np.nan],
+            ["region", "q1", "q2"],
+            ["EU", 1, 2],
+            [np.nan, 3, 4],
+        ]
+    )
+
+
+class TestMergedCellIndex:
+    """Test suite for the interval index."""
+
+    index = MergedCellIndex.from_refs(["A1:C1", "A3:A4", "C5:D9"])
+
+    def test_find(self):
+        assert self.index.find(1, 2) == MergedRange(1, 1, 1, 3)
+        assert self.index.find(4, 1).range_spec == "A3:A4"
+        assert self.index.find(7, 4).range_spec == "C5:D9"
+        assert self.index.find(4, 2) is None
+        assert self.index.find(7, 5) is None
+
+    def test_anchors_above(self):
+        assert self.index.anchors_above(3) == []
+        assert [m.range_spec for m in self.index.anchors_above(6)] == ["C5:D9"]
+
+    def test_rows_outside_window_dropped(self):
+        index = MergedCellIndex.from_refs(
+            ["A1:C1", "A3:A4", "C5:D9"], first_row=2, last_row=4
+        )
+        assert [m.range_spec for m in index.ranges] == ["A3:A4"]
+        assert index.find(1, 1) is None
+
+    def test_expand(self):
+        result = MergedCellIndex.from_refs(["A1:C1", "A3:A4"]).apply(_sheet(), "expand")
+        assert result.values.tolist() == [
+            ["Report", "Report", "Report"],
+            ["region", "q1", "q2"],
+            ["EU", 1, 2],
+            ["EU", 3, 4],
+        ]
+
+    def test_first_clears_hidden_values(self):
+        sheet = _sheet()
+        sheet.iloc[0, 1] = "stale"
+        result = MergedCellIndex.from_refs(["A1:C1"]).apply(sheet, "first")
+
+        assert result.iloc[0, 0] == "Report"
+        assert result.iloc[0, 1:].isna().all()
+
+    def test_skip_blanks_whole_area(self):
+        result = MergedCellIndex.from_refs(["A1:C1", "A3:A4"]).apply(_sheet(), "skip")
+        assert result.iloc[0].isna().all()
+        assert result.iloc[2:, 0].isna().all()
+
+    def test_row_offset(self):
+        # The frame holds sheet rows 3-4
+        result = MergedCellIndex.from_refs(["A3:A4"]).apply(
+            _sheet().iloc[2:], "expand", row_offset=2
+        )
+        assert result.iloc[:, 0].tolist() == ["EU", "EU"]
+
+    def test_untouched_frame_returned_as_is(self):
+        sheet = _sheet()
+        assert MergedCellIndex.from_refs(["F1:G2"]).apply(sheet, "expand") is sheet
+
+    @pytest.mark.parametrize("value, expected", [(" Expand", "expand"), ("x", None)])
+    def test_parse_merge_mode(self, value, expected):
+        assert parse_merge_mode(value) == expected
+
+
+class TestReadMergedRanges:
+    """Test suite for reading merged areas from the sheet XML."""
+
+    def test_merged_ranges(self, merged_path):
+        assert ExcelReader().merged_ranges(merged_path) == ["A1:D1", "A4:A6"]
+
+    def test_tags_split_across_chunks(self, merged_path):
+        with patch.object(excel_reader_streaming, "_SCAN_CHUNK_BYTES", 7):
+            assert ExcelReader().merged_ranges(merged_path) == ["A1:D1", "A4:A6"]
+
+    def test_no_merged_cells(self, tmp_path):
+        path = tmp_path / "plain.xlsx"
+        pd.DataFrame([[1, 2]]).to_excel(path, index=False, header=False)
+        assert ExcelReader().merged_ranges(path) == []
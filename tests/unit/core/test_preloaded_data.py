@@ -0,0 +1,75 @@
+"""Unit tests for sheets preloaded before a parallel read."""
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.preloaded_data import (
+    clear_preloaded_sheets,
+    preloaded_sheets,
+)
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Items"
+    sheet.append(["name", "count"])
+    for i in range(10):
+        sheet.append([f"item{i}", i])
+    path = tmp_path / "items.xlsx"
+    workbook.save(path)
+    return path
+
+
+@pytest.fixture(autouse=True)
+def _clear_store():
+    yield
+    clear_preloaded_sheets()
+
+
+def _preload(path, sheet="Items"):
+    rows = ExcelReader().sheet_rows(path, sheet)
+    preloaded_sheets().put(path, sheet, rows)
+    return rows
+
+
+@pytest.mark.parametrize("options", [{}, {"nrows": 3}, {"skiprows": 4, "nrows": 2}])
+def test_preloaded_reads_match_file_reads(workbook_path, options):
+    expected = ExcelReader().read_workbook(workbook_path, **options)
+    _preload(workbook_path)
+
+    result = ExcelReader().read_workbook(workbook_path, **options)
+    pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+    assert result.metadata["engine"] == "preloaded"
+
+
+def test_preloaded_rows_not_modified_by_reads(workbook_path):
+    rows = _preload(workbook_path)
+    rows[3].append("")  # a trailing blank cell, trimmed by reads
+    ExcelReader().read_workbook(workbook_path)
+    assert rows[3] == ["item2", 2, ""]
+
+
+def test_modified_workbook_not_served(workbook_path):
+    _preload(workbook_path)
+    workbook = openpyxl.load_workbook(workbook_path)
+    workbook["Items"]["A2"] = "changed"
+    workbook.save(workbook_path)
+
+    result = ExcelReader().read_workbook(workbook_path)
+    assert result.dataframe.iloc[1, 0] == "changed"
+    assert result.metadata["engine"] != "preloaded"
+    assert len(preloaded_sheets()) == 0
+
+
+def test_pinned_engine_ignores_preloaded_rows(workbook_path):
+    _preload(workbook_path)
+    result = ExcelReader(engine="pandas").read_workbook(workbook_path)
+    assert result.metadata["engine"] == "pandas"
+
+
+def test_sheet_rows_unknown_sheet(workbook_path):
+    assert ExcelReader().sheet_rows(workbook_path, "Missing") is None
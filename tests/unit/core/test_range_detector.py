@@ -0,0 +1,137 @@
+"""Unit tests for data island (table region) detection."""
+
+import openpyxl
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.range_detector import (
+    DataIsland,
+    dataframe_cells,
+    detect_islands,
+    parse_detect_mode,
+    select_island,
+)
+from sphinxcontrib.jsontable.errors.excel_errors import RangeValidationError
+
+
+def _cells(*blocks):
+    """Row-major coordinates of rectangular blocks given as (r1, c1, r2, c2)."""
+    cells = {
+        (row, column)
+        for r1, c1, r2, c2 in blocks
+        for row in range(r1, r2 + 1)
+        for column in range(c1, c2 + 1)
+    }
+    return sorted(cells)
+
+
+@pytest.fixture
+def report_path(tmp_path):
+    """Title, a 3x3 table, a note and a second table below."""
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Report"
+    sheet["A1"] = "Quarterly report"
+    for row, values in enumerate([["region", "q1"], ["east", 1], ["west", 3]], 3):
+        for column, value in enumerate(values, 2):
+            sheet.cell(row, column, value)
+    sheet["F2"] = "note"
+    for row, values in enumerate([["id", "owner"], [1, "kim"]], 9):
+        for column, value in enumerate(values, 1):
+            sheet.cell(row, column, value)
+    sheet["D20"] = ""  # empty strings are not data
+
+    path = tmp_path / "report.xlsx"
+    workbook.save(path)
+    return path
+
+
+class TestDetectIslands:
+    """Test suite for connected-component detection."""
+
+    def test_blocks_separated_by_empty_rows_and_columns(self):
+        islands = detect_islands(_cells((1, 1, 1, 2), (3, 2, 6, 4), (3, 7, 4, 8)))
+
+        assert [i.range_spec for i in islands] == ["A1:B1", "B3:D6", "G3:H4"]
+        assert islands[1].cell_count == 12
+
+    def test_diagonal_cells_are_connected(self):
+        islands = detect_islands([(1, 1), (2, 2), (3, 3)])
+        assert [i.range_spec for i in islands] == ["A1:C3"]
+
+    def test_runs_joined_through_a_wide_row(self):
+        # Two columns that only meet through the header row form one table
+        islands = detect_islands(_cells((1, 1, 1, 5), (2, 1, 4, 1), (2, 5, 4, 5)))
+        assert [i.range_spec for i in islands] == ["A1:E4"]
+
+    def test_islands_inside_another_frame_are_merged(self):
+        # A note sitting inside the bounding box of a U-shaped block
+        cells = _cells((1, 1, 5, 1), (5, 1, 5, 5), (1, 5, 5, 5), (2, 3, 2, 3))
+        islands = detect_islands(cells)
+
+        assert [i.range_spec for i in islands] == ["A1:E5"]
+        assert islands[0].cell_count == len(cells)
+
+    def test_empty_sheet(self):
+        assert detect_islands([]) == []
+
+
+class TestSelectIsland:
+    """Test suite for choosing the island to render."""
+
+    islands = [
+        DataIsland(1, 1, 1, 6, 6),  # title row
+        DataIsland(3, 1, 5, 2, 6),
+        DataIsland(8, 1, 12, 3, 15),
+    ]
+
+    def test_auto_prefers_the_largest_table(self):
+        assert select_island(self.islands, "auto") is self.islands[2]
+
+    def test_auto_skips_single_row_and_column_islands(self):
+        islands = [DataIsland(1, 1, 1, 20, 20), DataIsland(3, 1, 4, 2, 4)]
+        assert select_island(islands, "auto") is islands[1]
+        assert select_island(islands, "largest") is islands[0]
+
+    def test_numbered_island(self):
+        assert select_island(self.islands, 2) is self.islands[1]
+
+    def test_missing_numbered_island(self):
+        with pytest.raises(RangeValidationError, match="has 3 data region"):
+            select_island(self.islands, 4)
+
+    def test_no_islands(self):
+        assert select_island([], "auto") is None
+
+    @pytest.mark.parametrize(
+        "value, expected",
+        [(None, "auto"), ("", "auto"), (" Largest ", "largest"), ("2", 2)],
+    )
+    def test_parse_detect_mode(self, value, expected):
+        assert parse_detect_mode(value) == expected
+
+    @pytest.mark.parametrize("value", ["0", "-1", "biggest"])
+    def test_parse_detect_mode_rejects_invalid(self, value):
+        with pytest.raises(ValueError, match="Invalid detect mode"):
+            parse_detect_mode(value)
+
+
+class TestOccupiedCells:
+    """Test suite for the cell coordinates fed to the detector."""
+
+    def test_streamed_cells_match_dataframe_cells(self, report_path):
+        reader = ExcelReader()
+        streamed = list(reader.occupied_cells(report_path))
+        expected = list(dataframe_cells(reader.read_workbook(report_path).dataframe))
+
+        assert streamed == expected
+        assert (20, 4) not in streamed
+
+    def test_islands_of_report(self, report_path):
+        islands = detect_islands(ExcelReader().occupied_cells(report_path))
+        assert [i.range_spec for i in islands] == ["A1:A1", "F2:F2", "B3:C5", "A9:B10"]
+
+    def test_dataframe_cells_skip_blank_values(self):
+        frame = pd.DataFrame([["a", None], ["", 2]])
+        assert list(dataframe_cells(frame)) == [(1, 1), (2, 2)]
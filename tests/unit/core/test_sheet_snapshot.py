@@ -0,0 +1,218 @@
+"""Unit tests for columnar sheet snapshots."""
+
+import datetime
+import os
+from unittest.mock import patch
+
+import numpy as np
+import openpyxl
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.core import excel_reader_streaming
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.sheet_snapshot import (
+    SheetSnapshotStore,
+    decode_rows,
+    encode_rows,
+    map_arrays,
+)
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = "Log"
+    sheet.append(["event", "at", "took", "time", "ok", "score"])
+    for i in range(40):
+        sheet.append(
+            [
+                f"event{i % 6}",
+                datetime.datetime(2024, 3, 1, 8) + datetime.timedelta(hours=i),
+                datetime.timedelta(minutes=i),
+                datetime.time(9, i % 60),
+                i % 3 == 0,
+                i / 8 if i % 4 else None,
+            ]
+        )
+    sheet["H5"] = "#N/A"
+    sheet["A50"] = "total"
+    workbook.create_sheet("Empty")
+
+    path = tmp_path / "log.xlsx"
+    workbook.save(path)
+    return path
+
+
+def _reader(tmp_path, **kwargs):
+    return ExcelReader(snapshot_dir=tmp_path / "snapshots", **kwargs)
+
+
+@pytest.mark.parametrize(
+    "options",
+    [{}, {"nrows": 5}, {"skiprows": 3, "nrows": 10}, {"skiprows": 38, "nrows": 30}],
+)
+def test_snapshot_reads_match_pandas(tmp_path, workbook_path, options):
+    reader = _reader(tmp_path)
+    reader.read_workbook(workbook_path)  # writes the snapshot
+
+    result = reader.read_workbook(workbook_path, **options)
+    expected = ExcelReader().read_workbook(workbook_path, **options)
+
+    pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+    assert result.metadata["engine"] == "snapshot"
+
+
+def test_later_reads_skip_the_sheet_xml(tmp_path, workbook_path):
+    reader = _reader(tmp_path)
+    with patch.object(
+        excel_reader_streaming,
+        "read_sheet_rows",
+        wraps=excel_reader_streaming.read_sheet_rows,
+    ) as read_rows:
+        reader.read_workbook(workbook_path)
+        result = _reader(tmp_path).read_workbook(workbook_path, skiprows=10, nrows=5)
+
+    assert read_rows.call_count == 1
+    assert result.metadata["engine"] == "snapshot"
+    assert len(list((tmp_path / "snapshots").glob("*.npz"))) == 1
+
+
+def test_ranged_read_without_snapshot_stops_early(tmp_path, workbook_path):
+    decoded_rows = []
+    original = excel_reader_streaming._iter_sheet_rows
+
+    def tracking(*args, **kwargs):
+        for row_number, cells in original(*args, **kwargs):
+            decoded_rows.append(row_number)
+            yield row_number, cells
+
+    with patch.object(excel_reader_streaming, "_iter_sheet_rows", tracking):
+        result = _reader(tmp_path).read_workbook(workbook_path, skiprows=2, nrows=3)
+
+    expected = ExcelReader(engine="pandas").read_workbook(
+        workbook_path, skiprows=2, nrows=3
+    )
+    pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+    assert result.metadata["engine"] == "streaming"
+    # pandas semantics: one row past the window is inspected, nothing more
+    assert max(decoded_rows) == 6
+    assert not (tmp_path / "snapshots").exists()
+
+
+def test_snapshot_arrays_are_memory_mapped(tmp_path, workbook_path):
+    _reader(tmp_path).read_workbook(workbook_path)
+    (snapshot,) = (tmp_path / "snapshots").glob("*.npz")
+
+    arrays = map_arrays(snapshot)
+    assert isinstance(arrays["kinds"], np.memmap)
+    with np.load(snapshot) as loaded:
+        assert sorted(arrays) == sorted(loaded.files)
+        for name in loaded.files:
+            np.testing.assert_array_equal(arrays[name], loaded[name])
+
+
+def test_modified_workbook_replaces_snapshot(tmp_path, workbook_path):
+    reader = _reader(tmp_path)
+    reader.read_workbook(workbook_path)
+
+    workbook = openpyxl.load_workbook(workbook_path)
+    workbook["Log"]["A2"] = "changed"
+    workbook.save(workbook_path)
+    stat = workbook_path.stat()
+    os.utime(workbook_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+    assert reader.read_workbook(workbook_path).dataframe.iloc[1, 0] == "changed"
+    assert len(list((tmp_path / "snapshots").glob("*.npz"))) == 1
+
+
+def test_new_mtime_with_same_content_keeps_snapshot(tmp_path, workbook_path):
+    _reader(tmp_path).read_workbook(workbook_path)
+    stat = workbook_path.stat()
+    os.utime(workbook_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+    with patch.object(excel_reader_streaming, "read_sheet_rows") as read_rows:
+        result = _reader(tmp_path).read_workbook(workbook_path)
+    read_rows.assert_not_called()
+    assert result.metadata["engine"] == "snapshot"
+
+
+def test_empty_sheet(tmp_path, workbook_path):
+    result = _reader(tmp_path).read_workbook(workbook_path, sheet_name="Empty")
+    assert result.dataframe.empty
+
+
+def test_pinned_engine_bypasses_snapshots(tmp_path, workbook_path):
+    result = _reader(tmp_path, engine="pandas").read_workbook(workbook_path)
+    assert result.metadata["engine"] == "pandas"
+    assert not (tmp_path / "snapshots").exists()
+
+
+def test_unreadable_snapshot_ignored(tmp_path, workbook_path):
+    reader = _reader(tmp_path)
+    reader.read_workbook(workbook_path)
+    for snapshot in (tmp_path / "snapshots").glob("*.npz"):
+        snapshot.write_bytes(b"not an archive")
+
+    result = reader.read_workbook(workbook_path, nrows=2)
+    assert result.dataframe.iloc[1, 0] == "event0"
+
+
+@pytest.mark.parametrize("options", [{}, {"skiprows": 3}])
+def test_unparseable_sheet_read_with_pandas(tmp_path, workbook_path, options):
+    with patch.object(
+        excel_reader_streaming, "read_sheet_rows", side_effect=ValueError
+    ) as read_rows, patch.object(
+        excel_reader_streaming, "read_sheet_window"
+    ) as read_window:
+        result = _reader(tmp_path).read_workbook(workbook_path, **options)
+
+    expected = ExcelReader(engine="pandas").read_workbook(workbook_path, **options)
+    pd.testing.assert_frame_equal(result.dataframe, expected.dataframe)
+    assert result.metadata["engine"] == "pandas"
+    read_rows.assert_called_once()
+    # The sheet is not streamed a second time
+    read_window.assert_not_called()
+    assert not list((tmp_path / "snapshots").glob("*.npz"))
+
+
+class TestEncoding:
+    """Test suite for the columnar encoding."""
+
+    rows = [
+        ["name", "", 3, 2.5, True],
+        [],
+        [np.nan, datetime.datetime(2024, 1, 2, 3, 4, 5)],
+        [datetime.timedelta(hours=30), datetime.time(23, 59, 1, 7), "name"],
+    ]
+
+    def test_round_trip(self):
+        decoded = decode_rows(encode_rows(self.rows))
+
+        assert decoded[0] == ["name", "", 3, 2.5, True]
+        assert decoded[1] == [""] * 5
+        assert np.isnan(decoded[2][0])
+        assert decoded[2][1:] == [datetime.datetime(2024, 1, 2, 3, 4, 5), "", "", ""]
+        assert decoded[3][:3] == self.rows[3]
+        assert [type(value) for value in decoded[0]] == [str, str, int, float, bool]
+
+    def test_leading_rows_only(self):
+        decoded = decode_rows(encode_rows(self.rows), stop=1)
+        assert decoded == [["name", "", 3, 2.5, True]]
+
+    def test_strings_stored_once(self):
+        assert encode_rows(self.rows)["strings"].tolist() == ["name"]
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            2**70,
+            datetime.datetime(2024, 1, 1, tzinfo=datetime.timezone.utc),
+            object(),
+        ],
+    )
+    def test_unsupported_values_not_saved(self, tmp_path, workbook_path, value):
+        store = SheetSnapshotStore(tmp_path)
+        assert store.save(workbook_path, "Log", [["a", value]]) is False
+        assert store.load(workbook_path, "Log") is None
@@ -0,0 +1,96 @@
+"""Unit tests for shared workbook handles - one open workbook per read."""
+
+import os
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.workbook_handle import (
+    WorkbookCache,
+    clear_workbook_cache,
+    open_workbook,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_workbook_cache()
+    yield
+    clear_workbook_cache()
+
+
+def _write_workbook(path, rows, title="Data"):
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.title = title
+    for row in rows:
+        sheet.append(row)
+    workbook.save(path)
+    return path
+
+
+class TestWorkbookCache:
+    """Test suite for handle reuse and invalidation."""
+
+    def test_handle_reused_for_unchanged_file(self, tmp_path):
+        path = _write_workbook(tmp_path / "a.xlsx", [["x"], [1]])
+        first = open_workbook(path)
+        assert open_workbook(str(path)) is first
+        assert first.sheet_names == ["Data"]
+
+    def test_modified_file_reopened(self, tmp_path):
+        path = _write_workbook(tmp_path / "a.xlsx", [["x"], [1]])
+        first = open_workbook(path)
+
+        _write_workbook(path, [["x"], [1], [2]], title="Changed")
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = open_workbook(path)
+        assert second is not first
+        assert second.sheet_names == ["Changed"]
+
+    def test_least_recently_used_handle_evicted(self, tmp_path):
+        cache = WorkbookCache(max_open=2)
+        paths = [_write_workbook(tmp_path / f"{i}.xlsx", [[i]]) for i in range(3)]
+        first = cache.open(paths[0])
+        cache.open(paths[1])
+        cache.open(paths[0])
+        cache.open(paths[2])
+
+        assert len(cache) == 2
+        assert cache.open(paths[0]) is first
+
+
+class TestExcelReaderSingleOpen:
+    """Test suite for ExcelReader sharing one workbook across stages."""
+
+    def test_validate_and_read_open_workbook_once(self, tmp_path):
+        path = _write_workbook(
+            tmp_path / "sales.xlsx", [["region", "amount"], ["east", 10]]
+        )
+        reader = ExcelReader()
+
+        with patch(
+            "sphinxcontrib.jsontable.core.excel_reader_core.load_workbook",
+            wraps=openpyxl.load_workbook,
+        ) as loader:
+            info = reader.validate_file(path)
+            assert reader.get_sheet_names(path) == ["Data"]
+            result = reader.read_workbook(path)
+
+        assert loader.call_count == 1
+        assert loader.call_args.kwargs["read_only"] is True
+        assert info.sheet_names == ["Data"]
+        assert result.dataframe.values.tolist() == [["region", "amount"], ["east", 10]]
+
+    def test_repeated_reads_keep_working(self, tmp_path):
+        path = _write_workbook(tmp_path / "sales.xlsx", [["region"], ["east"]])
+        reader = ExcelReader()
+
+        first = reader.read_workbook(path)
+        second = reader.read_workbook(path, sheet_name="Data")
+
+        assert first.dataframe.equals(second.dataframe)
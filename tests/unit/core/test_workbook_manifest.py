@@ -0,0 +1,107 @@
+"""Unit tests for reading workbook metadata from the xlsx package manifest."""
+
+import zipfile
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+from openpyxl.workbook.defined_name import DefinedName
+
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.workbook_manifest import (
+    ManifestError,
+    clear_manifest_cache,
+    read_workbook_manifest,
+)
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_manifest_cache()
+    yield
+    clear_manifest_cache()
+
+
+@pytest.fixture
+def workbook_path(tmp_path):
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Summary"
+    workbook.create_sheet("Details")
+    workbook.create_sheet("Archive", 0)
+    workbook.defined_names["Totals"] = DefinedName("Totals", attr_text="Summary!$A$1")
+    path = tmp_path / "book.xlsx"
+    workbook.save(path)
+    return path
+
+
+def _add_parts(path, parts):
+    with zipfile.ZipFile(path, "a") as archive:
+        for name, data in parts.items():
+            archive.writestr(name, data)
+
+
+class TestWorkbookManifest:
+    """Test suite for manifest parsing."""
+
+    def test_sheet_order_and_defined_names(self, workbook_path):
+        manifest = read_workbook_manifest(workbook_path)
+        assert manifest.sheet_names == ("Archive", "Summary", "Details")
+        assert manifest.defined_names == (("Totals", "Summary!$A$1"),)
+        assert not manifest.has_vba_project
+        assert not manifest.has_external_links
+        assert manifest.sheet_part("Details") == "xl/worksheets/sheet3.xml"
+        assert manifest.styles_part == "xl/styles.xml"
+        assert manifest.sheet_part("Missing") is None
+
+    def test_vba_project_and_external_link_parts(self, workbook_path):
+        _add_parts(
+            workbook_path,
+            {
+                "xl/vbaProject.bin": b"\x00",
+                "xl/externalLinks/externalLink1.xml": b"<externalLink/>",
+                "xl/externalLinks/_rels/externalLink1.xml.rels": b"<Relationships/>",
+            },
+        )
+        manifest = read_workbook_manifest(workbook_path)
+        assert manifest.has_vba_project
+        assert manifest.external_link_parts == ("xl/externalLinks/externalLink1.xml",)
+        assert manifest.has_external_links
+
+    def test_defined_name_to_external_workbook(self, tmp_path):
+        workbook = openpyxl.Workbook()
+        workbook.defined_names["Rate"] = DefinedName("Rate", attr_text="[1]Rates!$B$2")
+        path = tmp_path / "linked.xlsx"
+        workbook.save(path)
+
+        assert read_workbook_manifest(path).has_external_links
+
+    def test_manifest_cached_by_fingerprint(self, workbook_path):
+        with patch("zipfile.ZipFile", wraps=zipfile.ZipFile) as opened:
+            first = read_workbook_manifest(workbook_path)
+            assert read_workbook_manifest(str(workbook_path)) is first
+        assert opened.call_count == 1
+
+    def test_non_zip_file_rejected(self, tmp_path):
+        path = tmp_path / "legacy.xls"
+        path.write_bytes(b"\xd0\xcf\x11\xe0 not a zip")
+        with pytest.raises(ManifestError):
+            read_workbook_manifest(path)
+
+
+class TestExcelReaderManifest:
+    """Test suite for ExcelReader metadata without loading cells."""
+
+    def test_validate_file_does_not_load_workbook(self, workbook_path):
+        _add_parts(workbook_path, {"xl/vbaProject.bin": b"\x00"})
+        reader = ExcelReader()
+
+        with patch(
+            "sphinxcontrib.jsontable.core.excel_reader_core.load_workbook"
+        ) as loader:
+            info = reader.validate_file(workbook_path)
+            names = reader.get_sheet_names(workbook_path)
+
+        loader.assert_not_called()
+        assert info.sheet_names == names == ["Archive", "Summary", "Details"]
+        assert info.has_macros is True
+        assert info.has_external_links is False
@@ -0,0 +1,102 @@
+"""Unit tests for shared xlsx packages - one parse of the global parts per file."""
+
+import os
+from unittest.mock import patch
+
+import pytest
+
+from sphinxcontrib.jsontable.core import workbook_package
+from sphinxcontrib.jsontable.core.excel_reader_core import ExcelReader
+from sphinxcontrib.jsontable.core.workbook_package import (
+    PackageCache,
+    clear_package_cache,
+    open_package,
+)
+
+xlsxwriter = pytest.importorskip("xlsxwriter")
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    clear_package_cache()
+    yield
+    clear_package_cache()
+
+
+def _write_catalog(path, sheets=3, rows=20):
+    """Workbook whose sheets share one string table (as Excel writes it)."""
+    workbook = xlsxwriter.Workbook(str(path))
+    for index in range(sheets):
+        sheet = workbook.add_worksheet(f"Sheet{index}")
+        for row in range(rows):
+            sheet.write_row(row, 0, [f"item{row}", f"sheet{index}", row])
+    workbook.close()
+    return path
+
+
+class TestPackageCache:
+    """Test suite for package reuse and invalidation."""
+
+    def test_package_reused_for_unchanged_file(self, tmp_path):
+        path = _write_catalog(tmp_path / "catalog.xlsx")
+        assert open_package(str(path)) is open_package(path)
+
+    def test_modified_file_reopened(self, tmp_path):
+        path = _write_catalog(tmp_path / "catalog.xlsx")
+        first = open_package(path)
+
+        _write_catalog(path, sheets=1)
+        stat = path.stat()
+        os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000))
+
+        second = open_package(path)
+        assert second is not first
+        assert second.manifest.sheet_names == ("Sheet0",)
+
+    def test_least_recently_used_package_evicted(self, tmp_path):
+        cache = PackageCache(max_open=1)
+        first = cache.open(_write_catalog(tmp_path / "a.xlsx", sheets=1))
+        cache.open(_write_catalog(tmp_path / "b.xlsx", sheets=1))
+
+        assert len(cache) == 1
+        assert first.archive.fp is None  # closed
+
+
+class TestSharedParts:
+    """The workbook-global parts are parsed once for all sheets."""
+
+    def test_sheets_share_one_parse(self, tmp_path):
+        path = _write_catalog(tmp_path / "catalog.xlsx")
+        reader = ExcelReader(engine="streaming")
+
+        with patch.object(
+            workbook_package,
+            "_parse_date_styles",
+            wraps=workbook_package._parse_date_styles,
+        ) as parse_styles:
+            frames = [
+                reader.read_workbook(path, sheet_name=f"Sheet{i}").dataframe
+                for i in range(3)
+            ]
+
+        assert parse_styles.call_count == 1
+        assert [frame.iloc[5].tolist() for frame in frames] == [
+            ["item5", f"sheet{i}", 5] for i in range(3)
+        ]
+
+    def test_shared_strings_parsed_incrementally(self, tmp_path):
+        path = _write_catalog(tmp_path / "catalog.xlsx", sheets=1)
+        table = open_package(path).shared_strings
+
+        assert open_package(path).resolve_shared_strings({0, 2}) == {
+            0: "item0",
+            2: "item1",
+        }
+        assert table.parsed_count == 3
+        assert open_package(path).resolve_shared_strings({4})[4] == "item3"
+        assert table.parsed_count == 5
+
+    def test_resolve_past_end_of_table(self, tmp_path):
+        path = _write_catalog(tmp_path / "catalog.xlsx", sheets=1, rows=1)
+        assert open_package(path).resolve_shared_strings({0, 99}) == {0: "item0"}
+        assert open_package(path).empty_shared_strings() == set()
@@ -0,0 +1,200 @@
+"""Aggregation Tests - :group-by: / :aggregate: build-time summaries."""
+
+import json
+
+import pytest
+
+from sphinxcontrib.jsontable.directives import aggregation as aggregation_module
+from sphinxcontrib.jsontable.directives.aggregation import (
+    AggregateSpec,
+    compile_aggregation,
+    parse_aggregate_spec,
+    parse_group_by,
+)
+from sphinxcontrib.jsontable.directives.json_processor import JsonProcessor
+from sphinxcontrib.jsontable.directives.row_query import compile_where
+from sphinxcontrib.jsontable.directives.validators import JsonTableError
+
+SALES = [
+    {"region": "EU", "rep": "ann", "amount": 10},
+    {"region": "US", "rep": "bob", "amount": 7.5},
+    {"region": "EU", "rep": "cid", "amount": "5"},
+    {"region": "EU", "rep": "ann", "amount": None},
+    {"rep": "dan", "amount": 2},
+]
+
+FULL_SPEC = "count, count(amount), sum(amount), mean(amount), min(rep), max(amount), distinct(rep)"
+
+
+@pytest.fixture(params=["vectorized", "streaming"])
+def strategy(request, monkeypatch):
+    """Run each test with and without pandas."""
+    if request.param == "streaming":
+        monkeypatch.setattr(aggregation_module, "PANDAS_AVAILABLE", False)
+    return request.param
+
+
+class TestSpecParsing:
+    """Test suite for option parsing."""
+
+    def test_aggregate_spec(self):
+        assert parse_aggregate_spec('count, SUM(amount), mean("Unit Price")') == [
+            AggregateSpec("count"),
+            AggregateSpec("sum", "amount"),
+            AggregateSpec("mean", "Unit Price"),
+        ]
+
+    @pytest.mark.parametrize("spec", ["", "median(x)", "sum", "sum()", "count(x"])
+    def test_invalid_aggregate_spec(self, spec):
+        with pytest.raises(JsonTableError, match=":aggregate:"):
+            parse_aggregate_spec(spec)
+
+    @pytest.mark.parametrize("spec", ["", "a,,b", "a, a"])
+    def test_invalid_group_by(self, spec):
+        with pytest.raises(JsonTableError, match=":group-by:"):
+            parse_group_by(spec)
+
+    def test_group_by_defaults_to_count(self):
+        aggregation = compile_aggregation("region", None)
+        assert aggregation.header == ["region", "count"]
+
+
+class TestAggregation:
+    """Both strategies must produce identical tables."""
+
+    def test_group_by_with_all_functions(self, strategy):
+        result = compile_aggregation("region", FULL_SPEC).aggregate(SALES)
+        assert result == [
+            [
+                "region",
+                "count",
+                "count(amount)",
+                "sum(amount)",
+                "mean(amount)",
+                "min(rep)",
+                "max(amount)",
+                "distinct(rep)",
+            ],
+            ["EU", 3, 2, 15, 7.5, "ann", 10, 2],
+            ["US", 1, 1, 7.5, 7.5, "bob", 7.5, 1],
+            [None, 1, 1, 2, 2.0, "dan", 2, 1],
+        ]
+
+    def test_summary_row_without_group_by(self, strategy):
+        aggregation = compile_aggregation(None, "count, sum(amount)")
+        assert aggregation.aggregate(SALES) == [["count", "sum(amount)"], [5, 24.5]]
+        assert aggregation.aggregate([]) == [["count", "sum(amount)"], [0, None]]
+
+    def test_filter_applies_before_grouping(self, strategy):
+        result = compile_aggregation("region", "sum(amount)").aggregate(
+            SALES, compile_where("amount >= 7")
+        )
+        assert result == [["region", "sum(amount)"], ["EU", 10], ["US", 7.5]]
+
+    def test_2d_array_source(self, strategy):
+        data = [["city", "pop"], ["Tokyo", 14], ["Osaka", 3], ["Tokyo", 1]]
+        result = compile_aggregation("city", "sum(pop)").aggregate(data)
+        assert result == [["city", "sum(pop)"], ["Tokyo", 15], ["Osaka", 3]]
+
+    def test_unknown_column(self, strategy):
+        with pytest.raises(JsonTableError, match="Unknown column"):
+            compile_aggregation("missing", None).aggregate(SALES)
+
+    def test_requires_array(self, strategy):
+        with pytest.raises(JsonTableError, match="require an array"):
+            compile_aggregation("region", None).aggregate({"region": "EU"})
+
+
+MIXED = [
+    {"group": "ints", "value": 4},
+    {"group": "ints", "value": None},
+    {"group": "ints", "value": 15},
+    {"group": "blank", "value": None},
+    {"group": "blank", "value": ""},
+    {"group": "bools", "value": True},
+    {"group": "bools", "value": 3},
+    {"group": "bools", "value": False},
+    {"group": "strings", "value": "10"},
+    {"group": "strings", "value": 9},
+    {"group": "strings", "value": "2.5"},
+    {"group": "text", "value": "10"},
+    {"group": "text", "value": "9"},
+    {"group": "text", "value": "n/a"},
+    {"group": "floats", "value": 1.5},
+    {"group": "floats", "value": float("nan")},
+    {"group": "floats", "value": 2.5},
+    {"value": "7"},
+    {"group": "big", "value": 2**67 + 1},
+    {"group": "big", "value": None},
+    {"group": "big", "value": 2**67 + 3},
+    {"group": "big", "value": 12345678901234567},
+]
+
+
+class TestStrategyParity:
+    """The vectorized and streaming strategies must return identical rows."""
+
+    @pytest.mark.parametrize(
+        "spec",
+        [
+            "count, count(value), distinct(value)",
+            "sum(value), mean(value)",
+            "min(value), max(value)",
+        ],
+    )
+    @pytest.mark.parametrize("layout", ["records", "2d"])
+    def test_mixed_values(self, spec, layout, monkeypatch):
+        data = MIXED
+        if layout == "2d":
+            data = [["group", "value"]] + [
+                [record.get("group"), record["value"]] for record in MIXED
+            ]
+        aggregation = compile_aggregation("group", spec)
+
+        vectorized = aggregation.aggregate(data)
+        monkeypatch.setattr(aggregation_module, "PANDAS_AVAILABLE", False)
+        streamed = aggregation.aggregate(data)
+
+        assert len(vectorized) == 9
+        assert vectorized == streamed
+        for vectorized_row, streamed_row in zip(vectorized, streamed):
+            assert list(map(type, vectorized_row)) == list(map(type, streamed_row))
+
+    def test_mixed_values_results(self, strategy):
+        result = compile_aggregation(
+            "group", "sum(value), min(value), max(value), distinct(value)"
+        ).aggregate(MIXED)
+        assert result[1:] == [
+            ["ints", 19, 4, 15, 2],
+            ["blank", None, None, None, 0],
+            ["bools", 3, 3, True, 3],
+            ["strings", 21.5, "2.5", "10", 3],
+            ["text", 19, "10", "n/a", 3],
+            ["floats", 4, 1.5, 2.5, 2],
+            [None, 7, "7", "7", 1],
+            ["big", 2**68 + 12345678901234571, 12345678901234567, 2**67 + 3, 3],
+        ]
+
+
+class TestJsonLinesStreaming:
+    """Test suite for single-pass aggregation of JSON Lines files."""
+
+    def test_records_are_streamed(self, tmp_path):
+        lines = [json.dumps(record) for record in SALES]
+        (tmp_path / "sales.jsonl").write_text("\n".join(lines) + "\n\n")
+        processor = JsonProcessor(base_path=tmp_path)
+
+        records = processor.iter_records("sales.jsonl")
+        assert next(records) == SALES[0]
+
+        result = compile_aggregation("region", "count").aggregate_records(
+            processor.iter_records("sales.jsonl")
+        )
+        assert result == [["region", "count"], ["EU", 3], ["US", 1], [None, 1]]
+        assert processor.load_from_file("sales.jsonl") == SALES
+
+    def test_invalid_line_reports_line_number(self, tmp_path):
+        (tmp_path / "bad.jsonl").write_text('{"a": 1}\n{"a": \n')
+        processor = JsonProcessor(base_path=tmp_path)
+        with pytest.raises(JsonTableError, match="line 2"):
+            list(processor.iter_records("bad.jsonl"))
@@ -0,0 +1,93 @@
+"""Build Trace Tests - trace-event timeline of a Sphinx build."""
+
+import json
+import os
+from types import SimpleNamespace
+from unittest.mock import Mock
+
+import pytest
+
+from sphinxcontrib.jsontable.directives.build_trace import (
+    TRACE_EVENTS,
+    collect_trace_events,
+    merge_trace_events,
+    start_trace,
+    stash_trace_events,
+    write_trace_file,
+)
+from sphinxcontrib.jsontable.directives.directive_core import JsonTableDirective
+from sphinxcontrib.jsontable.trace_events import (
+    disable_tracing,
+    span,
+    take_events,
+    tracing_enabled,
+)
+
+
+@pytest.fixture
+def app(tmp_path):
+    yield SimpleNamespace(
+        config=SimpleNamespace(jsontable_trace_file="trace/build.json"),
+        env=SimpleNamespace(),
+        outdir=str(tmp_path),
+    )
+    disable_tracing()
+
+
+def test_not_started_without_trace_file(app, tmp_path):
+    app.config.jsontable_trace_file = ""
+    start_trace(app)
+    assert not tracing_enabled()
+    write_trace_file(app, None)
+    assert not (tmp_path / "trace").exists()
+
+
+def test_serial_read_written_at_build_end(app, tmp_path):
+    start_trace(app)
+    with span("jsontable", "directive"):
+        pass
+    stash_trace_events(app, None)
+    assert len(getattr(app.env, TRACE_EVENTS)) == 1
+
+    assert collect_trace_events(app, app.env) == []
+    assert not hasattr(app.env, TRACE_EVENTS)  # not pickled with the env
+
+    write_trace_file(app, None)
+    assert not tracing_enabled()
+    trace = json.loads((tmp_path / "trace" / "build.json").read_text())
+    [event] = [e for e in trace["traceEvents"] if e["ph"] == "X"]
+    assert event["name"] == "jsontable"
+    assert event["pid"] == os.getpid()
+
+
+def test_worker_events_merged(app, tmp_path):
+    start_trace(app)
+    worker = SimpleNamespace(**{TRACE_EVENTS: [{"name": "read", "pid": 1}]})
+    merge_trace_events(app, app.env, {"page"}, worker)
+    assert not hasattr(worker, TRACE_EVENTS)
+
+    write_trace_file(app, None)
+    trace = json.loads((tmp_path / "trace" / "build.json").read_text())
+    assert {"name": "read", "pid": 1} in trace["traceEvents"]
+
+
+def test_directive_phases_traced(app):
+    state = Mock()
+    state.document.settings.env = SimpleNamespace(
+        srcdir="/test/source", docname="page", config=SimpleNamespace()
+    )
+    directive = JsonTableDirective(
+        "jsontable", [], {}, ['[{"a": 1, "b": 2}]'], 3, 0, "", state, Mock()
+    )
+
+    start_trace(app)
+    directive.run()
+
+    events = {event["name"]: event for event in take_events()}
+    assert events["jsontable"]["args"] == {
+        "docname": "page",
+        "source": "<inline>",
+        "line": 3,
+    }
+    assert events["node build"]["args"] == {"rows": 2, "cols": 2}
+    assert {"load", "convert"} <= set(events)
@@ -101,6 +101,29 @@ class TestJsonTableDirectiveProcessorInitialization:
         assert hasattr(directive_with_mocks.table_converter, "max_rows") or True
 
     @pytest.mark.skipif(not EXCEL_SUPPORT, reason="Excel support not available")
+    @pytest.mark.parametrize(
+        ("version", "warned"),
+        [((7, 2, 6, "final", 0), True), ((7, 3, 0, "final", 0), False)],
+    )
+    def test_searchable_option_warns_on_old_sphinx(self, mock_env, version, warned):
+        """no-searchクラスを無視するSphinxで:searchable:を警告することを検証する。"""
+        mock_env.docname = "index"
+        state = Mock()
+        state.document.settings.env = mock_env
+
+        with patch("sphinx.version_info", version), patch(
+            "sphinxcontrib.jsontable.directives.directive_core.logger"
+        ) as mock_logger:
+            JsonTableDirective(
+                "jsontable", [], {"searchable": "none"}, [], 7, 0, "", state, Mock()
+            )
+
+        assert mock_logger.warning.called is warned
+        if warned:
+            call = mock_logger.warning.call_args
+            assert ":searchable: needs Sphinx 7.3 or later" in call.args[0]
+            assert call.kwargs["location"] == ("index", 7)
+
     def test_excel_processor_initialization_when_available(self, directive_with_mocks):
         """
         Excel対応が利用可能な場合のExcelプロセッサ初期化を検証する。
@@ -20,6 +20,7 @@ from unittest.mock import Mock, patch
 
 import pytest
 
+from sphinxcontrib.jsontable.core.data_cache import LRUCache
 from sphinxcontrib.jsontable.directives.excel_processor import ExcelProcessor
 from sphinxcontrib.jsontable.directives.validators import JsonTableError
 
@@ -46,7 +47,7 @@ class TestExcelProcessorInitialization:
             processor = ExcelProcessor("/tmp/test")
             assert isinstance(processor.base_path, Path)
             assert processor.base_path == Path("/tmp/test")
-            assert processor._cache == {}
+            assert len(processor._cache) == 0
 
     def test_init_with_path_object(self):
         """Pathオブジェクトでの初期化を検証する。
@@ -67,7 +68,7 @@ class TestExcelProcessorInitialization:
         ):
             processor = ExcelProcessor(test_path)
             assert processor.base_path is test_path
-            assert isinstance(processor._cache, dict)
+            assert isinstance(processor._cache, LRUCache)
 
     def test_init_import_error_handling(self):
         """ExcelDataLoaderFacadeインポートエラーのハンドリングを検証する。
@@ -533,16 +534,16 @@ class TestExcelProcessorCacheManagement:
         options = {"sheet": "Test"}
         cache_key = self.processor._generate_cache_key("test.xlsx", options)
         cached_data = [["header"], ["data"]]
-        # ExcelProcessorが期待する形式 (data, timestamp, file_mtime) でキャッシュに保存
+        # ExcelProcessorが期待する形式 (data, timestamp, fingerprint) でキャッシュに保存
         current_time = time.time()
-        file_mtime = 0.0  # ダミーのファイル変更時刻
-        self.processor._cache[cache_key] = (cached_data, current_time, file_mtime)
+        fingerprint = "b2b:0"  # ダミーのファイル内容フィンガープリント
+        self.processor._cache[cache_key] = (cached_data, current_time, fingerprint)
 
         # キャッシュヒットテスト
         # _load_with_cache内で_is_cache_validが呼ばれるため、関連するモックが必要な場合がある
-        # ここでは、_get_file_modification_timeが呼ばれる可能性があるのでモックする
+        # ここでは、_get_file_fingerprintが呼ばれる可能性があるのでモックする
         with patch.object(
-            self.processor, "_get_file_modification_time", return_value=file_mtime
+            self.processor, "_get_file_fingerprint", return_value=fingerprint
         ):
             result = self.processor._load_with_cache("test.xlsx", options)
         assert result == cached_data
@@ -570,12 +571,75 @@ class TestExcelProcessorCacheManagement:
         # キャッシュに保存されたかを確認
         cache_key = self.processor._generate_cache_key("test.xlsx", options)
         assert cache_key in self.processor._cache
-        # キャッシュには (data, timestamp, file_mtime) のタプルが保存されるため、最初の要素(data)を比較
+        # キャッシュには (data, timestamp, fingerprint) のタプルが保存されるため、最初の要素(data)を比較
         cached_entry = self.processor._cache[cache_key]
         assert isinstance(cached_entry, tuple)
         assert len(cached_entry) == 3
         assert cached_entry[0] == [["header"], ["data1"], ["data2"]]
 
+    def test_enable_cache_option_uses_cache(self):
+        """ディレクティブ設定の enable_cache でキャッシュが使われることを検証する。
+
+        機能保証項目:
+        - enable_cache がローダーに渡されないこと
+        - 2回目の読み込みがキャッシュから返されること
+        """
+        mock_result = {"data": [["header"], ["data"]]}
+        self.processor.excel_loader.load_from_excel = Mock(return_value=mock_result)
+        options = {"sheet_name": "Test", "enable_cache": True}
+
+        with patch.object(
+            self.processor, "_get_file_fingerprint", return_value="b2b:1"
+        ):
+            first = self.processor.load_excel_data("test.xlsx", options)
+            second = self.processor.load_excel_data("test.xlsx", options)
+
+        assert first == second == [["header"], ["data"]]
+        self.processor.excel_loader.load_from_excel.assert_called_once_with(
+            "test.xlsx", sheet_name="Test"
+        )
+        assert self.processor._cache.stats().hits == 1
+
+    def test_error_result_not_cached(self):
+        """エラー結果がキャッシュされないことを検証する。"""
+        self.processor.excel_loader.load_from_excel = Mock(
+            return_value={"error": True, "error_message": "broken"}
+        )
+
+        with pytest.raises(JsonTableError, match="broken"):
+            self.processor.load_excel_data("test.xlsx", {"json-cache": True})
+        assert len(self.processor._cache) == 0
+
+    def test_cache_validity_follows_file_content(self, tmp_path):
+        """キャッシュの有効性がファイル内容で判定されることを検証する。
+
+        機能保証項目:
+        - 更新時刻だけの変更（チェックアウト等）ではキャッシュが維持されること
+        - 内容の変更でキャッシュが無効になること
+        """
+        import os
+
+        source = tmp_path / "test.xlsx"
+        source.write_bytes(b"original")
+        self.processor.excel_loader.load_from_excel = Mock(
+            return_value={"data": [["value"]]}
+        )
+        options = {"json-cache": True}
+
+        def touch():
+            stat = source.stat()
+            os.utime(source, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+
+        self.processor.load_excel_data(str(source), options)
+        touch()
+        self.processor.load_excel_data(str(source), options)
+        assert self.processor.excel_loader.load_from_excel.call_count == 1
+
+        source.write_bytes(b"modified")
+        touch()
+        self.processor.load_excel_data(str(source), options)
+        assert self.processor.excel_loader.load_from_excel.call_count == 2
+
 
 class TestExcelProcessorDataLoading:
     """データロード機能の包括的テスト."""
@@ -724,3 +788,26 @@ class TestExcelProcessorDataLoading:
             skip_rows=2,
             encoding="utf-8",
         )
+
+    def test_load_excel_data_keeps_detected_header_row(self):
+        """検出されたヘッダー行がデータの先頭に戻されることを検証する。
+
+        機能保証項目:
+        - has_header時のheaders行の再結合
+        - ヘッダー未検出時のデータ維持
+
+        品質観点:
+        - テーブルヘッダーの欠落防止
+        """
+        self.mock_loader.load_from_excel.return_value = {
+            "data": [["east", 1], ["west", 3]],
+            "headers": ["region", "q1"],
+            "has_header": True,
+        }
+
+        result = self.processor.load_excel_data("test.xlsx", {})
+
+        assert result == [["region", "q1"], ["east", 1], ["west", 3]]
+        assert ExcelProcessor._result_rows(
+            {"data": [["a"]], "headers": ["x"], "has_header": False}
+        ) == [["a"]]
@@ -334,3 +334,40 @@ class TestJsonProcessorComplete:
             assert result["value"] == f"test_{i}"
 
         # Memory should not accumulate significantly
+
+
+class TestStringNativeDecoding:
+    """Tests for numbers_as_text (source lexemes kept as cell strings)."""
+
+    def test_numbers_keep_source_lexeme(self):
+        """Numbers are not re-formatted and still compare by value."""
+        from sphinxcontrib.jsontable.directives.json_processor import JsonNumber
+        from sphinxcontrib.jsontable.directives.row_query import (
+            RowQuery,
+            parse_sort_spec,
+        )
+        from sphinxcontrib.jsontable.directives.table_converter import (
+            TableConverter,
+        )
+
+        processor = JsonProcessor(Path("/test"), numbers_as_text=True)
+        data = processor.parse_inline(
+            ['[{"v": 1.0e3, "n": "a"}, {"v": 9, "n": "b"}, {"v": 10.50, "n": "c"}]']
+        )
+
+        assert isinstance(data[0]["v"], JsonNumber)
+        assert data[0]["v"].number == 1000.0
+        assert data[1]["v"].number == 9
+
+        query = RowQuery(sort_keys=parse_sort_spec("v"))
+        assert TableConverter().convert(data, query=query) == [
+            ["n", "v"],
+            ["b", "9"],
+            ["c", "10.50"],
+            ["a", "1.0e3"],
+        ]
+
+    def test_default_mode_parses_numbers(self):
+        """Default decoding still produces int/float values."""
+        data = JsonProcessor(Path("/test")).parse_inline(['{"v": 1.0e3}'])
+        assert data == {"v": 1000.0}
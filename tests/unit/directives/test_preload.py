@@ -0,0 +1,117 @@
+"""Preload Tests - shared sheets parsed before a parallel read."""
+
+import gc
+from types import SimpleNamespace
+
+import openpyxl
+import pytest
+
+from sphinxcontrib.jsontable.core import excel_reader_streaming
+from sphinxcontrib.jsontable.core.preloaded_data import preloaded_sheets
+from sphinxcontrib.jsontable.directives.preload import (
+    SheetReference,
+    preload_shared_sheets,
+    release_preloaded_sheets,
+    scan_sheet_references,
+)
+
+
+class TestScanSheetReferences:
+    """Test suite for finding directive sources in document text."""
+
+    def test_rst_and_myst_directives(self):
+        text = "\n".join(
+            [
+                ".. jsontable:: data/sales.xlsx",
+                "   :sheet: Q1 Totals",
+                "   :header:",
+                "",
+                ".. jsontable:: data/users.json",
+                "",
+                "```{jsontable} data/sales.xlsx",
+                ":sheet-index: 2",
+                "```",
+                "",
+                ".. jsontable::",
+                "",
+                "   [1, 2]",
+            ]
+        )
+        assert list(scan_sheet_references(text)) == [
+            SheetReference("data/sales.xlsx", sheet="Q1 Totals"),
+            SheetReference("data/sales.xlsx", sheet_index=2),
+        ]
+
+    def test_options_end_at_first_other_line(self):
+        text = ".. jsontable:: a.xlsm\n\n   :sheet: not an option\n"
+        assert list(scan_sheet_references(text)) == [SheetReference("a.xlsm")]
+
+
+@pytest.fixture
+def project(tmp_path):
+    workbook = openpyxl.Workbook()
+    workbook.active.title = "Shared"
+    workbook.active.append(["a", "b"])
+    workbook.create_sheet("Single").append(["c"])
+    workbook.save(tmp_path / "book.xlsx")
+
+    pages = {
+        "one": ".. jsontable:: book.xlsx\n",
+        "two": ".. jsontable:: book.xlsx\n   :sheet: Shared\n",
+        "three": ".. jsontable:: book.xlsx\n   :sheet: Single\n",
+        "four": ".. jsontable:: missing.xlsx\n",
+        "five": ".. jsontable:: missing.xlsx\n",
+    }
+    for name, text in pages.items():
+        (tmp_path / f"{name}.rst").write_text(text)
+
+    config = SimpleNamespace(
+        jsontable_preload_min_docs=2,
+        jsontable_excel_engine="auto",
+        jsontable_excel_snapshots=False,
+        source_encoding="utf-8",
+    )
+    app = SimpleNamespace(config=config, parallel=4)
+    env = SimpleNamespace(
+        config=config,
+        doctreedir=str(tmp_path / "_doctrees"),
+        srcdir=str(tmp_path),
+        doc2path=lambda docname: str(tmp_path / f"{docname}.rst"),
+    )
+    yield app, env, list(pages)
+    release_preloaded_sheets()
+
+
+def test_shared_sheets_preloaded(project, tmp_path):
+    app, env, docnames = project
+    preload_shared_sheets(app, env, docnames)
+
+    path = env.srcdir + "/book.xlsx"
+    assert preloaded_sheets().rows(path, "Shared") == [["a", "b"]]
+    assert preloaded_sheets().rows(path, "Single") is None
+    assert gc.get_freeze_count() > 0
+    assert not (tmp_path / "_doctrees").exists()  # snapshots disabled
+
+    release_preloaded_sheets()
+    assert len(preloaded_sheets()) == 0
+    assert gc.get_freeze_count() == 0
+
+
+@pytest.mark.parametrize(
+    "change",
+    [
+        {"parallel": 1},
+        {"jsontable_preload_min_docs": 0},
+        {"jsontable_excel_engine": "pandas"},
+    ],
+)
+def test_nothing_preloaded(project, monkeypatch, change):
+    app, env, docnames = project
+    if "parallel" in change:
+        app.parallel = change["parallel"]
+    else:
+        vars(app.config).update(change)
+    monkeypatch.setattr(excel_reader_streaming, "read_sheet_rows", None)
+
+    preload_shared_sheets(app, env, docnames)
+    assert len(preloaded_sheets()) == 0
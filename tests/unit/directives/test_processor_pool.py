@@ -0,0 +1,100 @@
+"""Processor Pool Tests - processors shared across directives."""
+
+import gc
+from unittest.mock import Mock
+
+from sphinxcontrib.jsontable.directives.directive_core import (
+    EXCEL_SUPPORT,
+    JsonTableDirective,
+)
+from sphinxcontrib.jsontable.directives.processor_pool import (
+    ProcessorPool,
+    _pools,
+    processor_pool,
+    release_processors,
+)
+
+
+class FakeApp:
+    """Weakly referenceable stand-in for a Sphinx application."""
+
+
+def _directive(env, options=None):
+    state = Mock()
+    state.document.settings.env = env
+    return JsonTableDirective(
+        "jsontable", [], options or {}, [], 1, 0, "", state, Mock()
+    )
+
+
+def _env(app, **config):
+    env = Mock()
+    env.app = app
+    env.srcdir = "/test/source"
+    env.config = Mock(**{"jsontable_max_rows": 10000, **config})
+    return env
+
+
+class TestProcessorPool:
+    """Test suite for keyed processor reuse."""
+
+    def test_constructed_once_per_options(self):
+        factory = Mock(side_effect=lambda **options: object())
+        pool = ProcessorPool()
+
+        first = pool.get(factory, encoding="utf-8", max_rows=10)
+        assert pool.get(factory, max_rows=10, encoding="utf-8") is first
+        assert pool.get(factory, encoding="cp932", max_rows=10) is not first
+        assert factory.call_count == 2
+        assert len(pool) == 2
+
+    def test_pool_per_application(self):
+        app, other = FakeApp(), FakeApp()
+        assert processor_pool(app) is processor_pool(app)
+        assert processor_pool(app) is not processor_pool(other)
+
+    def test_release_and_garbage_collection(self):
+        app = FakeApp()
+        pool = processor_pool(app)
+        release_processors(app, None)
+        assert processor_pool(app) is not pool
+
+        del app
+        gc.collect()
+        assert not any(isinstance(key, FakeApp) for key in _pools.keys())
+
+    def test_no_pool_without_application(self):
+        assert processor_pool(None) is None
+        assert processor_pool("not weakly referenceable") is None
+
+
+class TestDirectiveReuse:
+    """Test suite for processor sharing between directive instances."""
+
+    def test_same_configuration_shares_processors(self):
+        app = FakeApp()
+        first = _directive(_env(app))
+        second = _directive(_env(app))
+
+        assert second.json_processor is first.json_processor
+        assert second.json_data_loader is first.json_data_loader
+        assert second.table_converter is first.table_converter
+        assert second.table_builder is first.table_builder
+        if EXCEL_SUPPORT:
+            assert second.excel_processor is first.excel_processor
+
+    def test_options_select_separate_processors(self):
+        app = FakeApp()
+        default = _directive(_env(app))
+        cp932 = _directive(_env(app), {"encoding": "cp932"})
+        limited = _directive(_env(app, jsontable_max_rows=5))
+
+        assert cp932.json_processor is not default.json_processor
+        assert cp932.json_processor.encoding == "cp932"
+        assert cp932.table_converter is default.table_converter
+        assert limited.table_converter.max_rows == 5
+
+    def test_applications_do_not_share(self):
+        first = _directive(_env(FakeApp()))
+        second = _directive(_env(FakeApp()))
+        assert second.json_processor is not first.json_processor
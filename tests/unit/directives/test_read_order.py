@@ -0,0 +1,116 @@
+"""Read Order Tests - cost-aware ordering of parallel reads."""
+
+from types import SimpleNamespace
+
+import pytest
+from sphinx.util.parallel import make_chunks
+
+from sphinxcontrib.jsontable.directives.read_order import (
+    BASE_COST,
+    balance_docnames,
+    balance_parallel_read,
+    estimate_costs,
+    merge_read_times,
+    purge_read_time,
+    read_times,
+    record_read_time,
+    start_read_timer,
+)
+
+
+def _chunk_loads(docnames, costs, nproc):
+    return [
+        sum(costs[name] for name in chunk) for chunk in make_chunks(docnames, nproc)
+    ]
+
+
+class TestBalanceDocnames:
+    """Test suite for spreading costs over Sphinx's chunks."""
+
+    docnames = [f"page{i:02d}" for i in range(40)]
+
+    def test_adjacent_expensive_documents_spread(self):
+        costs = dict.fromkeys(self.docnames, 1.0)
+        for name in self.docnames[4:8]:
+            costs[name] = 100.0
+        assert max(_chunk_loads(self.docnames, costs, 4)) > 400
+
+        ordered = balance_docnames(self.docnames, costs, 4)
+
+        assert sorted(ordered) == self.docnames
+        loads = _chunk_loads(ordered, costs, 4)
+        assert max(loads) < 110
+        assert loads == sorted(loads, reverse=True)  # heaviest start first
+
+    def test_chunk_sizes_kept(self):
+        docnames = self.docnames[:23]
+        costs = {name: float(i) for i, name in enumerate(docnames)}
+        ordered = balance_docnames(docnames, costs, 4)
+        assert [len(chunk) for chunk in make_chunks(ordered, 4)] == [
+            len(chunk) for chunk in make_chunks(docnames, 4)
+        ]
+
+    def test_single_chunk_unchanged(self):
+        assert balance_docnames(["b", "a"], {"a": 5.0}, 1) == ["b", "a"]
+
+
+@pytest.fixture
+def env(tmp_path):
+    (tmp_path / "big.json").write_text("[" + ", ".join(["1"] * 500_000) + "]")
+    (tmp_path / "heavy.rst").write_text(".. jsontable:: big.json\n   :header:\n")
+    (tmp_path / "inline.rst").write_text('.. jsontable::\n\n   [{"a": 1}]\n')
+    (tmp_path / "escape.rst").write_text(".. jsontable:: ../big.json\n")
+    return SimpleNamespace(
+        srcdir=str(tmp_path),
+        config=SimpleNamespace(source_encoding="utf-8"),
+        doc2path=lambda docname: str(tmp_path / f"{docname}.rst"),
+    )
+
+
+class TestCosts:
+    """Test suite for cost estimates and recorded read times."""
+
+    def test_estimated_from_data_file_size(self, env):
+        costs = estimate_costs(env, ["heavy", "inline", "escape", "missing"])
+        assert costs["heavy"] > BASE_COST
+        assert costs["inline"] == costs["escape"] == costs["missing"] == BASE_COST
+
+    def test_recorded_time_preferred(self, env):
+        read_times(env)["inline"] = 12.5
+        assert estimate_costs(env, ["inline"]) == {"inline": 12.5}
+
+    def test_read_time_recorded_merged_and_purged(self, env):
+        app = SimpleNamespace(env=env)
+        env.docname = "heavy"
+        start_read_timer(app, "heavy", [""])
+        record_read_time(app, None)
+        assert read_times(env)["heavy"] >= 0
+
+        worker = SimpleNamespace()
+        read_times(worker).update({"inline": 3.0, "other": 4.0})
+        merge_read_times(app, env, {"inline"}, worker)
+        assert read_times(env) == {"heavy": pytest.approx(0, abs=1), "inline": 3.0}
+
+        purge_read_time(app, env, "heavy")
+        assert list(read_times(env)) == ["inline"]
+
+
+@pytest.mark.parametrize(("parallel", "enabled"), [(1, True), (4, False)])
+def test_serial_or_disabled_reads_keep_order(env, parallel, enabled):
+    app = SimpleNamespace(
+        parallel=parallel,
+        config=SimpleNamespace(jsontable_balance_parallel_read=enabled),
+    )
+    docnames = ["inline", "missing", "heavy"] * 4
+    balance_parallel_read(app, env, docnames)
+    assert docnames == ["inline", "missing", "heavy"] * 4
+
+
+def test_parallel_read_reordered_in_place(env):
+    app = SimpleNamespace(
+        parallel=2, config=SimpleNamespace(jsontable_balance_parallel_read=True)
+    )
+    docnames = ["heavy", "inline", "missing", "other"]
+    balance_parallel_read(app, env, docnames)
+    assert docnames[0] == "heavy"
+    assert sorted(docnames) == ["heavy", "inline", "missing", "other"]
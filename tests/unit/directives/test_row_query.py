@@ -0,0 +1,143 @@
+"""Row Query Tests - :where: / :sort-by: build-time selection."""
+
+import pandas as pd
+import pytest
+
+from sphinxcontrib.jsontable.directives.row_query import (
+    RowPredicate,
+    RowQuery,
+    SortKey,
+    compile_where,
+    parse_sort_spec,
+)
+from sphinxcontrib.jsontable.directives.table_converter import TableConverter
+from sphinxcontrib.jsontable.directives.validators import JsonTableError
+
+USERS = [
+    {"name": "Alice", "status": "active", "score": 90},
+    {"name": "Bob", "status": "inactive", "score": 75},
+    {"name": "Carol", "status": "active", "score": 60},
+    {"name": "Dave", "status": "active"},
+]
+
+
+class TestRowPredicate:
+    """Test suite for the :where: expression language."""
+
+    def test_simple_comparison(self):
+        predicate = RowPredicate('status == "active"')
+        assert [u["name"] for u in USERS if predicate.matches(u)] == [
+            "Alice",
+            "Carol",
+            "Dave",
+        ]
+
+    def test_boolean_logic_and_missing_values(self):
+        predicate = RowPredicate('status == "active" and score >= 70')
+        # Dave has no score: ordering comparisons on missing values never match
+        assert [u["name"] for u in USERS if predicate.matches(u)] == ["Alice"]
+
+        predicate = RowPredicate("not score < 70")
+        assert [u["name"] for u in USERS if predicate.matches(u)] == [
+            "Alice",
+            "Bob",
+            "Dave",
+        ]
+
+    def test_membership_and_chained_comparison(self):
+        predicate = RowPredicate('name in ("Bob", "Carol") and 50 < score <= 80')
+        assert [u["name"] for u in USERS if predicate.matches(u)] == ["Bob", "Carol"]
+
+    def test_col_helper_and_numeric_strings(self):
+        predicate = RowPredicate('col("Unit Price") >= 10')
+        assert predicate.matches({"Unit Price": "12.5"})
+        assert not predicate.matches({"Unit Price": "n/a"})
+        assert predicate.columns == ["Unit Price"]
+
+    @pytest.mark.parametrize(
+        "expression",
+        ["__import__('os').system('x')", "score + 1 > 2", "lambda: 1", "a.b == 1"],
+    )
+    def test_unsafe_syntax_rejected(self, expression):
+        with pytest.raises(JsonTableError, match="unsupported syntax"):
+            RowPredicate(expression)
+
+    def test_malformed_expression(self):
+        with pytest.raises(JsonTableError, match="Invalid :where: expression"):
+            RowPredicate("status ==")
+
+    def test_compile_where_reuses_predicates(self):
+        assert compile_where("score > 1") is compile_where("score > 1")
+
+    def test_vectorized_mask_matches_scalar_evaluation(self):
+        frame = pd.DataFrame(
+            [["Alice", "active", 90], ["Bob", None, 75], ["Carol", "active", None]]
+        )
+        positions = {"name": 0, "status": 1, "score": 2}
+        predicate = RowPredicate('status == "active" or score in (75,)')
+        assert predicate.mask(frame, positions).tolist() == [True, True, True]
+
+        predicate = RowPredicate("score >= 80")
+        assert predicate.mask(frame, positions).tolist() == [True, False, False]
+
+    def test_vectorized_mask_unknown_column(self):
+        frame = pd.DataFrame([[1]])
+        with pytest.raises(JsonTableError, match="Unknown column"):
+            RowPredicate("missing == 1").mask(frame, {"present": 0})
+
+
+class TestSortSpec:
+    """Test suite for :sort-by: parsing."""
+
+    def test_prefix_and_suffix_directions(self):
+        assert parse_sort_spec("-score, name asc, city DESC") == [
+            SortKey("score", True),
+            SortKey("name", False),
+            SortKey("city", True),
+        ]
+
+    @pytest.mark.parametrize("spec", ["", "score,,name", "-"])
+    def test_invalid_specs(self, spec):
+        with pytest.raises(JsonTableError, match=":sort-by:"):
+            parse_sort_spec(spec)
+
+
+class TestRowQueryConversion:
+    """Test suite for queries applied by TableConverter."""
+
+    def test_filter_during_object_conversion(self):
+        query = RowQuery(predicate=RowPredicate('status == "active"'))
+        result = TableConverter().convert(USERS, query=query)
+        assert result[0] == ["name", "score", "status"]
+        assert [row[0] for row in result[1:]] == ["Alice", "Carol", "Dave"]
+
+    def test_top_k_sort_with_missing_last(self):
+        query = RowQuery(sort_keys=parse_sort_spec("-score"), limit=3)
+        result = TableConverter().convert(USERS, query=query)
+        assert [row[0] for row in result[1:]] == ["Alice", "Bob", "Carol"]
+
+        query = RowQuery(sort_keys=parse_sort_spec("score"))
+        result = TableConverter().convert(USERS, query=query)
+        assert [row[0] for row in result[1:]] == ["Carol", "Bob", "Alice", "Dave"]
+
+    def test_2d_array_uses_first_row_as_column_names(self):
+        data = [["city", "pop"], ["Tokyo", 14], ["Osaka", 2.7], ["Nagoya", 2.3]]
+        query = RowQuery(
+            predicate=RowPredicate("pop < 10"), sort_keys=parse_sort_spec("pop")
+        )
+        assert TableConverter().convert(data, query=query) == [
+            ["city", "pop"],
+            ["Nagoya", "2.3"],
+            ["Osaka", "2.7"],
+        ]
+
+    def test_max_rows_applies_to_selected_rows(self):
+        data = [{"id": i} for i in range(10)]
+        query = RowQuery(predicate=RowPredicate("id < 2"))
+        result = TableConverter(max_rows=5).convert(data, query=query)
+        assert len(result) == 3
+
+    def test_unknown_column_reported(self):
+        query = RowQuery(sort_keys=parse_sort_spec("missing"))
+        with pytest.raises(JsonTableError, match="Unknown column"):
+            TableConverter().convert(USERS, query=query)
@@ -7,8 +7,20 @@ from unittest.mock import patch
 
 import pytest
 from docutils import nodes
-
-from sphinxcontrib.jsontable.directives.table_builder import TableBuilder
+from docutils.frontend import get_default_settings
+from docutils.parsers.rst import Parser
+from docutils.transforms.universal import SmartQuotes
+from docutils.utils import new_document
+from sphinx.util.nodes import extract_messages
+
+from sphinxcontrib.jsontable.directives.directive_core import searchable_mode
+from sphinxcontrib.jsontable.directives.table_builder import (
+    NO_SEARCH_CLASS,
+    TableBuilder,
+    cell_paragraph,
+    literal_cell_paragraph,
+    search_exclusion_supported,
+)
 
 
 class TestTableBuilder:
@@ -276,6 +288,18 @@ class TestTableBuilder:
             # Should log a warning about encoding issue
             mock_logger.warning.assert_called()
 
+    def test_non_string_cells_converted_once_per_value(self):
+        """Test non-string cell texts are cached across rows."""
+        builder = TableBuilder()
+        texts = {}
+
+        first = builder._create_table_row([25, None, [1]], texts)
+        second = builder._create_table_row([25, None, [1]], texts)
+
+        assert [entry[0].astext() for entry in second] == ["25", "", "[1]"]
+        assert first[0][0].astext() == "25"
+        assert set(texts) == {(int, 25), (type(None), None)}
+
     def test_build_table_internal_empty(self):
         """Test _build_table_internal with empty data."""
         builder = TableBuilder()
@@ -384,3 +408,124 @@ class TestTableBuilder:
         assert len(result) == 1
         table = result[0]
         assert isinstance(table, nodes.table)
+
+
+class TestSmartQuotes:
+    """Test suite for keeping cell text out of smart quotes."""
+
+    data = [["Name", "Note"], ["Alice", 'say "hi" -- it\'s...']]
+
+    def _educated_cells(self, builder):
+        settings = get_default_settings(Parser)
+        settings.smart_quotes = True
+        document = new_document("<test>", settings)
+        document += builder.build(self.data)
+        document.transformer.add_transform(SmartQuotes)
+        document.transformer.apply_transforms()
+        return [entry.astext() for entry in document.findall(nodes.entry)]
+
+    def test_cells_skipped_by_default(self):
+        builder = TableBuilder()
+        table = builder.build(self.data)
+        paragraphs = list(table.findall(nodes.paragraph))
+        assert all(type(node) is literal_cell_paragraph for node in paragraphs)
+        assert paragraphs[0].tagname == "paragraph"
+        assert self._educated_cells(builder)[3] == 'say "hi" -- it\'s...'
+
+    def test_smartquotes_enabled(self):
+        builder = TableBuilder(smartquotes=True)
+        table = builder.build(self.data)
+        paragraphs = list(table.findall(nodes.paragraph))
+        assert all(type(node) is cell_paragraph for node in paragraphs)
+        assert (
+            self._educated_cells(builder)[3]
+            == "say \u201chi\u201d \u2013 it\u2019s\u2026"
+        )
+
+
+class TestSearchable:
+    """Test suite for keeping table text out of the search index."""
+
+    data = [["Name"]] + [[f"row{i}"] for i in range(5)]
+
+    def _excluded(self, table):
+        return [
+            node.tagname
+            for node in table.findall(nodes.Element)
+            if NO_SEARCH_CLASS in node["classes"]
+        ]
+
+    def test_all_indexed_by_default(self):
+        assert self._excluded(TableBuilder().build(self.data)) == []
+
+    def test_none(self):
+        table = TableBuilder(searchable="none").build(self.data)
+        assert self._excluded(table) == ["table"]
+
+    def test_headers(self):
+        table = TableBuilder(searchable="headers").build(self.data)
+        assert self._excluded(table) == ["tbody"]
+
+    def test_sample(self):
+        builder = TableBuilder(searchable="sample", search_sample_rows=2)
+        table = builder.build(self.data)
+        rows = list(table.findall(nodes.row))
+        assert self._excluded(table) == ["row"] * 3
+        assert [NO_SEARCH_CLASS in row["classes"] for row in rows] == [
+            False,
+            False,
+            False,
+            True,
+            True,
+            True,
+        ]
+
+    @pytest.mark.parametrize(
+        ("version", "supported"),
+        [
+            ((3, 5, 4, "final", 0), False),
+            ((7, 2, 6, "final", 0), False),
+            ((7, 3, 0, "final", 0), True),
+            ((8, 1, 3, "final", 0), True),
+        ],
+    )
+    def test_search_exclusion_supported(self, version, supported):
+        with patch("sphinx.version_info", version):
+            assert search_exclusion_supported() is supported
+
+    def test_unknown_mode(self):
+        with pytest.raises(ValueError, match="searchable must be one of"):
+            TableBuilder(searchable="some")
+        with pytest.raises(ValueError):
+            searchable_mode("some")
+        assert searchable_mode("headers") == "headers"
+
+
+class TestTranslatable:
+    """Test suite for gettext extraction of table text."""
+
+    data = [["Name", "Note"], ["Alice", "first"]]
+
+    def _messages(self, table):
+        # Source info as the directive sets it on header cells
+        for paragraph in table.findall(nodes.paragraph):
+            if type(paragraph) is nodes.paragraph:
+                paragraph.source, paragraph.line = "index.rst", 3
+        return [message for _node, message in extract_messages(table)]
+
+    @pytest.mark.parametrize("smartquotes", [False, True])
+    def test_cells_not_extracted(self, smartquotes):
+        table = TableBuilder(smartquotes=smartquotes).build(self.data)
+        for paragraph in table.findall(nodes.paragraph):
+            paragraph.source = "index.rst"
+        assert self._messages(table) == []
+
+    def test_headers_extracted(self):
+        builder = TableBuilder(translatable_headers=True)
+        table = builder.build(self.data)
+        assert self._messages(table) == ["Name", "Note"]
+        header = next(table.findall(nodes.thead))
+        assert all(
+            paragraph["support_smartquotes"] is False
+            for paragraph in header.findall(nodes.paragraph)
+        )
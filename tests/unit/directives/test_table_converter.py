@@ -1,5 +1,7 @@
 """Table Converter Tests - Phase 3.2 Coverage Boost."""
 
+from concurrent.futures import ProcessPoolExecutor
+
 import pytest
 
 from sphinxcontrib.jsontable.directives.table_converter import TableConverter
@@ -249,3 +251,94 @@ class TestTableConverter:
 
         assert converter_normal.performance_mode is False
         assert converter_performance.performance_mode is True
+
+    def test_repeated_values_share_one_string(self):
+        """Test low-cardinality columns are dictionary-encoded per column."""
+        import json
+
+        converter = TableConverter()
+        # Decoding creates a separate string object for every repetition
+        data = json.loads(
+            json.dumps([{"status": "active", "n": 1, "flag": True} for _ in range(50)])
+        )
+        result = converter.convert(data)
+
+        assert len({id(row[2]) for row in result[1:]}) == 1
+        assert all(row == ["True", "1", "active"] for row in result[1:])
+
+    def test_dictionary_encoding_keeps_types_apart(self):
+        """Test equal values of different types keep their own text."""
+        converter = TableConverter()
+        result = converter.convert([["v"], [1], [True], [1.0], [[1]]])
+
+        assert [row[0] for row in result[1:]] == ["1", "True", "1.0", "[1]"]
+
+    def test_parallel_conversion_matches_serial(self):
+        """Test chunked process-pool conversion keeps rows and order."""
+        from sphinxcontrib.jsontable.directives import parallel_conversion
+
+        data = [{"id": i, "name": f"n{i % 7}"} for i in range(5000)]
+        converter = TableConverter(parallel_threshold=100, parallel_workers=2)
+        try:
+            result = converter.convert(data)
+            pool = parallel_conversion.get_conversion_pool(2)
+            assert pool._executor is not None  # reused by later conversions
+        finally:
+            parallel_conversion.shutdown_conversion_pool()
+
+        assert result == TableConverter().convert(data)
+
+    def test_parallel_conversion_sends_schema_once(self):
+        """Test the schema reaches the workers through the initializer."""
+        from unittest.mock import patch
+
+        from sphinxcontrib.jsontable.directives import parallel_conversion
+
+        pool = parallel_conversion.ConversionPool(2)
+        try:
+            with patch.object(
+                parallel_conversion, "ProcessPoolExecutor", wraps=ProcessPoolExecutor
+            ) as executor_class:
+                rows = pool.convert_object_rows([{"a": 1, "b": 2}] * 5000, ["b", "a"])
+                pool.convert_object_rows([{"a": 3}] * 5000, ["b", "a"])
+                pool.convert_object_rows([{"c": 4}] * 5000, ["c"])
+        finally:
+            pool.shutdown()
+
+        assert rows[0] == ["2", "1"]
+        # Same columns reuse the workers, new columns restart them
+        assert [call.kwargs["initargs"] for call in executor_class.call_args_list] == [
+            (("b", "a"),),
+            (("c",),),
+        ]
+
+    def test_pool_inherited_through_fork_is_replaced(self):
+        """Test a forked process never uses its parent's executor."""
+        from unittest.mock import patch
+
+        from sphinxcontrib.jsontable.directives import parallel_conversion
+
+        parent_pool = parallel_conversion.get_conversion_pool(2)
+        try:
+            with patch.object(parallel_conversion.os, "getpid", return_value=-1):
+                with patch.object(parent_pool, "shutdown") as parent_shutdown:
+                    child_pool = parallel_conversion.get_conversion_pool(2)
+                    parallel_conversion.shutdown_conversion_pool()
+            assert child_pool is not parent_pool
+            assert child_pool.pid == -1
+            parent_shutdown.assert_not_called()
+        finally:
+            parent_pool.shutdown()
+
+    def test_parallel_conversion_falls_back_to_serial(self):
+        """Test an unusable pool falls back to serial conversion."""
+        from unittest.mock import patch
+
+        data = [{"id": i} for i in range(10)]
+        converter = TableConverter(parallel_threshold=5)
+        with patch(
+            "sphinxcontrib.jsontable.directives.parallel_conversion."
+            "ConversionPool.convert_object_rows",
+            return_value=None,
+        ):
+            assert converter.convert(data)[-1] == ["9"]
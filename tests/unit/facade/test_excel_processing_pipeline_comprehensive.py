@@ -917,3 +917,282 @@ class TestErrorHandlingComprehensive:
         assert result["error"]["message"] == "Test value error"
         assert result["error"]["context"] == "test_context"
         assert result["data"] is None
+
+
+class TestRowFilterStage:
+    """:where: 行フィルタのDataFrame上ベクトル化評価テスト."""
+
+    def test_row_filter_keeps_header_and_matching_rows(self, pipeline):
+        """ヘッダー行を保持し、条件に一致するデータ行のみを残すことを検証する。"""
+        from sphinxcontrib.jsontable.directives.row_query import RowPredicate
+
+        df = pd.DataFrame(
+            [["Report", None], ["name", "qty"], ["a", 5], ["b", 20], ["c", 30]]
+        )
+        result = pipeline._apply_row_filter_to_dataframe(
+            df, RowPredicate("qty >= 20"), 1, "test"
+        )
+
+        assert result.values.tolist()[:2] == [["Report", None], ["name", "qty"]]
+        assert result.iloc[2:, 0].tolist() == ["b", "c"]
+        assert list(result.index) == [0, 1, 2, 3]
+
+    def test_row_filter_unknown_column_raises(self, pipeline):
+        """存在しない列名の参照がProcessingErrorになることを検証する。"""
+        from sphinxcontrib.jsontable.directives.row_query import RowPredicate
+
+        df = pd.DataFrame([["name"], ["a"]])
+        with pytest.raises(ProcessingError, match="Row filter application failed"):
+            pipeline._apply_row_filter_to_dataframe(
+                df, RowPredicate("qty > 1"), None, "test"
+            )
+
+
+class TestAggregationStage:
+    """:group-by: / :aggregate: のDataFrame上集計テスト."""
+
+    def test_aggregate_dataframe_returns_table_with_header(self, pipeline):
+        """ヘッダー行より上の行を無視し、集計表をヘッダー付きで返すことを検証する。"""
+        from sphinxcontrib.jsontable.directives.aggregation import (
+            compile_aggregation,
+        )
+
+        df = pd.DataFrame(
+            [["Report", None], ["region", "qty"], ["EU", 5], ["US", 20], ["EU", 1]]
+        )
+        result = pipeline._aggregate_dataframe(
+            df, compile_aggregation("region", "count, sum(qty)"), 1, "test"
+        )
+
+        assert result.data == [
+            ["region", "count", "sum(qty)"],
+            ["EU", 2, 6],
+            ["US", 1, 20],
+        ]
+        assert result.has_header is False
+        assert result.metadata["source_rows"] == 3
+
+    def test_aggregate_unknown_column_raises(self, pipeline):
+        """存在しない列名の参照がProcessingErrorになることを検証する。"""
+        from sphinxcontrib.jsontable.directives.aggregation import (
+            compile_aggregation,
+        )
+
+        df = pd.DataFrame([["name"], ["a"]])
+        with pytest.raises(ProcessingError, match="Aggregation failed"):
+            pipeline._aggregate_dataframe(
+                df, compile_aggregation("region", None), None, "test"
+            )
+
+
+class TestRangeReadPushdown:
+    """:range: の行ウィンドウ読み込み(skiprows/nrows)テスト."""
+
+    @staticmethod
+    def _range(start_row, end_row, start_col=1, end_col=2):
+        return RangeInfo(
+            start_row=start_row,
+            start_col=start_col,
+            end_row=end_row,
+            end_col=end_col,
+            original_spec="",
+            normalized_spec="",
+        )
+
+    @staticmethod
+    def _read_result(frame):
+        return ReadResult(
+            dataframe=frame,
+            workbook_info=WorkbookInfo(
+                file_path=Path("test.xlsx"),
+                sheet_names=["Sheet1"],
+                has_macros=False,
+                has_external_links=False,
+                file_size=1024,
+                format_type=".xlsx",
+            ),
+            metadata={"sheet_name": "Sheet1"},
+        )
+
+    def test_range_translated_to_reader_window(self, pipeline):
+        """1ベースの範囲がskiprows/nrowsに変換されることを検証する。"""
+        assert pipeline._range_read_options(self._range(3, 42)) == {
+            "skiprows": 2,
+            "nrows": 40,
+        }
+        assert pipeline._range_read_options(self._range(0, 1)) == {}
+
+    def test_only_range_rows_are_read(self, disabled_pipeline, mock_components):
+        """範囲の行のみを読み込み、ヘッダー行の調整が維持されることを検証する。"""
+        mock_components["range_parser"].parse.return_value = self._range(3, 5)
+        mock_components["excel_reader"].read_workbook.return_value = self._read_result(
+            pd.DataFrame([["name", "qty"], ["a", 1], ["b", 2]])
+        )
+        mock_components["data_converter"].convert_dataframe_to_json.side_effect = (
+            lambda df, header_row=None: ConversionResult(
+                data=df.values.tolist(), has_header=False, headers=[], metadata={}
+            )
+        )
+
+        result = disabled_pipeline.process_excel_file(
+            "test.xlsx", range_spec="A3:B5", header_row=2
+        )
+
+        mock_components["excel_reader"].read_workbook.assert_called_once_with(
+            "test.xlsx", sheet_name=None, sheet_index=None, skiprows=2, nrows=3
+        )
+        assert result["headers"] == ["name", "qty"]
+        assert result["data"] == [["a", 1], ["b", 2]]
+
+    def test_window_past_sheet_end_reports_sheet_rows(self, disabled_pipeline):
+        """ウィンドウが途中で尽きた場合、シート全体の行数で報告されることを検証する。"""
+        with pytest.raises(ProcessingError, match=r"exceed DataFrame rows \(1-11\)"):
+            disabled_pipeline._apply_range_to_dataframe(
+                pd.DataFrame([[1, 2]]), self._range(11, 20), "test", row_offset=10
+            )
+
+    def test_narrow_window_falls_back_to_full_read(
+        self, disabled_pipeline, mock_components
+    ):
+        """ウィンドウの列数が不足する場合、シート全体で列範囲を判定することを検証する。"""
+        mock_components["range_parser"].parse.return_value = self._range(1, 1, 1, 3)
+        mock_components["excel_reader"].read_workbook.side_effect = [
+            self._read_result(pd.DataFrame([["a", "b"]])),
+            self._read_result(pd.DataFrame([["a", "b", "-"], ["-", "-", "c"]])),
+        ]
+        mock_components["data_converter"].convert_dataframe_to_json.side_effect = (
+            lambda df, header_row=None: ConversionResult(
+                data=df.values.tolist(), has_header=False, headers=[], metadata={}
+            )
+        )
+
+        result = disabled_pipeline.process_excel_file("test.xlsx", range_spec="A1:C1")
+
+        assert mock_components["excel_reader"].read_workbook.call_count == 2
+        assert result["data"] == [["a", "b", "-"]]
+
+
+class TestDetectRange:
+    """:detect-range: のデータ島検出テスト."""
+
+    def test_detected_island_read_as_range(self, disabled_pipeline, mock_components):
+        """検出した島が範囲として読み込まれ、検出情報が返されることを検証する。"""
+        sheet = pd.DataFrame(
+            [
+                ["Report", None, None],
+                [None, None, None],
+                ["region", "q1", "q2"],
+                ["EU", 1, 2],
+            ]
+        )
+        mock_components["excel_reader"].read_workbook.side_effect = [
+            TestRangeReadPushdown._read_result(sheet),
+            TestRangeReadPushdown._read_result(sheet.iloc[2:4]),
+        ]
+        mock_components[
+            "range_parser"
+        ].parse.return_value = TestRangeReadPushdown._range(3, 4, 1, 3)
+        mock_components["data_converter"].convert_dataframe_to_json.side_effect = (
+            lambda df, header_row=None: ConversionResult(
+                data=df.values.tolist(), has_header=False, headers=[], metadata={}
+            )
+        )
+
+        result = disabled_pipeline.process_excel_file("test.xlsx", detect_range="auto")
+
+        mock_components["range_parser"].parse.assert_called_once_with("A3:C4")
+        assert result["detected_range"] == "A3:C4"
+        assert result["data"] == [["region", "q1", "q2"], ["EU", 1, 2]]
+        assert result["metadata"]["detect_range_info"]["islands"] == [
+            "A1:A1",
+            "A3:C4",
+        ]
+
+    def test_explicit_range_wins(self, disabled_pipeline, mock_components):
+        """:range: が指定された場合は検出を行わないことを検証する。"""
+        disabled_pipeline._detect_data_range = Mock()
+        mock_components[
+            "excel_reader"
+        ].read_workbook.return_value = TestRangeReadPushdown._read_result(
+            pd.DataFrame([["a", "b"]])
+        )
+        mock_components[
+            "range_parser"
+        ].parse.return_value = TestRangeReadPushdown._range(1, 1)
+        mock_components[
+            "data_converter"
+        ].convert_dataframe_to_json.return_value = ConversionResult(
+            data=[["a", "b"]], has_header=False, headers=[], metadata={}
+        )
+
+        result = disabled_pipeline.process_excel_file(
+            "test.xlsx", range_spec="A1:B1", detect_range="auto"
+        )
+
+        disabled_pipeline._detect_data_range.assert_not_called()
+        assert "detected_range" not in result
+
+    def test_invalid_mode_rejected(self, disabled_pipeline):
+        """不正なモードがValueErrorになることを検証する。"""
+        with pytest.raises(ValueError, match="Invalid detect mode"):
+            disabled_pipeline.process_excel_file("test.xlsx", detect_range="widest")
+
+
+class TestMergedCellsStage:
+    """:merge-cells: の結合セル処理テスト."""
+
+    def _setup(self, disabled_pipeline, mock_components, frames):
+        disabled_pipeline._read_merged_ranges = Mock(return_value=["A1:A3"])
+        mock_components["excel_reader"].read_workbook.side_effect = [
+            TestRangeReadPushdown._read_result(frame) for frame in frames
+        ]
+        mock_components["data_converter"].convert_dataframe_to_json.side_effect = (
+            lambda df, header_row=None: ConversionResult(
+                data=df.fillna("").values.tolist(),
+                has_header=False,
+                headers=[],
+                metadata={},
+            )
+        )
+
+    def test_expand_reports_merged_ranges(self, disabled_pipeline, mock_components):
+        """結合範囲がアンカー値で展開され、メタデータに報告されることを検証する。"""
+        sheet = pd.DataFrame([["EU", 1], [None, 2], [None, 3]])
+        self._setup(disabled_pipeline, mock_components, [sheet])
+
+        result = disabled_pipeline.process_excel_file("test.xlsx", merge_mode="expand")
+
+        assert [row[0] for row in result["data"]] == ["EU", "EU", "EU"]
+        assert result["metadata"]["merge_info"] == {
+            "merge_mode": "expand",
+            "has_merged_cells": True,
+            "merged_ranges": ["A1:A3"],
+        }
+
+    def test_anchor_above_window_rereads_sheet(
+        self, disabled_pipeline, mock_components
+    ):
+        """アンカーが読み込みウィンドウより上にある場合、シート全体を読み直すことを検証する。"""
+        sheet = pd.DataFrame([["EU", 1], [None, 2], [None, 3]])
+        self._setup(disabled_pipeline, mock_components, [sheet.iloc[1:], sheet])
+        mock_components[
+            "range_parser"
+        ].parse.return_value = TestRangeReadPushdown._range(2, 3)
+
+        result = disabled_pipeline.process_excel_file(
+            "test.xlsx", range_spec="A2:B3", merge_mode="expand"
+        )
+
+        assert mock_components["excel_reader"].read_workbook.call_count == 2
+        assert result["data"] == [["EU", 2], ["EU", 3]]
+
+    def test_unknown_mode_leaves_cells(self, disabled_pipeline, mock_components):
+        """未知のモードでは結合セルを処理しないことを検証する。"""
+        sheet = pd.DataFrame([["EU", 1], [None, 2]])
+        self._setup(disabled_pipeline, mock_components, [sheet])
+
+        result = disabled_pipeline.process_excel_file("test.xlsx", merge_mode="fold")
+
+        disabled_pipeline._read_merged_ranges.assert_not_called()
+        assert result["data"] == [["EU", 1], ["", 2]]
+        assert result["metadata"]["merge_info"]["has_merged_cells"] is False
@@ -0,0 +1,79 @@
+"""End-to-end Sphinx builds of Excel tables with the default configuration."""
+
+from io import StringIO
+from unittest.mock import patch
+
+import openpyxl
+import pytest
+from sphinx.application import Sphinx
+
+from sphinxcontrib.jsontable.core import excel_reader_streaming
+
+PAGE = """\
+Orders
+======
+
+.. jsontable:: orders.xlsx
+   :header:
+
+.. jsontable:: orders.xlsx
+   :header:
+   :range: A1:C4
+"""
+
+
+@pytest.fixture
+def project(tmp_path):
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    (srcdir / "conf.py").write_text('extensions = ["sphinxcontrib.jsontable"]\n')
+    (srcdir / "index.rst").write_text(PAGE)
+
+    # openpyxl saves the formulas without cached values (<v />)
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(["item", "qty", "double"])
+    for i in range(2, 8):
+        sheet.append([f"item{i}", i, f"=B{i}*2"])
+    workbook.save(srcdir / "orders.xlsx")
+    return tmp_path
+
+
+def build(project):
+    warnings = StringIO()
+    app = Sphinx(
+        str(project / "src"),
+        str(project / "src"),
+        str(project / "out"),
+        str(project / "doctrees"),
+        "html",
+        status=None,
+        warning=warnings,
+        freshenv=True,
+    )
+    app.build()
+    return (project / "out" / "index.html").read_text(), warnings.getvalue()
+
+
+def test_workbook_with_formulas_renders(project):
+    html, warnings = build(project)
+
+    assert "Excel processing failed" not in warnings
+    assert html.count("item7") == 1
+    assert html.count("item3") == 2
+    # Snapshots are on by default, so the sheet went through the streaming
+    # parser
+    assert any((project / "doctrees" / "jsontable_snapshots").iterdir())
+
+
+def test_streaming_failure_falls_back_to_pandas(project):
+    def broken(*args, **kwargs):
+        raise ValueError("unparseable sheet")
+
+    with patch.object(excel_reader_streaming, "read_sheet_rows", broken):
+        with patch.object(excel_reader_streaming, "read_sheet_window", broken):
+            html, warnings = build(project)
+
+    assert "Excel processing failed" not in warnings
+    assert html.count("item7") == 1
+    assert html.count("item3") == 2
@@ -0,0 +1,43 @@
+"""End-to-end ``sphinx-build -j 2`` builds with parallel table conversion."""
+
+import json
+import subprocess
+import sys
+
+CONF = """\
+extensions = ["sphinxcontrib.jsontable"]
+jsontable_parallel_threshold = 100
+jsontable_parallel_workers = 2
+"""
+
+
+def test_parallel_read_with_conversion_pool_finishes(tmp_path):
+    srcdir = tmp_path / "src"
+    srcdir.mkdir()
+    (srcdir / "conf.py").write_text(CONF)
+    pages = [f"page{i}" for i in range(4)]
+    (srcdir / "index.rst").write_text(
+        "Index\n=====\n\n.. toctree::\n\n" + "".join(f"   {p}\n" for p in pages)
+    )
+    for i, page in enumerate(pages):
+        rows = [{"id": j, "value": j * i} for j in range(2500)]
+        (srcdir / f"{page}.json").write_text(json.dumps(rows))
+        (srcdir / f"{page}.rst").write_text(
+            f"{page}\n{'=' * len(page)}\n\n.. jsontable:: {page}.json\n"
+            "   :header:\n   :limit: 2500\n"
+        )
+
+    # Each forked read worker starts its own conversion pool; before the fix
+    # the workers waited forever on the pool's processes when they exited
+    result = subprocess.run(
+        [sys.executable, "-m", "sphinx", "-q", "-E", "-j", "2", ".", "../out"],
+        cwd=srcdir,
+        capture_output=True,
+        text=True,
+        timeout=180,
+    )
+
+    assert result.returncode == 0, result.stderr
+    for page in pages:
+        html = (tmp_path / "out" / f"{page}.html").read_text()
+        assert html.count("<tr") == 2501
@@ -11,10 +11,12 @@ CLAUDE.md品質保証準拠:
 重点保証項目: setup関数・ディレクティブ登録・設定値・拡張メタデータ
 """
 
-from unittest.mock import Mock
+import logging
+from unittest.mock import Mock, patch
 
 import pytest
 
+import sphinxcontrib.jsontable as jsontable
 from sphinxcontrib.jsontable import (
     DEFAULT_MAX_ROWS,
     JsonTableDirective,
@@ -23,6 +25,10 @@ from sphinxcontrib.jsontable import (
     __version__,
     setup,
 )
+from sphinxcontrib.jsontable.directives.table_builder import (
+    cell_paragraph,
+    literal_cell_paragraph,
+)
 
 
 class TestModuleConstants:
@@ -107,6 +113,8 @@ class TestSetupFunction:
 
         # ディレクティブ登録確認
         mock_app.add_directive.assert_called_once_with("jsontable", JsonTableDirective)
+        mock_app.add_node.assert_any_call(cell_paragraph)
+        mock_app.add_node.assert_any_call(literal_cell_paragraph)
 
         # 戻り値確認
         assert isinstance(result, dict)
@@ -137,12 +145,39 @@ class TestSetupFunction:
         setup(mock_app)
 
         # 設定値登録確認
-        mock_app.add_config_value.assert_called_once_with(
+        mock_app.add_config_value.assert_any_call(
             "jsontable_max_rows",
             DEFAULT_MAX_ROWS,
             "env",  # 環境再構築時に変更反映
             [int],  # 型検証
         )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_numbers_as_text", False, "env", [bool]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_smartquotes", False, "env", [bool]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_searchable", "all", "env", [str]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_search_sample_rows", 10, "env", [int]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_translatable", "none", "env", [str]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_excel_engine", "auto", "env", [str]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_excel_snapshots", True, "env", [bool]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_preload_min_docs", 2, "", [int]
+        )
+        mock_app.add_config_value.assert_any_call(
+            "jsontable_balance_parallel_read", True, "", [bool]
+        )
 
     def test_setup_function_return_metadata(self):
         """戻り値メタデータの完全性を検証する。
@@ -349,6 +384,114 @@ class TestSphinxIntegration:
         # バージョン一貫性の確認
         assert result["version"] == __version__
 
+    def test_cache_stats_reported_at_build_end(self):
+        """ビルド終了時にデータキャッシュの統計が記録されることを検証する。"""
+        from sphinxcontrib.jsontable.core.data_cache import LRUCache
+
+        mock_app = Mock()
+        setup(mock_app)
+        mock_app.connect.assert_any_call(
+            "build-finished", jsontable._report_cache_stats
+        )
+
+        cache = LRUCache(name="report-test")
+        cache.get("missing")
+        with patch.object(jsontable, "logger") as mock_logger:
+            jsontable._report_cache_stats(mock_app, None)
+
+        messages = [call.args[0] for call in mock_logger.info.call_args_list]
+        assert any("'report-test': 0 hits, 1 misses" in m for m in messages)
+
+    def test_processors_released_at_build_end(self):
+        """ビルド終了時に共有プロセッサが解放されることを検証する。"""
+        from sphinxcontrib.jsontable.directives.processor_pool import (
+            release_processors,
+        )
+
+        mock_app = Mock()
+        setup(mock_app)
+        mock_app.connect.assert_any_call("build-finished", release_processors)
+
+    def test_shared_sheets_preloaded_before_read(self):
+        """並列読み込みの前に共有シートを事前読み込みするフックを検証する。"""
+        from sphinxcontrib.jsontable.directives.preload import (
+            preload_shared_sheets,
+            release_preloaded_sheets,
+        )
+
+        mock_app = Mock()
+        setup(mock_app)
+        mock_app.connect.assert_any_call("env-before-read-docs", preload_shared_sheets)
+        mock_app.connect.assert_any_call("build-finished", release_preloaded_sheets)
+
+    def test_parallel_read_balanced_by_cost(self):
+        """読み込み時間の記録と並列読み込みの並べ替えフックを検証する。"""
+        from sphinxcontrib.jsontable.directives import read_order
+
+        mock_app = Mock()
+        setup(mock_app)
+        for event, handler in [
+            ("source-read", read_order.start_read_timer),
+            ("doctree-read", read_order.record_read_time),
+            ("env-purge-doc", read_order.purge_read_time),
+            ("env-merge-info", read_order.merge_read_times),
+            ("env-before-read-docs", read_order.balance_parallel_read),
+        ]:
+            mock_app.connect.assert_any_call(event, handler)
+
+    def test_build_trace_hooks(self):
+        """トレースファイル設定と各フックの登録を検証する。"""
+        from sphinxcontrib.jsontable.directives import build_trace
+
+        mock_app = Mock()
+        setup(mock_app)
+        mock_app.add_config_value.assert_any_call("jsontable_trace_file", "", "", [str])
+        for event, handler in [
+            ("builder-inited", build_trace.start_trace),
+            ("doctree-read", build_trace.stash_trace_events),
+            ("env-merge-info", build_trace.merge_trace_events),
+            ("env-updated", build_trace.collect_trace_events),
+            ("build-finished", build_trace.write_trace_file),
+        ]:
+            mock_app.connect.assert_any_call(event, handler)
+
+    @pytest.mark.parametrize(
+        ("version", "searchable", "warned"),
+        [
+            ((7, 2, 6, "final", 0), "headers", True),
+            ((7, 2, 6, "final", 0), "all", False),
+            ((7, 3, 0, "final", 0), "headers", False),
+        ],
+    )
+    def test_old_sphinx_searchable_warning(self, version, searchable, warned):
+        """no-searchクラスを無視するSphinxでjsontable_searchableを警告することを検証する。"""
+        mock_app = Mock()
+        setup(mock_app)
+        mock_app.connect.assert_any_call("config-inited", jsontable._check_searchable)
+
+        config = Mock(jsontable_searchable=searchable)
+        with patch("sphinx.version_info", version), patch.object(
+            jsontable, "logger"
+        ) as mock_logger:
+            jsontable._check_searchable(mock_app, config)
+
+        assert mock_logger.warning.called is warned
+        if warned:
+            message = mock_logger.warning.call_args.args[0]
+            assert "jsontable_searchable needs Sphinx 7.3 or later" in message
+
+    @pytest.mark.parametrize(
+        ("verbosity", "level"), [(0, logging.INFO), (2, logging.DEBUG)]
+    )
+    def test_log_level_follows_verbosity(self, verbosity, level):
+        """デバッグログがSphinxの詳細度に応じてのみ生成されることを検証する。"""
+        extension_logger = logging.getLogger("sphinx.sphinxcontrib.jsontable")
+        try:
+            setup(Mock(verbosity=verbosity))
+            assert extension_logger.getEffectiveLevel() == level
+        finally:
+            extension_logger.setLevel(logging.NOTSET)
+
 
 class TestErrorHandling:
     """エラーハンドリングの包括的テスト."""
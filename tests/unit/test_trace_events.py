@@ -0,0 +1,105 @@
+"""Unit tests for the opt-in trace-event recorder."""
+
+import json
+
+import openpyxl
+import pytest
+
+from sphinxcontrib.jsontable import trace_events
+from sphinxcontrib.jsontable.trace_events import (
+    add_events,
+    disable_tracing,
+    enable_tracing,
+    span,
+    take_events,
+    tracing_enabled,
+    write_trace,
+)
+
+
+@pytest.fixture
+def tracing():
+    enable_tracing()
+    yield
+    disable_tracing()
+
+
+def test_disabled_spans_record_nothing():
+    with span("read", "excel", rows=1) as trace:
+        trace.set(cols=2)
+    assert not trace.enabled
+    assert span("other") is trace  # one shared no-op span
+    assert not tracing_enabled()
+    assert take_events() == []
+
+
+def test_complete_event_recorded(tracing):
+    with span("read", "excel", sheet="S1") as trace:
+        trace.set(rows=3)
+
+    [event] = take_events()
+    assert event["name"] == "read"
+    assert event["cat"] == "excel"
+    assert event["ph"] == "X"
+    assert event["dur"] >= 0
+    assert isinstance(event["pid"], int) and isinstance(event["tid"], int)
+    assert event["args"] == {"sheet": "S1", "rows": 3}
+    assert take_events() == []
+
+
+def test_failed_stage_recorded_with_error(tracing):
+    with pytest.raises(KeyError), span("convert"):
+        raise KeyError("x")
+    [event] = take_events()
+    assert event["args"] == {"error": "KeyError"}
+
+
+def test_worker_events_added_and_forked_children_start_empty(tracing):
+    with span("load"):
+        pass
+    trace_events._forget_parent_events()
+    add_events([{"name": "load", "pid": 7}])
+    assert disable_tracing() == [{"name": "load", "pid": 7}]
+    add_events([{"name": "ignored"}])  # tracing is off again
+    assert take_events() == []
+
+
+def test_write_trace_labels_processes(tmp_path):
+    events = [
+        {"name": "read", "ph": "X", "ts": 1.0, "dur": 2.0, "pid": 1, "tid": 1},
+        {"name": "read", "ph": "X", "ts": 1.5, "dur": 2.0, "pid": 2, "tid": 2},
+    ]
+    path = tmp_path / "out" / "trace.json"
+    write_trace(path, events, main_pid=1)
+
+    trace = json.loads(path.read_text())
+    names = {
+        event["pid"]: event["args"]["name"]
+        for event in trace["traceEvents"]
+        if event["ph"] == "M"
+    }
+    assert names == {1: "sphinx-build", 2: "worker 2"}
+    assert trace["traceEvents"][-2:] == events
+
+
+def test_excel_pipeline_stages_traced(tracing, tmp_path):
+    from sphinxcontrib.jsontable.facade.excel_data_loader_facade import (
+        ExcelDataLoaderFacade,
+    )
+
+    workbook = openpyxl.Workbook()
+    workbook.active.append(["name", "count"])
+    workbook.active.append(["a", 1])
+    path = tmp_path / "book.xlsx"
+    workbook.save(path)
+
+    ExcelDataLoaderFacade().load_from_excel(path, range_spec="A1:B2")
+    events = {event["name"]: event for event in take_events()}
+
+    for stage in ("security scan", "range parse", "read", "convert"):
+        assert events[stage]["cat"] == "excel"
+    assert "header processing" in events
+    assert events["read"]["args"]["rows"] == 2
+    assert events["read"]["args"]["cols"] == 2
+    assert events["read"]["args"]["file_size"] == path.stat().st_size
+    assert events["cache lookup"]["args"]["cache"] in ("preloaded", "snapshot")